@@ -0,0 +1,25 @@
+ifndef NEURAL_MODELLING_DIRS
+    $(error NEURAL_MODELLING_DIRS is not set.  Please define NEURAL_MODELLING_DIRS (possibly by running "source setup" in the neural_modelling folder within the sPyNNaker source folder))
+endif
+
+# ----------------------------------------------------------------------
+# Builds an expander of sPyNNaker with my_connection_generator.c in place of
+# connection_generator.c, so that it can also generate MyConnector.  The
+# binary goes in python_models8/model_binaries; MyConnector is only generated
+# on the machine when this is the expander the binary search finds, and is
+# otherwise generated on the host.
+#
+EXPANDER_MAKEFILE_PATH := $(abspath $(lastword $(MAKEFILE_LIST)))
+
+APP_OUTPUT_DIR := $(abspath $(dir $(EXPANDER_MAKEFILE_PATH))../../python_models8/model_binaries/)/
+BUILD_DIR := $(abspath $(dir $(EXPANDER_MAKEFILE_PATH))/../build/$(APP))/
+
+EXTRA_SRC_DIR := $(abspath $(dir $(EXPANDER_MAKEFILE_PATH))/../src/)
+EXPANDER_SRC_DIR := $(NEURAL_MODELLING_DIRS)/src/synapse_expander
+
+SOURCE_DIRS += $(EXPANDER_SRC_DIR) $(EXTRA_SRC_DIR)/synapse_expander
+SOURCES += my_connection_generator.c
+CFLAGS += -I$(EXPANDER_SRC_DIR) -I$(EXTRA_SRC_DIR) \
+    -I$(NEURAL_MODELLING_DIRS)/src
+
+include $(SPINN_DIRS)/make/local.mk
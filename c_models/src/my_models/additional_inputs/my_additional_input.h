@@ -3,10 +3,9 @@
 
 #include <neuron/additional_inputs/additional_input.h>
 
-typedef struct additional_input_t {
-    REAL my_parameter;
-    REAL input_current;
-} additional_input_t;
+// The struct is generated from the schema in
+// python_models8/neuron/additional_inputs/my_additional_input.py
+#include "my_additional_input_struct.h"
 
 //! \brief Gets the value of current provided by the additional input this
 //!     timestep
@@ -0,0 +1,16 @@
+// Generated from the schema python_models8.neuron.additional_inputs.my_additional_input:SCHEMA
+// by python_models8.utilities.struct_schema; update the schema and
+// regenerate this rather than editing it
+#ifndef _MY_ADDITIONAL_INPUT_STRUCT_H_
+#define _MY_ADDITIONAL_INPUT_STRUCT_H_
+
+#include <common/neuron-typedefs.h>
+
+typedef struct additional_input_t {
+    //! my_additional_input_parameter [nA]
+    REAL my_parameter;
+    //! input_current [nA]
+    REAL input_current;
+} additional_input_t;
+
+#endif // _MY_ADDITIONAL_INPUT_STRUCT_H_
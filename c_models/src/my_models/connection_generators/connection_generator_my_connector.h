@@ -0,0 +1,73 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Connection generator for MyConnector, in the form of the
+//!     generators of the sPyNNaker synapse expander
+#ifndef _CONNECTION_GENERATOR_MY_CONNECTOR_H_
+#define _CONNECTION_GENERATOR_MY_CONNECTOR_H_
+
+#include <common-typedefs.h>
+#include <spin1_api.h>
+#include <debug.h>
+#include "my_connector_band.h"
+
+//! \brief Initialise the generator from its parameters
+//! \param[in,out] region: The parameters; updated to point after them
+//! \return The data of the generator
+static void *connection_generator_my_connector_initialise(address_t *region) {
+    struct my_connector *params = spin1_malloc(sizeof(struct my_connector));
+    if (params == NULL) {
+        log_error("Could not allocate the parameters of MyConnector");
+        rt_error(RTE_SWERR);
+    }
+    address_t params_sdram = *region;
+    spin1_memcpy(params, params_sdram, sizeof(struct my_connector));
+    *region = &params_sdram[sizeof(struct my_connector) / sizeof(uint32_t)];
+
+    log_debug("MyConnector: n_neighbours = %u, exclude_self = %u",
+            params->n_neighbours, params->exclude_self);
+    return params;
+}
+
+//! \brief Free the data of the generator
+//! \param[in] generator: The data to free
+static void connection_generator_my_connector_free(void *generator) {
+    sark_free(generator);
+}
+
+//! \brief Generate the connections of one presynaptic neuron
+//! \param[in] generator: The data of the generator
+//! \param[in] pre_slice_start: Unused; the band only needs the neuron
+//! \param[in] pre_slice_count: Unused; the band only needs the neuron
+//! \param[in] pre_neuron_index: The presynaptic neuron
+//! \param[in] post_slice_start: The first neuron of the postsynaptic slice
+//! \param[in] post_slice_count: The number of neurons in the slice
+//! \param[in] max_row_length: The most connections that may be generated
+//! \param[out] indices: The targets, relative to the start of the slice
+//! \return The number of connections generated
+static uint32_t connection_generator_my_connector_generate(
+        void *generator, UNUSED uint32_t pre_slice_start,
+        UNUSED uint32_t pre_slice_count, uint32_t pre_neuron_index,
+        uint32_t post_slice_start, uint32_t post_slice_count,
+        uint32_t max_row_length, uint16_t *indices) {
+    return my_connector_band(
+            generator, pre_neuron_index, post_slice_start, post_slice_count,
+            max_row_length, indices);
+}
+
+#endif // _CONNECTION_GENERATOR_MY_CONNECTOR_H_
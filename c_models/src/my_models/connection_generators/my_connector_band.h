@@ -0,0 +1,73 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief The connection rule of MyConnector: presynaptic neuron i connects
+//!     to every postsynaptic neuron j with |i - j| <= n_neighbours
+//! \details This only uses the C library so that the expansion can also be
+//!     built on the host and checked against the host-side connector
+//!     (see my_connector_band_host.c)
+#ifndef _MY_CONNECTOR_BAND_H_
+#define _MY_CONNECTOR_BAND_H_
+
+#include <stdint.h>
+
+//! \brief The parameters of the connector, as written by
+//!     MyConnector.gen_connector_params
+struct my_connector {
+    //! The number of postsynaptic neurons on each side of the diagonal
+    uint32_t n_neighbours;
+    //! Whether the diagonal is left out
+    uint32_t exclude_self;
+};
+
+//! \brief Generate the connections of one presynaptic neuron to a slice
+//! \param[in] params: The connector parameters
+//! \param[in] pre_neuron_index: The presynaptic neuron
+//! \param[in] post_slice_start: The first neuron of the postsynaptic slice
+//! \param[in] post_slice_count: The number of neurons in the slice
+//! \param[in] max_row_length: The most connections that may be generated
+//! \param[out] indices: The targets, relative to the start of the slice
+//! \return The number of connections generated
+static inline uint32_t my_connector_band(
+        const struct my_connector *params, uint32_t pre_neuron_index,
+        uint32_t post_slice_start, uint32_t post_slice_count,
+        uint32_t max_row_length, uint16_t *indices) {
+    uint32_t k = params->n_neighbours;
+
+    // The band is [pre - k, pre + k] clipped to the slice; work in unsigned
+    // arithmetic without letting pre - k wrap below zero
+    uint32_t first = post_slice_start;
+    if (pre_neuron_index >= post_slice_start + k) {
+        first = pre_neuron_index - k;
+    }
+    uint32_t end = post_slice_start + post_slice_count;
+    if (pre_neuron_index + k + 1 < end) {
+        end = pre_neuron_index + k + 1;
+    }
+
+    uint32_t n_conns = 0;
+    for (uint32_t j = first; j < end && n_conns < max_row_length; j++) {
+        if (params->exclude_self && j == pre_neuron_index) {
+            continue;
+        }
+        indices[n_conns++] = j - post_slice_start;
+    }
+    return n_conns;
+}
+
+#endif // _MY_CONNECTOR_BAND_H_
@@ -0,0 +1,46 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief A host build of the MyConnector expansion, so that the code run by
+//!     the synapse expander can be checked against the host-side connector
+//! \details This is not part of any SpiNNaker build; it is compiled into a
+//!     shared library by python_models8.reference.my_connector_expander
+#include "my_connector_band.h"
+
+//! \brief Generate the connections of one presynaptic neuron to a slice
+//! \param[in] n_neighbours: The number of neighbours on each side
+//! \param[in] exclude_self: Whether the diagonal is left out
+//! \param[in] pre_neuron_index: The presynaptic neuron
+//! \param[in] post_slice_start: The first neuron of the postsynaptic slice
+//! \param[in] post_slice_count: The number of neurons in the slice
+//! \param[in] max_row_length: The most connections that may be generated
+//! \param[out] indices: The targets, relative to the start of the slice
+//! \return The number of connections generated
+uint32_t my_connector_band_host(
+        uint32_t n_neighbours, uint32_t exclude_self,
+        uint32_t pre_neuron_index, uint32_t post_slice_start,
+        uint32_t post_slice_count, uint32_t max_row_length,
+        uint16_t *indices) {
+    struct my_connector params = {
+        .n_neighbours = n_neighbours,
+        .exclude_self = exclude_self
+    };
+    return my_connector_band(
+            &params, pre_neuron_index, post_slice_start, post_slice_count,
+            max_row_length, indices);
+}
@@ -15,13 +15,11 @@
 #define N_BITFIELD_VARS 1
 
 #include <neuron/neuron_recording.h>
+#include "struct_runs.h"
 
-//! neuron_impl_t struct
-typedef struct neuron_impl_t {
-    accum inputs[2];
-    accum v;
-    accum threshold;
-} neuron_impl_t;
+// neuron_impl_t struct, generated from the schema in
+// python_models8/neuron/implementations/my_full_neuron_impl.py
+#include "my_full_neuron_impl_struct.h"
 
 //! Array of neuron states
 static neuron_impl_t *neuron_array;
@@ -43,17 +41,18 @@ static bool neuron_impl_initialise(uint32_t n_neurons) {
 __attribute__((unused)) // Marked unused as only used sometimes
 static void neuron_impl_load_neuron_parameters(
         address_t address, uint32_t next, uint32_t n_neurons) {
-    // Copy parameters to DTCM from SDRAM
-    spin1_memcpy(neuron_array, &address[next],
-            n_neurons * sizeof(neuron_impl_t));
+    // Copy parameters to DTCM from SDRAM, expanding any runs of neurons
+    // with the same values
+    struct_runs_load(neuron_array, &address[next], sizeof(neuron_impl_t),
+            n_neurons);
 }
 
 __attribute__((unused)) // Marked unused as only used sometimes
 static void neuron_impl_store_neuron_parameters(
         address_t address, uint32_t next, uint32_t n_neurons) {
     // Copy parameters to SDRAM from DTCM
-    spin1_memcpy(&address[next], neuron_array,
-            n_neurons * sizeof(neuron_impl_t));
+    struct_runs_store(&address[next], neuron_array, sizeof(neuron_impl_t),
+            n_neurons);
 }
 
 __attribute__((unused)) // Marked unused as only used sometimes
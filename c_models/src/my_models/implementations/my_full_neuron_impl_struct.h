@@ -0,0 +1,18 @@
+// Generated from the schema python_models8.neuron.implementations.my_full_neuron_impl:SCHEMA
+// by python_models8.utilities.struct_schema; update the schema and
+// regenerate this rather than editing it
+#ifndef _MY_FULL_NEURON_IMPL_STRUCT_H_
+#define _MY_FULL_NEURON_IMPL_STRUCT_H_
+
+#include <common/neuron-typedefs.h>
+
+typedef struct neuron_impl_t {
+    //! exc_input [nA], inh_input [nA]
+    REAL inputs[2];
+    //! v [mV]
+    REAL v;
+    //! threshold [mV]
+    REAL threshold;
+} neuron_impl_t;
+
+#endif // _MY_FULL_NEURON_IMPL_STRUCT_H_
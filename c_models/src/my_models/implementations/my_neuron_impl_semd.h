@@ -11,6 +11,8 @@
 #include <neuron/current_sources/current_source_impl.h>
 
 // Further includes
+#include <bit_field.h>
+#include <spin1_api.h>
 #include <debug.h>
 
 #define V_RECORDING_INDEX 0
@@ -33,6 +35,27 @@ typedef struct input_type_current_semd_t {
 
 #define SCALING_FACTOR 40.0k
 
+//! The inhibitory input above which it is taken to have started
+#define INPUT_ONSET 0.01k
+
+//! How close to its resting voltage an idle neuron must be [mV]
+#define IDLE_V_TOLERANCE 0.001k
+
+//! The idle_since value of a neuron that is being updated
+#define NOT_IDLE UINT32_MAX
+
+//! How the recorded voltage and inputs summarise each recording interval
+enum semd_recording_aggregation {
+    //! The value at the end of the interval
+    AGGREGATE_SAMPLE,
+    //! The mean over the interval
+    AGGREGATE_MEAN,
+    //! The minimum over the interval
+    AGGREGATE_MIN,
+    //! The maximum over the interval
+    AGGREGATE_MAX
+};
+
 static input_type_current_semd_t *input_type_array;
 
 //! Array of neuron states
@@ -47,6 +70,35 @@ static synapse_param_t *neuron_synapse_shaping_params;
 // The number of steps per timestep to run over
 static uint32_t n_steps_per_timestep;
 
+//! Whether idle neurons are skipped until they receive input
+static uint32_t active_set;
+
+//! The neurons that are updated; the others are idle
+static bit_field_t active_neurons;
+
+//! The timestep after which each idle neuron stopped being updated, or
+//! NOT_IDLE
+static uint32_t *idle_since;
+
+//! The last timestep that was run, to bring idle neurons forward to
+static uint32_t last_time;
+
+//! The number of timesteps between recordings of the voltage and inputs
+static uint32_t recording_interval;
+
+//! How the voltage and inputs are summarised over an interval
+static uint32_t recording_aggregation;
+
+//! Whether the voltage and inputs are recorded in this timestep
+static bool recording_now;
+
+//! The number of timesteps aggregated since the last recording
+static uint32_t recording_window;
+
+//! The running aggregate of each recorded variable of each neuron, as the
+//! bits of an accum, summed for the mean
+static int64_t *recording_aggregates;
+
 __attribute__((unused)) // Marked unused as only used sometimes
 static bool neuron_impl_initialise(uint32_t n_neurons) {
     // Allocate DTCM for neuron array
@@ -80,9 +132,26 @@ static bool neuron_impl_initialise(uint32_t n_neurons) {
         return false;
     }
 
+    // Allocate DTCM for the active set
+    active_neurons = bit_field_alloc(n_neurons);
+    idle_since = spin1_malloc(n_neurons * sizeof(uint32_t));
+    if (active_neurons == NULL || idle_since == NULL) {
+        log_error("Unable to allocate active set - Out of DTCM");
+        return false;
+    }
+
     return true;
 }
 
+//! \brief Mark every neuron as being updated, as after its state changes
+//! \param[in] n_neurons: The number of neurons
+static inline void semd_wake_all(uint32_t n_neurons) {
+    set_bit_field(active_neurons, get_bit_field_size(n_neurons));
+    for (uint32_t i = 0; i < n_neurons; i++) {
+        idle_since[i] = NOT_IDLE;
+    }
+}
+
 __attribute__((unused)) // Marked unused as only used sometimes
 static void neuron_impl_add_inputs(
         index_t synapse_type_index, index_t neuron_index,
@@ -91,6 +160,13 @@ static void neuron_impl_add_inputs(
     synapse_param_t *parameters = &neuron_synapse_shaping_params[neuron_index];
     synapse_types_add_neuron_input(synapse_type_index,
             parameters, weights_this_timestep);
+
+    // This is called for every neuron and receptor each timestep, so only
+    // input that arrived wakes the neuron; it is brought forward when it is
+    // next updated
+    if (weights_this_timestep != ZERO) {
+        bit_field_set(active_neurons, neuron_index);
+    }
 }
 
 __attribute__((unused)) // Marked unused as only used sometimes
@@ -118,16 +194,294 @@ static void neuron_impl_load_neuron_parameters(
     log_debug("writing synapse parameters");
     spin1_memcpy(neuron_synapse_shaping_params, &address[next],
             n_neurons * sizeof(synapse_param_t));
+    next += (n_neurons * sizeof(synapse_param_t)) / 4;
+
+    active_set = address[next++];
+    semd_wake_all(n_neurons);
+
+    recording_interval = address[next++];
+    if (recording_interval == 0) {
+        // The timestep is divided by the interval, so record every timestep
+        log_warning("Recording interval of 0 timesteps; recording each one");
+        recording_interval = 1;
+    }
+    recording_aggregation = address[next];
+    recording_window = 0;
+    recording_now = false;
+    if (recording_aggregation != AGGREGATE_SAMPLE) {
+        if (recording_aggregates == NULL) {
+            recording_aggregates = spin1_malloc(
+                    n_neurons * N_RECORDED_VARS * sizeof(int64_t));
+        }
+        if (recording_aggregates == NULL) {
+            // Recording samples instead would quietly give other data than
+            // was asked for
+            log_error("Unable to allocate recording aggregates"
+                    " - Out of DTCM");
+            rt_error(RTE_SWERR);
+        }
+    }
+}
+
+//! \brief Record one variable of one neuron, folding it into the aggregate
+//!     over the recording interval when one is asked for
+//! \param[in] var_index: The recorded variable
+//! \param[in] neuron_index: The neuron
+//! \param[in] value: The value in this timestep
+static inline void semd_record_accum(
+        uint32_t var_index, uint32_t neuron_index, REAL value) {
+    if (recording_aggregation == AGGREGATE_SAMPLE) {
+        if (recording_now) {
+            neuron_recording_record_accum(var_index, neuron_index, value);
+        }
+        return;
+    }
+
+    int64_t *aggregate =
+            &recording_aggregates[neuron_index * N_RECORDED_VARS + var_index];
+    int64_t bits = bitsk(value);
+    if (recording_window == 1) {
+        // First timestep of the interval
+        *aggregate = bits;
+    } else if (recording_aggregation == AGGREGATE_MEAN) {
+        *aggregate += bits;
+    } else if ((recording_aggregation == AGGREGATE_MIN) ?
+            (bits < *aggregate) : (bits > *aggregate)) {
+        *aggregate = bits;
+    }
+
+    if (recording_now) {
+        int64_t result = *aggregate;
+        if (recording_aggregation == AGGREGATE_MEAN) {
+            result /= (int64_t) recording_window;
+        }
+        neuron_recording_record_accum(
+                var_index, neuron_index, kbits((int32_t) result));
+    }
+}
+
+//! \brief Record the voltage and summed inputs of one neuron
+//! \param[in] neuron_index: The neuron
+//! \param[in] voltage: The membrane voltage
+//! \param[in] total_exc: The excitatory input
+//! \param[in] total_inh: The inhibitory input
+static inline void semd_record(
+        uint32_t neuron_index, REAL voltage, REAL total_exc, REAL total_inh) {
+    semd_record_accum(V_RECORDING_INDEX, neuron_index, voltage);
+    semd_record_accum(GSYN_EXC_RECORDING_INDEX, neuron_index, total_exc);
+    semd_record_accum(GSYN_INH_RECORDING_INDEX, neuron_index, total_inh);
+}
+
+//! \brief Scale the inhibitory input of a receptor by its multiplicator,
+//!     turning it into excitatory current
+//! \param[in] multiplicator: The latched excitatory input
+//! \return The factor to apply to the inhibitory input
+static inline REAL semd_scale(REAL multiplicator) {
+    return -SCALING_FACTOR * multiplicator;
+}
+
+/*!
+ * \brief Do one step of the update of one sEMD neuron
+ * \param[in] timer_count: The number of times the timer has fired
+ * \param[in] time: The current simulation time
+ * \param[in] neuron_index: The index of the neuron
+ * \param[in] current_offset: The injected current for this timestep
+ * \param[in] record: Whether to record the voltage and inputs; the caller
+ *      passes a constant, so each path is specialised when inlined
+ * \param[in,out] neuron: The neuron state
+ * \param[in,out] input_type: The multiplicator state
+ * \param[in] threshold_type: The threshold
+ * \param[in,out] synapse_type: The synapse state
+ * \param[in,out] scaled: The scale of each inhibitory receptor, updated
+ *      when its multiplicator changes
+ * \return Whether the neuron spiked
+ */
+static inline bool semd_step(
+        uint32_t timer_count, uint32_t time, uint32_t neuron_index,
+        REAL current_offset, bool record, neuron_pointer_t neuron,
+        input_type_current_semd_t *input_type,
+        threshold_type_pointer_t threshold_type,
+        synapse_param_pointer_t synapse_type, REAL *scaled) {
+    // Get the voltage
+    state_t voltage = neuron_model_get_membrane_voltage(neuron);
+
+    // Get the exc and inh values from the synapses
+    input_t exc_values[NUM_EXCITATORY_RECEPTORS];
+    input_t* exc_input_values =
+            synapse_types_get_excitatory_input(exc_values, synapse_type);
+    input_t inh_values[NUM_INHIBITORY_RECEPTORS];
+    input_t* inh_input_values =
+            synapse_types_get_inhibitory_input(inh_values, synapse_type);
+
+    // Latch the multiplicator on the onset of the inhibitory input and
+    // release it when the input has gone
+    for (int i = 0; i < NUM_INHIBITORY_RECEPTORS; i++) {
+        REAL inh = inh_input_values[i];
+        if (inh >= INPUT_ONSET) {
+            if ((input_type->my_multiplicator[i] == ZERO) &&
+                    (input_type->my_inh_input_previous[i] == ZERO)) {
+                input_type->my_multiplicator[i] = exc_input_values[i];
+                scaled[i] = semd_scale(exc_input_values[i]);
+            }
+        } else if (input_type->my_multiplicator[i] != ZERO) {
+            input_type->my_multiplicator[i] = ZERO;
+            scaled[i] = ZERO;
+        }
+        input_type->my_inh_input_previous[i] = inh;
+    }
+
+    // Do recording if on first step
+    if (record) {
+        // Sum g_syn contributions from all receptors for recording
+        REAL total_exc = 0;
+        REAL total_inh = 0;
+
+        for (int i = 0; i < NUM_EXCITATORY_RECEPTORS; i++) {
+            total_exc += exc_input_values[i];
+        }
+        for (int i = 0; i < NUM_INHIBITORY_RECEPTORS; i++) {
+            total_inh += inh_input_values[i];
+        }
+
+        semd_record(neuron_index, voltage, total_exc, total_inh);
+    }
+
+    // This changes inhibitory to excitatory input
+    for (int i = 0; i < NUM_INHIBITORY_RECEPTORS; i++) {
+        inh_input_values[i] = inh_input_values[i] * scaled[i];
+    }
+
+    // update neuron parameters
+    state_t result = neuron_model_state_update(
+            NUM_EXCITATORY_RECEPTORS, exc_input_values,
+            NUM_INHIBITORY_RECEPTORS, inh_input_values, 0, current_offset, neuron);
+
+    // determine if a spike should occur
+    bool spike = threshold_type_is_above_threshold(result, threshold_type);
+
+    // If spike occurs, communicate to relevant parts of model
+    if (spike) {
+        // Call relevant model-based functions
+        // Tell the neuron model
+        neuron_model_has_spiked(neuron);
+        send_spike(timer_count, time, neuron_index);
+    }
+
+    // Shape the existing input according to the included rule
+    synapse_types_shape_input(synapse_type);
+    return spike;
+}
+
+//! \brief Raise the membrane decay factor to a power
+//! \param[in] exp_tc: The decay over one step
+//! \param[in] n_steps: The number of steps
+//! \return The decay over all the steps
+static inline REAL semd_decay_pow(REAL exp_tc, uint32_t n_steps) {
+    REAL result = ONE;
+    while (n_steps > 0 && result != ZERO) {
+        if (n_steps & 1) {
+            result *= exp_tc;
+        }
+        exp_tc *= exp_tc;
+        n_steps >>= 1;
+    }
+    return result;
+}
+
+//! \brief The voltage that a neuron with no input tends to
+//! \param[in] neuron: The neuron
+//! \return The equilibrium voltage
+static inline REAL semd_equilibrium(neuron_pointer_t neuron) {
+    return neuron->I_offset * neuron->R_membrane + neuron->V_rest;
+}
+
+//! \brief Bring an idle neuron forward over the steps it was not updated
+//! \details With no input, the closed-form LIF update over n steps is a
+//!     single decay towards the equilibrium voltage by exp_TC^n; the
+//!     synaptic input and multiplicator stay at zero.
+//! \param[in] neuron_index: The index of the neuron
+//! \param[in] n_steps: The number of steps to bring it forward by
+static inline void semd_catch_up(uint32_t neuron_index, uint32_t n_steps) {
+    neuron_pointer_t neuron = &neuron_array[neuron_index];
+    REAL alpha = semd_equilibrium(neuron);
+    neuron->V_membrane = alpha - semd_decay_pow(neuron->exp_TC, n_steps)
+            * (alpha - neuron->V_membrane);
+}
+
+//! \brief Whether an update would leave a neuron all but unchanged
+//! \param[in] neuron_index: The index of the neuron
+//! \param[in] current_offset: The injected current for this timestep
+//! \return True if the neuron has no input, no latched multiplicator, is
+//!     not refractory and is within IDLE_V_TOLERANCE of its equilibrium
+static inline bool semd_is_idle(uint32_t neuron_index, REAL current_offset) {
+    neuron_pointer_t neuron = &neuron_array[neuron_index];
+    if (current_offset != ZERO || neuron->refract_timer > 0) {
+        return false;
+    }
+    REAL distance = neuron->V_membrane - semd_equilibrium(neuron);
+    if (distance > IDLE_V_TOLERANCE || distance < -IDLE_V_TOLERANCE) {
+        return false;
+    }
+
+    input_type_current_semd_t *input_type = &input_type_array[neuron_index];
+    synapse_param_pointer_t synapse_type =
+            &neuron_synapse_shaping_params[neuron_index];
+    input_t exc_values[NUM_EXCITATORY_RECEPTORS];
+    input_t* exc_input_values =
+            synapse_types_get_excitatory_input(exc_values, synapse_type);
+    input_t inh_values[NUM_INHIBITORY_RECEPTORS];
+    input_t* inh_input_values =
+            synapse_types_get_inhibitory_input(inh_values, synapse_type);
+    for (int i = 0; i < NUM_EXCITATORY_RECEPTORS; i++) {
+        if (exc_input_values[i] != ZERO) {
+            return false;
+        }
+    }
+    for (int i = 0; i < NUM_INHIBITORY_RECEPTORS; i++) {
+        if (inh_input_values[i] != ZERO ||
+                input_type->my_multiplicator[i] != ZERO ||
+                input_type->my_inh_input_previous[i] != ZERO) {
+            return false;
+        }
+    }
+    return true;
 }
 
 __attribute__((unused)) // Marked unused as only used sometimes
 static void neuron_impl_do_timestep_update(
         uint32_t timer_count, uint32_t time, uint32_t n_neurons) {
 
+    last_time = time;
+
+    // The recorder samples the timesteps that are multiples of the interval,
+    // so each recording covers the interval that ends with it
+    if (recording_now) {
+        recording_window = 0;
+    }
+    recording_window++;
+    recording_now = (time % recording_interval) == 0;
+
     for (uint32_t neuron_index = 0; neuron_index < n_neurons; neuron_index++) {
         // Get the neuron itself
         neuron_pointer_t neuron = &neuron_array[neuron_index];
 
+        // The injected current only changes between timesteps
+        REAL current_offset = current_source_get_offset(time, neuron_index);
+
+        // An idle neuron stays as it is until it gets input
+        if (!bit_field_test(active_neurons, neuron_index)) {
+            if (current_offset == ZERO) {
+                semd_record(neuron_index, neuron->V_membrane, ZERO, ZERO);
+                continue;
+            }
+            bit_field_set(active_neurons, neuron_index);
+        }
+        if (idle_since[neuron_index] != NOT_IDLE) {
+            semd_catch_up(neuron_index, (time - idle_since[neuron_index] - 1)
+                    * n_steps_per_timestep);
+            idle_since[neuron_index] = NOT_IDLE;
+        }
+
         // Get the input_type parameters and voltage for this neuron
         input_type_current_semd_t *input_type = &input_type_array[neuron_index];
 
@@ -137,82 +491,30 @@ static void neuron_impl_do_timestep_update(
         synapse_param_pointer_t synapse_type =
                 &neuron_synapse_shaping_params[neuron_index];
 
-        bool spike = false;
-        for (uint32_t i = n_steps_per_timestep; i > 0; i--) {
-
-            // Get the voltage
-            state_t voltage = neuron_model_get_membrane_voltage(neuron);
-
-            // Get the exc and inh values from the synapses
-            input_t exc_values[NUM_EXCITATORY_RECEPTORS];
-            input_t* exc_input_values =
-                    synapse_types_get_excitatory_input(exc_values, synapse_type);
-            input_t inh_values[NUM_INHIBITORY_RECEPTORS];
-            input_t* inh_input_values =
-                    synapse_types_get_inhibitory_input(inh_values, synapse_type);
-
-            // Set the inhibitory my_multiplicator value
-            for (int i = 0; i < NUM_INHIBITORY_RECEPTORS; i++) {
-                if ((inh_input_values[i] >= 0.01) &&
-                        (input_type->my_multiplicator[i] == 0) &&
-                        (input_type->my_inh_input_previous[i] == 0)) {
-                    input_type->my_multiplicator[i] = exc_input_values[i];
-                } else if (inh_input_values[i] < 0.01) {
-                    input_type->my_multiplicator[i] = 0;
-                }
-                input_type->my_inh_input_previous[i] = inh_input_values[i];
-            }
-
-            // Sum g_syn contributions from all receptors for recording
-            REAL total_exc = 0;
-            REAL total_inh = 0;
-
-            for (int i = 0; i < NUM_EXCITATORY_RECEPTORS; i++) {
-                total_exc += exc_input_values[i];
-            }
-            for (int i = 0; i < NUM_INHIBITORY_RECEPTORS; i++) {
-                total_inh += inh_input_values[i];
-            }
-
-            // Do recording if on first step
-            if (i == n_steps_per_timestep) {
-                neuron_recording_record_accum(V_RECORDING_INDEX, neuron_index, voltage);
-                neuron_recording_record_accum(GSYN_EXC_RECORDING_INDEX, neuron_index, total_exc);
-                neuron_recording_record_accum(GSYN_INH_RECORDING_INDEX, neuron_index, total_inh);
-            }
-
-            // This changes inhibitory to excitatory input
-            for (int i = 0; i < NUM_INHIBITORY_RECEPTORS; i++) {
-                inh_input_values[i] = -inh_input_values[i] * SCALING_FACTOR
-                        * input_type->my_multiplicator[i];
-            }
-
-            // Get any input from an injected current source
-            REAL current_offset = current_source_get_offset(time, neuron_index);
-
-            // update neuron parameters
-            state_t result = neuron_model_state_update(
-                    NUM_EXCITATORY_RECEPTORS, exc_input_values,
-                    NUM_INHIBITORY_RECEPTORS, inh_input_values, 0, current_offset, neuron);
-
-            // determine if a spike should occur
-            bool spike_now = threshold_type_is_above_threshold(result, threshold_type);
+        // The scale of the inhibitory input only changes on a latch, so
+        // work it out once
+        REAL scaled[NUM_INHIBITORY_RECEPTORS];
+        for (int i = 0; i < NUM_INHIBITORY_RECEPTORS; i++) {
+            scaled[i] = semd_scale(input_type->my_multiplicator[i]);
+        }
 
-            // If spike occurs, communicate to relevant parts of model
-            if (spike_now) {
-                // Call relevant model-based functions
-                // Tell the neuron model
-                spike = true;
-                neuron_model_has_spiked(neuron);
-                send_spike(timer_count, time, neuron_index);
+        bool spike = semd_step(
+                timer_count, time, neuron_index, current_offset, true,
+                neuron, input_type, threshold_type, synapse_type, scaled);
+        if (n_steps_per_timestep > 1) {
+            for (uint32_t i = n_steps_per_timestep - 1; i > 0; i--) {
+                spike |= semd_step(
+                        timer_count, time, neuron_index, current_offset,
+                        false, neuron, input_type, threshold_type,
+                        synapse_type, scaled);
             }
-
-            // Shape the existing input according to the included rule
-            synapse_types_shape_input(synapse_type);
         }
 
         if (spike) {
             neuron_recording_record_bit(SPIKE_RECORDING_BITFIELD, neuron_index);
+        } else if (active_set && semd_is_idle(neuron_index, current_offset)) {
+            bit_field_clear(active_neurons, neuron_index);
+            idle_since[neuron_index] = time;
         }
     }
 }
@@ -225,6 +527,14 @@ static void neuron_impl_store_neuron_parameters(
     log_debug("writing parameters");
     next += 1;
 
+    // Bring idle neurons up to date; they carry on from here if resumed
+    for (uint32_t i = 0; i < n_neurons; i++) {
+        if (idle_since[i] != NOT_IDLE) {
+            semd_catch_up(i, (last_time - idle_since[i]) * n_steps_per_timestep);
+            idle_since[i] = last_time;
+        }
+    }
+
     log_debug("writing neuron local parameters");
     spin1_memcpy(&address[next], neuron_array,
             n_neurons * sizeof(neuron_t));
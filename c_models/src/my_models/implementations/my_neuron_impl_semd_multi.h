@@ -0,0 +1,282 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief sEMD neurons for several directions at each site of a motion
+//!     field, sharing one parameter block and one pass of the update per
+//!     site
+//!
+//! Neuron i is the detector of direction (i % SEMD_N_DIRECTIONS) at site
+//! (i / SEMD_N_DIRECTIONS), so each direction still has its own key and
+//! its own recorded voltage and inputs.
+#ifndef _NEURON_IMPL_SEMD_MULTI_H_
+#define _NEURON_IMPL_SEMD_MULTI_H_
+
+#include <neuron/implementations/neuron_impl.h>
+#include <neuron/current_sources/current_source_impl.h>
+#include <neuron/decay.h>
+#include <spin1_api.h>
+#include <debug.h>
+
+#define V_RECORDING_INDEX 0
+#define GSYN_EXC_RECORDING_INDEX 1
+#define GSYN_INH_RECORDING_INDEX 2
+#define N_RECORDED_VARS 3
+
+#define SPIKE_RECORDING_BITFIELD 0
+#define N_BITFIELD_VARS 1
+
+#include <neuron/neuron_recording.h>
+
+//! The number of directions detected at each site
+#ifndef SEMD_N_DIRECTIONS
+#define SEMD_N_DIRECTIONS 4
+#endif
+
+//! Indices of the receptors of each direction
+enum semd_multi_receptors {
+    FACILITATION, TRIGGER
+};
+
+#define SCALING_FACTOR 40.0k
+
+//! The inhibitory input above which it is taken to have started
+#define INPUT_ONSET 0.01k
+
+//! The state of the detector of one direction
+typedef struct semd_direction_t {
+    //! membrane voltage [mV]
+    REAL V_membrane;
+
+    //! countdown to end of next refractory period [timesteps]
+    int32_t refract_timer;
+
+    //! facilitating (excitatory) synaptic input [nA]
+    REAL isyn_exc;
+
+    //! triggering (inhibitory) synaptic input [nA]
+    REAL isyn_inh;
+
+    //! facilitating input latched at the onset of the trigger
+    REAL my_multiplicator;
+
+    //! triggering input at the previous update
+    REAL my_inh_input_previous;
+} semd_direction_t;
+
+//! The parameters shared by the detectors of a site, followed by their
+//! states; every field is a word so the host packs it without padding
+typedef struct semd_site_t {
+    //! membrane voltage at rest [mV]
+    REAL V_rest;
+
+    //! membrane resistance [MOhm]
+    REAL R_membrane;
+
+    //! 'fixed' computation parameter - time constant multiplier for
+    //! closed-form solution: exp(-(machine time step in ms)/(R * C)) [.]
+    REAL exp_TC;
+
+    //! offset current [nA]
+    REAL I_offset;
+
+    //! post-spike reset membrane voltage [mV]
+    REAL V_reset;
+
+    //! refractory time of neuron [timesteps]
+    int32_t T_refract;
+
+    //! spike threshold [mV]
+    REAL V_thresh;
+
+    //! decay and initial scale of the facilitating input
+    decay_t exc_decay;
+    decay_t exc_init;
+
+    //! decay and initial scale of the triggering input
+    decay_t inh_decay;
+    decay_t inh_init;
+
+    //! the detector of each direction
+    semd_direction_t directions[SEMD_N_DIRECTIONS];
+} semd_site_t;
+
+//! Array of sites
+static semd_site_t *site_array;
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static bool neuron_impl_initialise(uint32_t n_neurons) {
+    // Allocate DTCM for site array
+    uint32_t n_sites = n_neurons / SEMD_N_DIRECTIONS;
+    site_array = spin1_malloc(n_sites * sizeof(semd_site_t));
+    if (site_array == NULL) {
+        log_error("Unable to allocate site array - Out of DTCM");
+        return false;
+    }
+
+    return true;
+}
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static void neuron_impl_load_neuron_parameters(
+        address_t address, uint32_t next, uint32_t n_neurons) {
+    // Copy parameters to DTCM from SDRAM
+    spin1_memcpy(site_array, &address[next],
+            (n_neurons / SEMD_N_DIRECTIONS) * sizeof(semd_site_t));
+}
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static void neuron_impl_store_neuron_parameters(
+        address_t address, uint32_t next, uint32_t n_neurons) {
+    // Copy parameters to SDRAM from DTCM
+    spin1_memcpy(&address[next], site_array,
+            (n_neurons / SEMD_N_DIRECTIONS) * sizeof(semd_site_t));
+}
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static void neuron_impl_add_inputs(
+        index_t synapse_type_index, index_t neuron_index,
+        input_t weights_this_timestep) {
+    semd_site_t *site = &site_array[neuron_index / SEMD_N_DIRECTIONS];
+    semd_direction_t *direction =
+            &site->directions[neuron_index % SEMD_N_DIRECTIONS];
+    if (synapse_type_index == FACILITATION) {
+        direction->isyn_exc += decay_s1615(
+                weights_this_timestep, site->exc_init);
+    } else {
+        direction->isyn_inh += decay_s1615(
+                weights_this_timestep, site->inh_init);
+    }
+}
+
+/*!
+ * \brief Update the detector of one direction
+ * \param[in] site: The site of the detector
+ * \param[in,out] direction: The detector
+ * \param[in] current_offset: The injected current for this timestep
+ * \return Whether the detector spiked
+ */
+static inline bool semd_multi_update(
+        const semd_site_t *site, semd_direction_t *direction,
+        REAL current_offset) {
+    REAL exc = direction->isyn_exc;
+    REAL inh = direction->isyn_inh;
+
+    // Latch the multiplicator on the onset of the triggering input and
+    // release it when the input has gone
+    if (inh >= INPUT_ONSET) {
+        if ((direction->my_multiplicator == ZERO) &&
+                (direction->my_inh_input_previous == ZERO)) {
+            direction->my_multiplicator = exc;
+        }
+    } else {
+        direction->my_multiplicator = ZERO;
+    }
+    direction->my_inh_input_previous = inh;
+
+    // Shape the existing input ready for the next update
+    direction->isyn_exc = decay_s1615(exc, site->exc_decay);
+    direction->isyn_inh = decay_s1615(inh, site->inh_decay);
+
+    if (direction->refract_timer > 0) {
+        // countdown refractory timer
+        direction->refract_timer--;
+        return false;
+    }
+
+    // The triggering input becomes excitatory current, and the membrane
+    // follows the closed-form LIF solution
+    REAL input_this_timestep = exc +
+            SCALING_FACTOR * direction->my_multiplicator * inh +
+            site->I_offset + current_offset;
+    REAL alpha = input_this_timestep * site->R_membrane + site->V_rest;
+    direction->V_membrane =
+            alpha - (site->exp_TC * (alpha - direction->V_membrane));
+
+    if (direction->V_membrane >= site->V_thresh) {
+        direction->V_membrane = site->V_reset;
+        direction->refract_timer = site->T_refract;
+        return true;
+    }
+    return false;
+}
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static void neuron_impl_do_timestep_update(
+        uint32_t timer_count, uint32_t time, uint32_t n_neurons) {
+    uint32_t n_sites = n_neurons / SEMD_N_DIRECTIONS;
+    index_t neuron_index = 0;
+    for (uint32_t site_index = 0; site_index < n_sites; site_index++) {
+        semd_site_t *site = &site_array[site_index];
+
+        for (uint32_t d = 0; d < SEMD_N_DIRECTIONS; d++, neuron_index++) {
+            semd_direction_t *direction = &site->directions[d];
+
+            neuron_recording_record_accum(
+                    V_RECORDING_INDEX, neuron_index, direction->V_membrane);
+            neuron_recording_record_accum(
+                    GSYN_EXC_RECORDING_INDEX, neuron_index,
+                    direction->isyn_exc);
+            neuron_recording_record_accum(
+                    GSYN_INH_RECORDING_INDEX, neuron_index,
+                    direction->isyn_inh);
+
+            REAL current_offset =
+                    current_source_get_offset(time, neuron_index);
+            if (semd_multi_update(site, direction, current_offset)) {
+                neuron_recording_record_bit(
+                        SPIKE_RECORDING_BITFIELD, neuron_index);
+                send_spike(timer_count, time, neuron_index);
+            }
+        }
+    }
+}
+
+#if LOG_LEVEL >= LOG_DEBUG
+void neuron_impl_print_inputs(uint32_t n_neurons) {
+    log_debug("-------------------------------------\n");
+    for (index_t i = 0; i < n_neurons; i++) {
+        semd_direction_t *direction = &site_array[i / SEMD_N_DIRECTIONS]
+                .directions[i % SEMD_N_DIRECTIONS];
+        log_debug("inputs: %k %k", direction->isyn_exc, direction->isyn_inh);
+    }
+    log_debug("-------------------------------------\n");
+}
+
+void neuron_impl_print_synapse_parameters(uint32_t n_neurons) {
+    log_debug("-------------------------------------\n");
+    for (index_t s = 0; s < n_neurons / SEMD_N_DIRECTIONS; s++) {
+        log_debug("exc_decay = %R, exc_init = %R, inh_decay = %R, "
+                "inh_init = %R", (unsigned fract) site_array[s].exc_decay,
+                (unsigned fract) site_array[s].exc_init,
+                (unsigned fract) site_array[s].inh_decay,
+                (unsigned fract) site_array[s].inh_init);
+    }
+    log_debug("-------------------------------------\n");
+}
+
+const char *neuron_impl_get_synapse_type_char(uint32_t synapse_type) {
+    if (synapse_type == FACILITATION) {
+        return "X";
+    } else if (synapse_type == TRIGGER) {
+        return "I";
+    }
+    return "?";
+}
+#endif // LOG_LEVEL >= LOG_DEBUG
+
+#endif // _NEURON_IMPL_SEMD_MULTI_H_
@@ -0,0 +1,325 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief QIF neuron with delta synapses and a static threshold, fused into
+//!     a single pass over a compact neuron array
+#ifndef _QIF_CURR_DELTA_FUSED_IMPL_H_
+#define _QIF_CURR_DELTA_FUSED_IMPL_H_
+
+#include <neuron/implementations/neuron_impl.h>
+#include <neuron/current_sources/current_source_impl.h>
+#include <spin1_api.h>
+#include <debug.h>
+
+#define V_RECORDING_INDEX 0
+#define GSYN_EXC_RECORDING_INDEX 1
+#define GSYN_INH_RECORDING_INDEX 2
+#define SPIKE_FRACTION_RECORDING_INDEX 3
+#define N_RECORDED_VARS 4
+
+#define SPIKE_RECORDING_BITFIELD 0
+#define N_BITFIELD_VARS 1
+
+#include <neuron/neuron_recording.h>
+#include "spike_fraction.h"
+#include "struct_runs.h"
+
+//! Indices of the receptors in the inputs array
+enum qif_curr_delta_receptors {
+    EXCITATORY, INHIBITORY, N_RECEPTORS
+};
+
+/*! \brief For linear membrane voltages, 1.5 is the correct value. However
+ * with actual membrane voltage behaviour and tested over an wide range of
+ * use cases 1.85 gives slightly better spike timings.
+ */
+static const REAL SIMPLE_TQ_OFFSET = REAL_CONST(1.85);
+
+//! \brief The parameters of a neuron, shared by all the neurons on the core
+//!     that have the same values; fields are ordered so that the host packs
+//!     it without padding
+typedef struct qif_params_t {
+    //! post-spike reset voltage [mV]
+    REAL C;
+
+    //! offset current [nA]
+    REAL I_offset;
+
+    //! spike threshold, also where the remaining substeps are skipped [mV]
+    REAL V_thresh;
+
+    //! length of one substep [ms]
+    REAL substep_h;
+
+    //! refractory time of neuron [timesteps]
+    int16_t T_refract;
+
+    //! number of RK2 substeps integrated per timestep
+    uint8_t n_substeps;
+
+    //! whether a quiescent neuron skips its update
+    uint8_t active_set;
+} qif_params_t;
+
+//! neuron_impl_t struct; the state of each neuron
+typedef struct neuron_impl_t {
+    //! delta synapse input arriving for the next update [nA]
+    REAL inputs[N_RECEPTORS];
+
+    //! membrane voltage [mV]
+    REAL V;
+
+    //! current substep - simple correction for threshold
+    REAL this_h;
+
+    //! countdown to end of next refractory period [timesteps]
+    int16_t refract_timer;
+
+    //! index of the parameters of the neuron in param_sets, unless each
+    //! neuron has its own
+    uint8_t params;
+
+    //! whether the last update left the neuron unchanged with no input
+    uint8_t quiescent;
+} neuron_impl_t;
+
+//! Array of neuron states
+static neuron_impl_t *neuron_array;
+
+//! The distinct sets of parameters of the neurons, or those of each neuron
+static qif_params_t *param_sets;
+
+//! The number of sets param_sets has room for
+static uint32_t n_param_sets_allocated = 0;
+
+//! \brief Whether each neuron has its own parameters in param_sets, in
+//!     neuron order, as the host does not share sets that would save no space
+static bool params_per_neuron = false;
+
+//! \brief The number of sets in the parameter table in SDRAM, which starts
+//!     with a count of the sets, or 0 if there is one per neuron
+//! \param[in] table: The table
+//! \param[in] n_neurons: The number of neurons on the core
+//! \return The number of sets that follow the count
+static inline uint32_t param_table_sets(
+        const uint32_t *table, uint32_t n_neurons) {
+    if (table[0] == 0) {
+        return n_neurons;
+    }
+    return table[0];
+}
+
+//! \brief The number of words of the parameter table in SDRAM, which is a
+//!     count of the sets followed by the sets
+//! \param[in] n_sets: The number of sets
+//! \return The size of the table in words
+static inline uint32_t param_table_words(uint32_t n_sets) {
+    return 1 + (n_sets * sizeof(qif_params_t) + 3) / sizeof(uint32_t);
+}
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static bool neuron_impl_initialise(uint32_t n_neurons) {
+    // Allocate DTCM for neuron array
+    neuron_array = spin1_malloc(n_neurons * sizeof(neuron_impl_t));
+    if (neuron_array == NULL) {
+        log_error("Unable to allocate neuron array - Out of DTCM");
+        return false;
+    }
+
+    return true;
+}
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static void neuron_impl_load_neuron_parameters(
+        address_t address, uint32_t next, uint32_t n_neurons) {
+    // The table can grow if the parameters are changed between runs
+    params_per_neuron = address[next] == 0;
+    uint32_t n_sets = param_table_sets(&address[next], n_neurons);
+    if (n_sets > n_param_sets_allocated) {
+        if (param_sets != NULL) {
+            sark_free(param_sets);
+        }
+        param_sets = spin1_malloc(n_sets * sizeof(qif_params_t));
+        if (param_sets == NULL) {
+            log_error("Unable to allocate %u parameter sets - Out of DTCM",
+                    n_sets);
+            rt_error(RTE_SWERR);
+        }
+        n_param_sets_allocated = n_sets;
+    }
+    log_debug("%u neurons have %u parameter sets%s", n_neurons, n_sets,
+            params_per_neuron ? " (one each)" : "");
+
+    // Copy parameters and state to DTCM from SDRAM
+    spin1_memcpy(param_sets, &address[next + 1],
+            n_sets * sizeof(qif_params_t));
+    struct_runs_load(neuron_array, &address[next + param_table_words(n_sets)],
+            sizeof(neuron_impl_t), n_neurons);
+}
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static void neuron_impl_store_neuron_parameters(
+        address_t address, uint32_t next, uint32_t n_neurons) {
+    // Copy the state to SDRAM from DTCM; the parameters don't change
+    uint32_t n_sets = param_table_sets(&address[next], n_neurons);
+    struct_runs_store(&address[next + param_table_words(n_sets)],
+            neuron_array, sizeof(neuron_impl_t), n_neurons);
+}
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static void neuron_impl_add_inputs(
+        index_t synapse_type_index, index_t neuron_index,
+        input_t weights_this_timestep) {
+    neuron_array[neuron_index].inputs[synapse_type_index] +=
+            weights_this_timestep;
+}
+
+//! \brief The midpoint RK2 kernel of qif_impl.h
+//! \param[in] h: the length of the step
+//! \param[in] v: the voltage at the start of the step
+//! \param[in] input: the total input current
+//! \return the voltage at the end of the step
+static inline REAL qif_rk2_midpoint(REAL h, REAL v, REAL input) {
+    REAL eta = v + REAL_HALF(h * (input + v * v));
+    return v + h * (input + eta * eta);
+}
+
+//! \brief Integrate one neuron over one timestep
+//! \param[in,out] neuron: The neuron to update
+//! \param[in] params: The parameters of the neuron
+//! \param[in] extra_input: The input on top of I_offset
+//! \param[out] fraction: Where in the timestep the threshold was reached;
+//!     only written if it was
+//! \return Whether the neuron reached its threshold
+static inline bool qif_curr_delta_update(
+        neuron_impl_t *neuron, const qif_params_t *params,
+        input_t extra_input, REAL *fraction) {
+    // An update that left the neuron unchanged would do so again with
+    // the same input
+    if (neuron->quiescent && extra_input == ZERO) {
+        return false;
+    }
+
+    input_t input = extra_input + params->I_offset;
+    REAL last_V = neuron->V;
+    bool bumped = neuron->this_h != params->substep_h;
+
+    // only the first substep gets the bump
+    REAL v = qif_rk2_midpoint(neuron->this_h, last_V, input);
+    REAL substep_v = last_V;
+    uint32_t substep = 0;
+    for (uint32_t i = 1; i < params->n_substeps && v < params->V_thresh;
+            i++) {
+        substep_v = v;
+        substep = i;
+        v = qif_rk2_midpoint(params->substep_h, v, input);
+    }
+    neuron->V = v;
+    neuron->this_h = params->substep_h;
+
+    if (v >= params->V_thresh) {
+        // Interpolate linearly within the substep that crossed
+        *fraction = ONE;
+        if (v > substep_v) {
+            REAL within = (params->V_thresh - substep_v) / (v - substep_v);
+            *fraction = (substep + within) / (REAL) params->n_substeps;
+        }
+
+        neuron->V = params->C;
+        neuron->this_h = params->substep_h * SIMPLE_TQ_OFFSET;
+        neuron->refract_timer = params->T_refract;
+        neuron->quiescent = false;
+        return true;
+    }
+
+    neuron->quiescent = params->active_set && !bumped
+            && extra_input == ZERO && v == last_V;
+    return false;
+}
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static void neuron_impl_do_timestep_update(
+        uint32_t timer_count, uint32_t time, uint32_t n_neurons) {
+    for (uint32_t neuron_index = 0; neuron_index < n_neurons; neuron_index++) {
+        // Get the neuron itself
+        neuron_impl_t *neuron = &neuron_array[neuron_index];
+
+        // Delta synapses: the input is used by this update only
+        REAL exc = neuron->inputs[EXCITATORY];
+        REAL inh = neuron->inputs[INHIBITORY];
+        neuron->inputs[EXCITATORY] = ZERO;
+        neuron->inputs[INHIBITORY] = ZERO;
+
+        neuron_recording_record_accum(
+                V_RECORDING_INDEX, neuron_index, neuron->V);
+        neuron_recording_record_accum(
+                GSYN_EXC_RECORDING_INDEX, neuron_index, exc);
+        neuron_recording_record_accum(
+                GSYN_INH_RECORDING_INDEX, neuron_index, inh);
+
+        // Non-spiking neurons record zero
+        REAL spike_fraction = ZERO;
+        if (neuron->refract_timer > 0) {
+            // countdown refractory timer; V is held at the reset value
+            neuron->refract_timer--;
+        } else {
+            REAL current_offset =
+                    current_source_get_offset(time, neuron_index);
+            const qif_params_t *params = params_per_neuron ?
+                    &param_sets[neuron_index] : &param_sets[neuron->params];
+            if (qif_curr_delta_update(neuron, params,
+                    exc - inh + current_offset, &spike_fraction)) {
+                neuron_recording_record_bit(
+                        SPIKE_RECORDING_BITFIELD, neuron_index);
+                send_spike(timer_count, time, neuron_index);
+            }
+        }
+
+        uint16_t fraction_bits = spike_fraction_bits(spike_fraction);
+        neuron_recording_record_value(
+                SPIKE_FRACTION_RECORDING_INDEX, neuron_index, &fraction_bits);
+    }
+}
+
+#if LOG_LEVEL >= LOG_DEBUG
+void neuron_impl_print_inputs(uint32_t n_neurons) {
+    log_debug("-------------------------------------\n");
+    for (index_t i = 0; i < n_neurons; i++) {
+        neuron_impl_t *neuron = &neuron_array[i];
+        log_debug("inputs: %k %k", neuron->inputs[EXCITATORY],
+                neuron->inputs[INHIBITORY]);
+    }
+    log_debug("-------------------------------------\n");
+}
+
+void neuron_impl_print_synapse_parameters(uint32_t n_neurons) {
+    // delta synapses have no parameters
+    use(n_neurons);
+}
+
+const char *neuron_impl_get_synapse_type_char(uint32_t synapse_type) {
+    if (synapse_type == EXCITATORY) {
+        return "X";
+    } else if (synapse_type == INHIBITORY) {
+        return "I";
+    }
+    return "?";
+}
+#endif // LOG_LEVEL >= LOG_DEBUG
+
+#endif // _QIF_CURR_DELTA_FUSED_IMPL_H_
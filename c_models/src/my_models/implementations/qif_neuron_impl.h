@@ -0,0 +1,172 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief The standard neuron implementation for QIF neuron models, which
+//!     can also record where in each timestep a neuron spiked and how many
+//!     times it did
+//! \details Everything but the timestep update is taken from
+//!     neuron_impl_standard.h of sPyNNaker; its timestep update is renamed
+//!     out of the way so that this one, which adds the recording, is used
+#ifndef _QIF_NEURON_IMPL_H_
+#define _QIF_NEURON_IMPL_H_
+
+// Take the standard implementation, with its timestep update renamed
+#define neuron_impl_do_timestep_update neuron_impl_standard_do_timestep_update
+#include <neuron/implementations/neuron_impl_standard.h>
+#undef neuron_impl_do_timestep_update
+#include "spike_fraction.h"
+
+// The standard recordings are followed by those of the QIF models
+#define SPIKE_FRACTION_RECORDING_INDEX 3
+#define SPIKE_COUNT_RECORDING_INDEX 4
+#undef N_RECORDED_VARS
+#define N_RECORDED_VARS 5
+
+__attribute__((unused)) // Marked unused as only used sometimes
+static void neuron_impl_do_timestep_update(
+        uint32_t timer_count, uint32_t time, uint32_t n_neurons) {
+    for (uint32_t neuron_index = 0; neuron_index < n_neurons; neuron_index++) {
+        // Get the neuron itself
+        neuron_t *this_neuron = &neuron_array[neuron_index];
+
+        // Get the input_type parameters and voltage for this neuron
+        input_type_t *input_types = &input_type_array[neuron_index];
+
+        // Get threshold and additional input parameters for this neuron
+        threshold_type_t *the_threshold_type =
+                &threshold_type_array[neuron_index];
+        additional_input_t *additional_inputs =
+                &additional_input_array[neuron_index];
+        synapse_param_t *the_synapse_type =
+                &neuron_synapse_shaping_params[neuron_index];
+
+        // How many spikes happened, and where in the timestep the first did
+        uint32_t n_spikes = 0;
+        REAL spike_fraction = ZERO;
+
+        for (uint32_t i = n_steps_per_timestep; i > 0; i--) {
+            // Get the voltage
+            state_t soma_voltage =
+                    neuron_model_get_membrane_voltage(this_neuron);
+
+            // Get the exc and inh values from the synapses
+            input_t exc_values[NUM_EXCITATORY_RECEPTORS];
+            input_t *exc_syn_values = synapse_types_get_excitatory_input(
+                    exc_values, the_synapse_type);
+            input_t inh_values[NUM_INHIBITORY_RECEPTORS];
+            input_t *inh_syn_values = synapse_types_get_inhibitory_input(
+                    inh_values, the_synapse_type);
+
+            // Call functions to obtain exc_input and inh_input
+            input_t *exc_input_values = input_type_get_input_value(
+                    exc_syn_values, input_types, NUM_EXCITATORY_RECEPTORS);
+            input_t *inh_input_values = input_type_get_input_value(
+                    inh_syn_values, input_types, NUM_INHIBITORY_RECEPTORS);
+
+            // Sum g_syn contributions from all receptors for recording
+            REAL total_exc = 0;
+            REAL total_inh = 0;
+
+            for (int j = 0; j < NUM_EXCITATORY_RECEPTORS; j++) {
+                total_exc += exc_input_values[j];
+            }
+            for (int j = 0; j < NUM_INHIBITORY_RECEPTORS; j++) {
+                total_inh += inh_input_values[j];
+            }
+
+            // Do recording if on first step
+            if (i == n_steps_per_timestep) {
+                neuron_recording_record_accum(
+                        V_RECORDING_INDEX, neuron_index, soma_voltage);
+                neuron_recording_record_accum(
+                        GSYN_EXC_RECORDING_INDEX, neuron_index, total_exc);
+                neuron_recording_record_accum(
+                        GSYN_INH_RECORDING_INDEX, neuron_index, total_inh);
+            }
+
+            // Call functions to convert exc_input and inh_input to current
+            input_type_convert_excitatory_input_to_current(
+                    exc_input_values, input_types, soma_voltage);
+            input_type_convert_inhibitory_input_to_current(
+                    inh_input_values, input_types, soma_voltage);
+
+            REAL current_offset = current_source_get_offset(time, neuron_index);
+
+            input_t external_bias = additional_input_get_input_value_as_current(
+                    additional_inputs, soma_voltage);
+
+            // update neuron parameters
+            state_t result = neuron_model_state_update(
+                    NUM_EXCITATORY_RECEPTORS, exc_input_values,
+                    NUM_INHIBITORY_RECEPTORS, inh_input_values,
+                    external_bias, current_offset, this_neuron);
+
+            // determine if a spike should occur
+            bool spike_now =
+                    threshold_type_is_above_threshold(result, the_threshold_type);
+
+            // If spike occurs, communicate to relevant parts of model
+            if (spike_now) {
+                if (n_spikes == 0) {
+                    // Place the crossing within the whole timestep
+                    uint32_t step = n_steps_per_timestep - i;
+                    spike_fraction = (step
+                            + neuron_model_get_crossing_fraction())
+                            / (REAL) n_steps_per_timestep;
+                }
+                uint32_t n_burst = neuron_model_get_spike_count();
+                n_spikes += n_burst;
+
+                // Call relevant model-based functions
+                // Tell the neuron model
+                neuron_model_has_spiked(this_neuron);
+
+                // Tell the additional input
+                additional_input_has_spiked(additional_inputs);
+
+                // Send one spike for each time the threshold was reached
+                for (uint32_t s = n_burst; s > 0; s--) {
+                    send_spike(timer_count, time, neuron_index);
+                }
+            }
+
+            // Shape the existing input according to the included rule
+            synapse_types_shape_input(the_synapse_type);
+        }
+
+        // Non-spiking neurons record zero
+        uint16_t fraction_bits = spike_fraction_bits(spike_fraction);
+        neuron_recording_record_value(
+                SPIKE_FRACTION_RECORDING_INDEX, neuron_index, &fraction_bits);
+
+        // Saturate the count at what the recording can hold
+        uint8_t count_bits = (n_spikes < UINT8_MAX) ? n_spikes : UINT8_MAX;
+        neuron_recording_record_value(
+                SPIKE_COUNT_RECORDING_INDEX, neuron_index, &count_bits);
+
+        if (n_spikes > 0) {
+            neuron_recording_record_bit(SPIKE_RECORDING_BITFIELD, neuron_index);
+        }
+
+#if LOG_LEVEL >= LOG_DEBUG
+        neuron_model_print_state_variables(this_neuron);
+#endif // LOG_LEVEL >= LOG_DEBUG
+    }
+}
+
+#endif // _QIF_NEURON_IMPL_H_
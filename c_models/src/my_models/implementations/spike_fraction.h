@@ -0,0 +1,37 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief The recorded form of where in a timestep a QIF neuron spiked,
+//!     shared by the QIF neuron implementations
+#ifndef _SPIKE_FRACTION_H_
+#define _SPIKE_FRACTION_H_
+
+#include <common/maths-util.h>
+
+//! \brief Convert a fraction of a timestep to the recorded U0.16 value
+//! \param[in] fraction: The fraction, in [0, 1]
+//! \return The recorded value, saturating just below 1
+static inline uint16_t spike_fraction_bits(REAL fraction) {
+    if (fraction >= ONE) {
+        return UINT16_MAX;
+    }
+    // S16.15 to U0.16
+    return (uint16_t) (bitsk(fraction) << 1);
+}
+
+#endif  // _SPIKE_FRACTION_H_
@@ -0,0 +1,80 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Loading of neuron structs written by the host as runs of
+//!     identical structs, each followed by its length, so that a
+//!     homogeneous population is written (and read from SDRAM) only once
+#ifndef _STRUCT_RUNS_H_
+#define _STRUCT_RUNS_H_
+
+#include <common/neuron-typedefs.h>
+#include <spin1_api.h>
+
+//! \brief The size of a struct in SDRAM, in whole words
+//! \param[in] struct_size: The size of the struct in bytes
+//! \return The size in words
+static inline uint32_t struct_runs_words(uint32_t struct_size) {
+    return (struct_size + sizeof(uint32_t) - 1) / sizeof(uint32_t);
+}
+
+//! \brief Load an array of structs, expanding any runs
+//! \details The data starts with the number of runs, each of which is a
+//!     count of structs followed by the struct (padded to a word); if
+//!     there are no runs, the structs follow one after another
+//! \param[out] array: The array to fill
+//! \param[in] data: The data in SDRAM
+//! \param[in] struct_size: The size of one struct in bytes
+//! \param[in] n_items: The number of structs in the array
+static inline void struct_runs_load(
+        void *array, const uint32_t *data, uint32_t struct_size,
+        uint32_t n_items) {
+    uint32_t n_runs = *data++;
+    if (n_runs == 0) {
+        spin1_memcpy(array, data, n_items * struct_size);
+        return;
+    }
+
+    uint8_t *item = array;
+    uint32_t run_words = struct_runs_words(struct_size);
+    for (uint32_t run = 0; run < n_runs; run++) {
+        uint32_t count = *data++;
+        // Read the struct once, then copy it within DTCM
+        spin1_memcpy(item, data, struct_size);
+        for (uint32_t i = 1; i < count; i++) {
+            spin1_memcpy(&item[i * struct_size], item, struct_size);
+        }
+        item += count * struct_size;
+        data += run_words;
+    }
+}
+
+//! \brief Store an array of structs one after another, which is how they
+//!     are read back by the host
+//! \param[out] data: The data in SDRAM, which must have room for the count
+//!     and every struct
+//! \param[in] array: The array to store
+//! \param[in] struct_size: The size of one struct in bytes
+//! \param[in] n_items: The number of structs in the array
+static inline void struct_runs_store(
+        uint32_t *data, const void *array, uint32_t struct_size,
+        uint32_t n_items) {
+    *data++ = 0;
+    spin1_memcpy(data, array, n_items * struct_size);
+}
+
+#endif // _STRUCT_RUNS_H_
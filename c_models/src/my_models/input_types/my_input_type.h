@@ -15,10 +15,9 @@
 
 #include <neuron/input_types/input_type.h>
 
-typedef struct input_type_t {
-    REAL multiplicator;
-    REAL my_parameter;
-} input_type_t;
+// The struct is generated from the schema in
+// python_models8/neuron/input_types/my_input_type.py
+#include "my_input_type_struct.h"
 
 static inline void _input_type_set_multiplicator_value(
 		input_t total, input_type_t *input_type) {
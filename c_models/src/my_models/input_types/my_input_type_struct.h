@@ -0,0 +1,16 @@
+// Generated from the schema python_models8.neuron.input_types.my_input_type:SCHEMA
+// by python_models8.utilities.struct_schema; update the schema and
+// regenerate this rather than editing it
+#ifndef _MY_INPUT_TYPE_STRUCT_H_
+#define _MY_INPUT_TYPE_STRUCT_H_
+
+#include <common/neuron-typedefs.h>
+
+typedef struct input_type_t {
+    //! my_multiplicator
+    REAL multiplicator;
+    //! my_input_parameter [mA]
+    REAL my_parameter;
+} input_type_t;
+
+#endif // _MY_INPUT_TYPE_STRUCT_H_
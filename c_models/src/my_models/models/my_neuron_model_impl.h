@@ -3,18 +3,10 @@
 
 #include <neuron/models/neuron_model.h>
 
-typedef struct neuron_t {
-    // TODO: Parameters - make sure these match with the Python code,
-    // including the order of the variables when returned by
-    // get_neural_parameters.
-
-    // Variable-state parameters e.g. membrane voltage
-    REAL V;
-    // offset current [nA]
-    REAL I_offset;
-    // Put anything else you want to store per neuron
-    REAL my_parameter;
-} neuron_t;
+// TODO: The struct is generated from the schema in
+// python_models8/neuron/neuron_models/my_neuron_model.py - make sure the
+// fields there match what the code below uses
+#include "my_neuron_model_struct.h"
 
 typedef struct global_neuron_params_t {
     // TODO: Add any parameters that apply to the whole model here (i.e. not
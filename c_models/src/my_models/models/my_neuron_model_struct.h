@@ -0,0 +1,18 @@
+// Generated from the schema python_models8.neuron.neuron_models.my_neuron_model:SCHEMA
+// by python_models8.utilities.struct_schema; update the schema and
+// regenerate this rather than editing it
+#ifndef _MY_NEURON_MODEL_STRUCT_H_
+#define _MY_NEURON_MODEL_STRUCT_H_
+
+#include <common/neuron-typedefs.h>
+
+typedef struct neuron_t {
+    //! v [mV]
+    REAL V;
+    //! i_offset [nA]
+    REAL I_offset;
+    //! my_neuron_parameter [mV]
+    REAL my_parameter;
+} neuron_t;
+
+#endif // _MY_NEURON_MODEL_STRUCT_H_
@@ -0,0 +1,178 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+#ifndef _QIF_ANALYTIC_IMPL_H_
+#define _QIF_ANALYTIC_IMPL_H_
+
+#include <neuron/models/neuron_model.h>
+
+//! The number of samples of each coefficient in the interpolation table
+#define QIF_ANALYTIC_TABLE_SIZE 256
+
+typedef struct neuron_t {
+    // nominally 'fixed' parameters
+    REAL C;
+
+    // Variable-state parameters
+    REAL V;
+
+    //! offset current [nA]
+    REAL I_offset;
+
+    //! countdown to end of next refractory period [timesteps]
+    int32_t  refract_timer;
+
+    //! refractory time of neuron [timesteps]
+    int32_t  T_refract;
+
+    //! voltage a neuron that passes through infinity is left at
+    REAL V_peak;
+
+    //! update coefficient a for I_offset alone, computed on the host
+    REAL A_offset;
+
+    //! update coefficient h * s for I_offset alone, computed on the host
+    REAL HS_offset;
+} neuron_t;
+
+typedef struct global_neuron_params_t {
+    //! the time step [ms]
+    REAL h;
+
+    //! the smallest z = I * h * h in the tables
+    REAL z_min;
+
+    //! the input at z_min; weaker inputs are clamped to it
+    REAL i_min;
+
+    //! the z = I * h * h at and above which the neuron always spikes; this
+    //! is pi^2, below which the update decides exactly whether it spikes
+    REAL z_max;
+
+    //! one over the spacing of z in the tables
+    REAL inv_dz;
+
+    //! coefficient a sampled over z
+    REAL a_table[QIF_ANALYTIC_TABLE_SIZE];
+
+    //! coefficient s sampled over z
+    REAL s_table[QIF_ANALYTIC_TABLE_SIZE];
+} global_neuron_params_t;
+
+extern const global_neuron_params_t *global_params;
+
+/*!
+ * \brief Exact update of dV/dt = V^2 + I over one time step.
+ * \details With z = I h^2 the solution is the Mobius map
+ *      V' = (a V + I h s) / (a - h s V), where a = cos(sqrt(z)) and
+ *      s = sin(sqrt(z)) / sqrt(z) (and the hyperbolic equivalents for z < 0).
+ *      The denominator reaching zero means that V passed through infinity,
+ *      i.e. the neuron spiked, within the step; it is then left at V_peak.
+ * \param[in,out] neuron: The model being updated
+ * \param[in] a: coefficient a for this step's input
+ * \param[in] hs: coefficient s times the time step for this step's input
+ * \param[in] input: the total input current
+ */
+static inline void qif_analytic_update(
+        neuron_t *neuron, REAL a, REAL hs, REAL input) {
+    REAL v = neuron->V;
+    REAL denominator = a - hs * v;
+    REAL numerator = a * v + input * hs;
+
+    if (denominator <= ZERO || numerator >= neuron->V_peak * denominator) {
+        neuron->V = neuron->V_peak;
+    } else {
+        neuron->V = numerator / denominator;
+    }
+}
+
+static state_t neuron_model_state_update(
+        uint16_t num_excitatory_inputs, const input_t *exc_input,
+    uint16_t num_inhibitory_inputs, const input_t *inh_input,
+    input_t external_bias, REAL current_offset, neuron_t *restrict neuron) {
+
+    // If outside of the refractory period
+    if (neuron->refract_timer <= 0) {
+        REAL total_exc = 0;
+        REAL total_inh = 0;
+
+        for (int i =0; i<num_excitatory_inputs; i++) {
+            total_exc += exc_input[i];
+        }
+        for (int i =0; i<num_inhibitory_inputs; i++) {
+            total_inh += inh_input[i];
+        }
+
+        input_t extra_input = total_exc - total_inh
+                + external_bias + current_offset;
+
+        if (extra_input == ZERO) {
+            // exact coefficients prepared by the host
+            qif_analytic_update(
+                    neuron, neuron->A_offset, neuron->HS_offset,
+                    neuron->I_offset);
+        } else {
+            input_t input_this_timestep = extra_input + neuron->I_offset;
+            // h * h would lose most of its bits at small time steps
+            REAL z = (input_this_timestep * global_params->h) *
+                    global_params->h;
+            if (z >= global_params->z_max) {
+                neuron->V = neuron->V_peak;
+            } else {
+                // linear interpolation of the tables
+                REAL position = ZERO;
+                if (z > global_params->z_min) {
+                    position = (z - global_params->z_min) *
+                            global_params->inv_dz;
+                } else {
+                    // use the input that matches the coefficients of z_min
+                    input_this_timestep = global_params->i_min;
+                }
+                uint32_t index = (uint32_t) position;
+                if (index > QIF_ANALYTIC_TABLE_SIZE - 2) {
+                    // rounding just below z_max
+                    index = QIF_ANALYTIC_TABLE_SIZE - 2;
+                }
+                REAL fraction = position - (REAL) index;
+                const REAL *a_table = &global_params->a_table[index];
+                const REAL *s_table = &global_params->s_table[index];
+                REAL a = a_table[0] + fraction * (a_table[1] - a_table[0]);
+                REAL s = s_table[0] + fraction * (s_table[1] - s_table[0]);
+                qif_analytic_update(neuron, a, global_params->h * s,
+                        input_this_timestep);
+            }
+        }
+    } else {
+        // countdown refractory timer
+        neuron->refract_timer--;
+    }
+    return neuron->V;
+}
+
+static void neuron_model_has_spiked(neuron_t *restrict neuron) {
+    // reset membrane voltage
+    neuron->V = neuron->C;
+
+    // reset refractory timer
+    neuron->refract_timer = neuron->T_refract;
+}
+
+static state_t neuron_model_get_membrane_voltage(const neuron_t *neuron) {
+    return neuron->V;
+}
+
+#endif   // _QIF_ANALYTIC_IMPL_H_
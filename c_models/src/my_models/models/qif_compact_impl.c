@@ -0,0 +1,46 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief Quadratic integrate-and-fire (QIF) neuron type with a compact
+//!     layout
+#include "qif_compact_impl.h"
+
+#include <debug.h>
+
+//! The global parameters of the compact QIF neuron model
+const global_neuron_params_t *global_params;
+
+void neuron_model_set_global_neuron_params(
+        const global_neuron_params_t *params) {
+    global_params = params;
+
+    log_debug("C = %11.4k ", global_params->C);
+
+    log_debug("T refract = %u timesteps", global_params->T_refract);
+
+    log_debug("substeps = %u of %11.4k ms", global_params->n_substeps,
+            global_params->substep_h);
+}
+
+void neuron_model_print_state_variables(const neuron_t *neuron) {
+    log_debug("V = %11.4k ", (REAL) neuron->V);
+}
+
+void neuron_model_print_parameters(const neuron_t *neuron) {
+    log_debug("I = %11.4k \n", (REAL) neuron->I_offset);
+}
@@ -27,6 +27,10 @@ const global_neuron_params_t *global_params;
 void neuron_model_set_global_neuron_params(
         const global_neuron_params_t *params) {
     global_params = params;
+
+    log_debug("substeps = %u of %11.4k ms, V_peak = %11.4k, flags = 0x%x",
+            params->n_substeps, params->substep_h, params->V_peak,
+            params->flags);
 }
 
 void neuron_model_print_state_variables(const neuron_t *neuron) {
@@ -39,4 +43,6 @@ void neuron_model_print_parameters(const neuron_t *neuron) {
     log_debug("I = %11.4k \n", neuron->I_offset);
 
     log_debug("T refract = %u timesteps", neuron->T_refract);
+
+    log_debug("quiescent = %u", neuron->quiescent);
 }
@@ -22,34 +22,47 @@
 
 #include <neuron/models/neuron_model.h>
 
-//! The state variables of an QIF model neuron
-typedef struct neuron_t {
-    // nominally 'fixed' parameters
-    REAL C;
-
-    // Variable-state parameters
-    REAL V;
-
-    //! offset current [nA]
-    REAL I_offset;
+//! The state variables of an QIF model neuron; the struct is generated from
+//! the schema in
+//! python_models8/neuron/neuron_models/neuron_model_quadratic_integrate_and_fire.py
+#include "qif_struct.h"
+
+//! Flags of global_neuron_params_t
+enum qif_flags {
+    //! whether a quiescent neuron skips its update
+    QIF_ACTIVE_SET = 1,
+    //! whether a neuron can reset and spike again within a timestep
+    QIF_BURST = 2
+};
+
+//! \brief Global neuron parameters for QIF model neuron; the options that
+//!     are the same for the whole population are held here, not per neuron
+typedef struct global_neuron_params_t {
+    //! length of one timestep [ms]
+    REAL machine_timestep_ms;
 
-    //! countdown to end of next refractory period [timesteps]
-    int32_t  refract_timer;
+    //! length of one substep [ms]
+    REAL substep_h;
 
-    //! refractory time of neuron [timesteps]
-    int32_t  T_refract;
+    //! number of RK2 substeps integrated per timestep
+    uint32_t n_substeps;
 
-    //! current timestep - simple correction for threshold
-    REAL this_h;
-} neuron_t;
+    //! membrane voltage after which the remaining substeps are skipped
+    REAL V_peak;
 
-//! Global neuron parameters for QIF model neuron
-typedef struct global_neuron_params_t {
-    REAL machine_timestep_ms;
+    //! the qif_flags that are set
+    uint32_t flags;
 } global_neuron_params_t;
 
 extern const global_neuron_params_t *global_params;
 
+//! \brief The fraction of the last update at which the neuron reached
+//!     V_peak; only meaningful straight after an update that crossed it
+static REAL crossing_fraction;
+
+//! \brief The number of times the neuron last updated reached V_peak
+static uint32_t spike_count;
+
 /*! \brief For linear membrane voltages, 1.5 is the correct value. However
  * with actual membrane voltage behaviour and tested over an wide range of
  * use cases 1.85 gives slightly better spike timings.
@@ -77,11 +90,31 @@ static inline void rk2_kernel_midpoint(
 }
 
 
+/*!
+ * \brief Count a crossing of V_peak, interpolating linearly where in the
+ *      substep the first one happened
+ * \param[in] neuron: The neuron that has just reached V_peak
+ * \param[in] substep: The index of the substep that reached V_peak
+ * \param[in] substep_V: The voltage at the start of that substep
+ */
+static inline void note_crossing(
+        const neuron_t *neuron, uint32_t substep, REAL substep_V) {
+    if (spike_count == 0 && neuron->V > substep_V) {
+        REAL within = (global_params->V_peak - substep_V)
+                / (neuron->V - substep_V);
+        crossing_fraction = (substep + within) * global_params->substep_h
+                / global_params->machine_timestep_ms;
+    }
+    spike_count++;
+}
+
 static state_t neuron_model_state_update(
         uint16_t num_excitatory_inputs, const input_t *exc_input,
     uint16_t num_inhibitory_inputs, const input_t *inh_input,
     input_t external_bias, REAL current_offset, neuron_t *restrict neuron) {
-    
+    crossing_fraction = ONE;
+    spike_count = 0;
+
     // If outside of the refractory period
     if (neuron->refract_timer <= 0) {
         REAL total_exc = 0;
@@ -94,32 +127,90 @@ static state_t neuron_model_state_update(
             total_inh += inh_input[i];
         }
 
-        input_t input_this_timestep = total_exc - total_inh
-                + external_bias + neuron->I_offset + current_offset;
+        input_t extra_input = total_exc - total_inh
+                + external_bias + current_offset;
 
-        // the best AR update so far
+        // An update that left the neuron unchanged would do so again with
+        // the same input, so there is nothing to bring forward
+        if (neuron->quiescent && extra_input == ZERO) {
+            return neuron->V;
+        }
+
+        input_t input_this_timestep = extra_input + neuron->I_offset;
+        REAL last_V = neuron->V;
+        bool bumped = neuron->this_h != global_params->substep_h;
+
+        // the best AR update so far; only the first substep gets the bump
         rk2_kernel_midpoint(neuron->this_h, neuron, input_this_timestep);
-        neuron->this_h = global_params->machine_timestep_ms;
+        REAL substep_V = last_V;
+        uint32_t substep = 0;
+        for (uint32_t i = 1; i < global_params->n_substeps; i++) {
+            if (neuron->V >= global_params->V_peak) {
+                // stop before the diverging voltage overflows, unless the
+                // neuron can reset and carry on within this timestep
+                if (!(global_params->flags & QIF_BURST)
+                        || neuron->T_refract > 0) {
+                    break;
+                }
+                note_crossing(neuron, substep, substep_V);
+                neuron->V = neuron->C;
+            }
+            substep_V = neuron->V;
+            substep = i;
+            rk2_kernel_midpoint(
+                    global_params->substep_h, neuron, input_this_timestep);
+        }
+        neuron->this_h = global_params->substep_h;
+        if (neuron->V >= global_params->V_peak) {
+            note_crossing(neuron, substep, substep_V);
+        }
+
+        neuron->quiescent = (global_params->flags & QIF_ACTIVE_SET)
+                && !bumped
+                && extra_input == ZERO && neuron->V == last_V;
     } else {
         // countdown refractory timer
         neuron->refract_timer--;
     }
+
+    // A neuron that reset within the timestep must still reach threshold
+    if (spike_count > 0 && neuron->V < global_params->V_peak) {
+        return global_params->V_peak;
+    }
     return neuron->V;
 }
 
 static void neuron_model_has_spiked(neuron_t *restrict neuron) {
-    // reset membrane voltage
-    neuron->V = neuron->C;
+    // reset membrane voltage, unless a burst already did and the neuron
+    // has carried on from there
+    if (spike_count == 0 || neuron->V >= global_params->V_peak) {
+        neuron->V = neuron->C;
+    }
 
     // simple threshold correction - next timestep (only) gets a bump
-    neuron->this_h = global_params->machine_timestep_ms * SIMPLE_TQ_OFFSET;
+    neuron->this_h = global_params->substep_h * SIMPLE_TQ_OFFSET;
 
     // reset refractory timer
     neuron->refract_timer = neuron->T_refract;
+
+    neuron->quiescent = false;
 }
 
 static state_t neuron_model_get_membrane_voltage(const neuron_t *neuron) {
     return neuron->V;
 }
 
+//! \brief Get where in the last update the neuron reached V_peak
+//! \return The fraction of the update, 1 if V_peak was not reached
+static inline REAL neuron_model_get_crossing_fraction(void) {
+    return crossing_fraction;
+}
+
+//! \brief Get how many spikes the last update fired
+//! \return The number of times V_peak was reached, at least 1 as this is
+//!     only asked of a neuron over its threshold
+static inline uint32_t neuron_model_get_spike_count(void) {
+    return (spike_count > 0) ? spike_count : 1;
+}
+
 #endif   // _QIF_IMPL_H_
@@ -0,0 +1,26 @@
+// Generated from the schema python_models8.neuron.neuron_models.neuron_model_quadratic_integrate_and_fire:SCHEMA
+// by python_models8.utilities.struct_schema; update the schema and
+// regenerate this rather than editing it
+#ifndef _QIF_STRUCT_H_
+#define _QIF_STRUCT_H_
+
+#include <common/neuron-typedefs.h>
+
+typedef struct neuron_t {
+    //! c [mV]
+    REAL C;
+    //! v [mV]
+    REAL V;
+    //! i_offset [nA]
+    REAL I_offset;
+    //! count_refrac [timesteps]
+    int32_t refract_timer;
+    //! t_refract [timesteps]
+    int32_t T_refract;
+    //! this_h [ms]
+    REAL this_h;
+    //! quiescent
+    uint32_t quiescent;
+} neuron_t;
+
+#endif // _QIF_STRUCT_H_
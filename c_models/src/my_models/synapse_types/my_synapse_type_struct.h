@@ -0,0 +1,24 @@
+// Generated from the schema python_models8.neuron.synapse_types.my_synapse_type:SCHEMA
+// by python_models8.utilities.struct_schema; update the schema and
+// regenerate this rather than editing it
+#ifndef _MY_SYNAPSE_TYPE_STRUCT_H_
+#define _MY_SYNAPSE_TYPE_STRUCT_H_
+
+#include <common/neuron-typedefs.h>
+
+typedef struct synapse_param_t {
+    //! my_exc_decay
+    decay_t my_exc_decay;
+    //! my_exc_scale
+    decay_t my_exc_init;
+    //! my_inh_decay
+    decay_t my_inh_decay;
+    //! my_inh_scale
+    decay_t my_inh_init;
+    //! my_exc_init [uS]
+    input_t my_input_buffer_excitatory_value;
+    //! my_inh_init [uS]
+    input_t my_input_buffer_inhibitory_value;
+} synapse_param_t;
+
+#endif // _MY_SYNAPSE_TYPE_STRUCT_H_
@@ -0,0 +1,184 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+/*! \file
+ * \brief implementation of synapse_types.h for exponential shaping with a
+ *      depressing resource per neuron and receptor
+ *
+ * \details Input arriving on a receptor is scaled by the fraction of the
+ *      receptor's resource that is available, and then uses up a part of it
+ *      proportional to its weight; the resource recovers exponentially
+ *      towards 1.  Keeping the resource here rather than in the synaptic
+ *      rows leaves the rows the same as for static synapses.
+ */
+
+#ifndef _SYNAPSE_TYPES_EXPONENTIAL_DEPRESSION_IMPL_H_
+#define _SYNAPSE_TYPES_EXPONENTIAL_DEPRESSION_IMPL_H_
+
+// This is currently used for decaying the neuron input
+#include <neuron/decay.h>
+
+#include <debug.h>
+
+#define SYNAPSE_TYPE_BITS 1
+#define SYNAPSE_TYPE_COUNT 2
+
+//! Shaping and resource of one receptor
+typedef struct depressing_exp_params_t {
+    //! decay of the synaptic input per timestep
+    decay_t decay;
+    //! scaling of input arriving this timestep
+    decay_t init;
+    //! the synaptic input
+    input_t synaptic_input_value;
+    //! the fraction of the resource available
+    REAL resource;
+} depressing_exp_params_t;
+
+typedef struct synapse_param_t {
+    depressing_exp_params_t exc;
+    depressing_exp_params_t inh;
+    //! the fraction of the resource used per unit of weight
+    REAL U;
+    //! decay of the used resource per timestep
+    decay_t recovery_decay;
+} synapse_param_t;
+
+// Define receptor split
+#define NUM_EXCITATORY_RECEPTORS 1
+#define NUM_INHIBITORY_RECEPTORS 1
+
+// Include this here after defining the above items
+#include <neuron/synapse_types/synapse_types.h>
+
+// This makes it easy to keep track of which is which
+typedef enum input_buffer_regions {
+    EXCITATORY, INHIBITORY,
+} input_buffer_regions;
+
+//! \brief Decays the input of a receptor and recovers its resource
+//! \param[in,out] params: the receptor to shape
+//! \param[in] recovery_decay: the decay of the used resource
+static inline void depressing_exp_shaping(
+        depressing_exp_params_t *params, decay_t recovery_decay) {
+    params->synaptic_input_value = decay_s1615(
+            params->synaptic_input_value, params->decay);
+    params->resource = REAL_CONST(1.0) - decay_s1615(
+            REAL_CONST(1.0) - params->resource, recovery_decay);
+}
+
+//! \brief Shapes the values input into the neurons
+//! \param[in] parameters: the synapse parameter pointer passed in
+static inline void synapse_types_shape_input(
+        synapse_param_t *parameters) {
+    depressing_exp_shaping(&parameters->exc, parameters->recovery_decay);
+    depressing_exp_shaping(&parameters->inh, parameters->recovery_decay);
+}
+
+//! \brief Adds input scaled by the available resource, and uses up a part
+//!     of the resource proportional to the input
+//! \param[in,out] params: the receptor to add to
+//! \param[in] U: the fraction of the resource used per unit of weight
+//! \param[in] input: the input to be added
+static inline void add_input_depressing_exp(
+        depressing_exp_params_t *params, REAL U, input_t input) {
+    input_t available = input * params->resource;
+    params->synaptic_input_value = params->synaptic_input_value +
+            decay_s1615(available, params->init);
+
+    REAL used = U * input;
+    if (used >= REAL_CONST(1.0)) {
+        params->resource = ZERO;
+    } else {
+        params->resource -= params->resource * used;
+    }
+}
+
+//! \brief Adds the initial value to an input buffer for this shaping.
+//! \param[in] synapse_type_index: the index of the synapse type to add the
+//!     value to
+//! \param[in] parameters: the synapse parameters passed in
+//! \param[in] input: the input to be added
+static inline void synapse_types_add_neuron_input(
+        index_t synapse_type_index, synapse_param_t *parameters,
+        input_t input) {
+    if (synapse_type_index == EXCITATORY) {
+        add_input_depressing_exp(&parameters->exc, parameters->U, input);
+    } else if (synapse_type_index == INHIBITORY) {
+        add_input_depressing_exp(&parameters->inh, parameters->U, input);
+    }
+}
+
+//! \brief Gets the excitatory input for a given neuron
+//! \param[in] parameters: the synapse parameters passed in
+//! \return the first entry in the array of excitatory input values
+static inline input_t* synapse_types_get_excitatory_input(
+        input_t *excitatory_response, synapse_param_t *parameters) {
+    excitatory_response[0] = parameters->exc.synaptic_input_value;
+    return &excitatory_response[0];
+}
+
+//! \brief Gets the inhibitory input for a given neuron
+//! \param[in] parameters: the synapse parameters passed in
+//! \return the first entry in array of inhibitory input values
+static inline input_t* synapse_types_get_inhibitory_input(
+        input_t *inhibitory_response, synapse_param_t *parameters) {
+    inhibitory_response[0] = parameters->inh.synaptic_input_value;
+    return &inhibitory_response[0];
+}
+
+//! \brief returns a human readable character for the type of synapse, for
+//!     debug purposes
+//! \param[in] synapse_type_index: the synapse type index
+//! \return a human readable character representing the synapse type.
+static inline const char *synapse_types_get_type_char(
+        index_t synapse_type_index) {
+    if (synapse_type_index == EXCITATORY) {
+        return "X";
+    } else if (synapse_type_index == INHIBITORY)  {
+        return "I";
+    } else {
+        log_debug("Did not recognise synapse type %i", synapse_type_index);
+        return "?";
+    }
+}
+
+//! \brief prints the input for a neuron ID for debug purposes
+//! \param[in] parameters: the synapse parameters passed in
+static inline void synapse_types_print_input(
+        synapse_param_t *parameters) {
+    io_printf(IO_BUF, "%12.6k - %12.6k",
+            parameters->exc.synaptic_input_value,
+            parameters->inh.synaptic_input_value);
+}
+
+//! \brief print parameters call
+//! \param[in] parameters: the pointer to the parameters to print
+static inline void synapse_types_print_parameters(
+        synapse_param_t *parameters) {
+    log_info("exc_decay = %R\n", (unsigned fract) parameters->exc.decay);
+    log_info("exc_init  = %R\n", (unsigned fract) parameters->exc.init);
+    log_info("inh_decay = %R\n", (unsigned fract) parameters->inh.decay);
+    log_info("inh_init  = %R\n", (unsigned fract) parameters->inh.init);
+    log_info("exc_resource = %11.4k\n", parameters->exc.resource);
+    log_info("inh_resource = %11.4k\n", parameters->inh.resource);
+    log_info("U = %11.4k\n", parameters->U);
+    log_info("recovery_decay = %R\n",
+            (unsigned fract) parameters->recovery_decay);
+}
+
+#endif  // _SYNAPSE_TYPES_EXPONENTIAL_DEPRESSION_IMPL_H_
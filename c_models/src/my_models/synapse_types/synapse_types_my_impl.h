@@ -32,16 +32,9 @@
 #define SYNAPSE_TYPE_COUNT 2
 
 // TODO: Define the parameters required to compute the synapse shape
-// The number of parameters here should match the number per neuron
-// written by the python method write_synapse_parameters
-typedef struct synapse_param_t {
-    REAL my_exc_decay;
-    REAL my_exc_init;
-    REAL my_inh_decay;
-    REAL my_inh_init;
-    input_t my_input_buffer_excitatory_value;
-    input_t my_input_buffer_inhibitory_value;
-} synapse_param_t;
+// The struct is generated from the schema in
+// python_models8/neuron/synapse_types/my_synapse_type.py
+#include "my_synapse_type_struct.h"
 
 // Define receptor split
 #define NUM_EXCITATORY_RECEPTORS 1
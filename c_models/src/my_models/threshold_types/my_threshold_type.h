@@ -3,11 +3,9 @@
 
 #include <neuron/threshold_types/threshold_type.h>
 
-typedef struct threshold_type_t {
-    // TODO: Add any additional parameters here
-    REAL threshold_value;
-    REAL my_param;
-} threshold_type_t;
+// TODO: Add any additional parameters to the schema in
+// python_models8/neuron/threshold_types/my_threshold_type.py and regenerate
+#include "my_threshold_type_struct.h"
 
 static inline bool threshold_type_is_above_threshold(state_t value,
         threshold_type_t *threshold_type) {
@@ -0,0 +1,16 @@
+// Generated from the schema python_models8.neuron.threshold_types.my_threshold_type:SCHEMA
+// by python_models8.utilities.struct_schema; update the schema and
+// regenerate this rather than editing it
+#ifndef _MY_THRESHOLD_TYPE_STRUCT_H_
+#define _MY_THRESHOLD_TYPE_STRUCT_H_
+
+#include <common/neuron-typedefs.h>
+
+typedef struct threshold_type_t {
+    //! threshold_value [mV]
+    REAL threshold_value;
+    //! my_threshold_parameter
+    REAL my_param;
+} threshold_type_t;
+
+#endif // _MY_THRESHOLD_TYPE_STRUCT_H_
@@ -0,0 +1,148 @@
+/*
+ * Copyright (c) 2021 The University of Manchester
+ *
+ * This program is free software: you can redistribute it and/or modify
+ * it under the terms of the GNU General Public License as published by
+ * the Free Software Foundation, either version 3 of the License, or
+ * (at your option) any later version.
+ *
+ * This program is distributed in the hope that it will be useful,
+ * but WITHOUT ANY WARRANTY; without even the implied warranty of
+ * MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+ * GNU General Public License for more details.
+ *
+ * You should have received a copy of the GNU General Public License
+ * along with this program.  If not, see <http://www.gnu.org/licenses/>.
+ */
+
+//! \file
+//! \brief The connection generators of the synapse expander, with the
+//!     generator of MyConnector added to those of sPyNNaker
+//! \details This replaces connection_generator.c of sPyNNaker in the
+//!     expander binaries built by this project, and implements the same
+//!     interface (connection_generator.h)
+#include <connection_generator.h>
+#include <spin1_api.h>
+#include <debug.h>
+
+#include <generators/connection_generator_one_to_one.h>
+#include <generators/connection_generator_all_to_all.h>
+#include <generators/connection_generator_fixed_prob.h>
+#include <generators/connection_generator_fixed_total.h>
+#include <generators/connection_generator_fixed_pre.h>
+#include <generators/connection_generator_fixed_post.h>
+#include <generators/connection_generator_kernel.h>
+#include <my_models/connection_generators/connection_generator_my_connector.h>
+
+//! \brief The IDs of the generators; the first must match ConnectorIDs of
+//!     sPyNNaker and the last MY_CONNECTOR_ID in my_connector.py
+enum {
+    ONE_TO_ONE = 0,
+    ALL_TO_ALL = 1,
+    FIXED_PROBABILITY = 2,
+    FIXED_TOTAL = 3,
+    FIXED_PRE = 4,
+    FIXED_POST = 5,
+    KERNEL = 6,
+    MY_CONNECTOR = 128
+};
+
+//! The functions of a generator, found by its ID
+typedef struct connection_generator_info {
+    //! The ID of the generator
+    uint32_t hash;
+    //! Initialise the generator from its parameters
+    void *(*initialize)(address_t *region);
+    //! Generate the connections of one presynaptic neuron
+    uint32_t (*generate)(
+            void *generator, uint32_t pre_slice_start,
+            uint32_t pre_slice_count, uint32_t pre_neuron_index,
+            uint32_t post_slice_start, uint32_t post_slice_count,
+            uint32_t max_row_length, uint16_t *indices);
+    //! Free the data of the generator
+    void (*free)(void *generator);
+} connection_generator_info;
+
+//! The known generators
+static const connection_generator_info connection_generators[] = {
+    {ONE_TO_ONE,
+            connection_generator_one_to_one_initialise,
+            connection_generator_one_to_one_generate,
+            connection_generator_one_to_one_free},
+    {ALL_TO_ALL,
+            connection_generator_all_to_all_initialise,
+            connection_generator_all_to_all_generate,
+            connection_generator_all_to_all_free},
+    {FIXED_PROBABILITY,
+            connection_generator_fixed_prob_initialise,
+            connection_generator_fixed_prob_generate,
+            connection_generator_fixed_prob_free},
+    {FIXED_TOTAL,
+            connection_generator_fixed_total_initialise,
+            connection_generator_fixed_total_generate,
+            connection_generator_fixed_total_free},
+    {FIXED_PRE,
+            connection_generator_fixed_pre_initialise,
+            connection_generator_fixed_pre_generate,
+            connection_generator_fixed_pre_free},
+    {FIXED_POST,
+            connection_generator_fixed_post_initialise,
+            connection_generator_fixed_post_generate,
+            connection_generator_fixed_post_free},
+    {KERNEL,
+            connection_generator_kernel_initialise,
+            connection_generator_kernel_generate,
+            connection_generator_kernel_free},
+    {MY_CONNECTOR,
+            connection_generator_my_connector_initialise,
+            connection_generator_my_connector_generate,
+            connection_generator_my_connector_free}
+};
+
+//! The number of known generators
+#define N_CONNECTION_GENERATORS \
+    (sizeof(connection_generators) / sizeof(connection_generators[0]))
+
+//! A generator of a particular type with its data
+struct connection_generator {
+    //! The functions of the generator
+    const connection_generator_info *type;
+    //! The data of the generator
+    void *data;
+};
+
+connection_generator_t connection_generator_init(
+        uint32_t hash, address_t *in_region) {
+    for (uint32_t i = 0; i < N_CONNECTION_GENERATORS; i++) {
+        const connection_generator_info *type = &connection_generators[i];
+        if (hash == type->hash) {
+            connection_generator_t generator =
+                    spin1_malloc(sizeof(struct connection_generator));
+            if (generator == NULL) {
+                log_error("Could not create connection generator");
+                return NULL;
+            }
+            generator->type = type;
+            generator->data = type->initialize(in_region);
+            return generator;
+        }
+    }
+    log_error("Connection generator with hash %u not found", hash);
+    return NULL;
+}
+
+uint32_t connection_generator_generate(
+        connection_generator_t generator, uint32_t pre_slice_start,
+        uint32_t pre_slice_count, uint32_t pre_neuron_index,
+        uint32_t post_slice_start, uint32_t post_slice_count,
+        uint32_t max_row_length, uint16_t *indices) {
+    return generator->type->generate(
+            generator->data, pre_slice_start, pre_slice_count,
+            pre_neuron_index, post_slice_start, post_slice_count,
+            max_row_length, indices);
+}
+
+void connection_generator_free(connection_generator_t generator) {
+    generator->type->free(generator->data);
+    sark_free(generator);
+}
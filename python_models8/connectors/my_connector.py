@@ -1,95 +1,320 @@
+import os
+import numpy
+from spinn_utilities.overrides import overrides
+from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spynnaker.pyNN.models.abstract_models import SYNAPSE_EXPANDER_APLX
 from spynnaker.pyNN.models.neural_projections.connectors import (
-    AbstractConnector)
+    AbstractConnector, AbstractGenerateConnectorOnMachine)
+from spynnaker.pyNN.models.utility_models.delays import DELAY_EXPANDER_APLX
+from python_models8 import model_binaries
 
+#: The ID of the connection generator in the synapse expander; matches
+#: MY_CONNECTOR in my_connection_generator.c, clear of the IDs of sPyNNaker
+MY_CONNECTOR_ID = 128
 
-class MyConnector(AbstractConnector):
-    """ Connects two vertices with some thing.
+#: The number of words of connector parameters: n_neighbours, exclude_self
+N_GEN_PARAMS = 2
+
+#: The expanders that know MY_CONNECTOR, as built by c_models/makefiles
+#: under the names sPyNNaker runs them by
+EXPANDER_BINARIES = (SYNAPSE_EXPANDER_APLX, DELAY_EXPANDER_APLX)
+
+
+def _expanders_in_use():
+    """ Whether the expanders that sPyNNaker will run are those in the\
+        model binaries that know MY_CONNECTOR, rather than its own
+
+    Which is found depends on the order the binary search paths were\
+    registered in, so the paths found are checked rather than assumed.
+
+    :rtype: bool
+    """
+    # pylint: disable=protected-access
+    finder = globals_variables.get_simulator()._executable_finder
+    directory = os.path.realpath(os.path.dirname(model_binaries.__file__))
+    for binary in EXPANDER_BINARIES:
+        try:
+            path = finder.get_executable_path(binary)
+        except KeyError:
+            return False
+        if os.path.dirname(os.path.realpath(path)) != directory:
+            return False
+    return True
+
+
+def _is_list(values):
+    """ Whether weights or delays are given as one value per connection
+
+    :rtype: bool
+    """
+    return not isinstance(values, str) and hasattr(values, "__getitem__")
+
+
+class MyConnector(AbstractGenerateConnectorOnMachine):
+    """ Connects each presynaptic neuron ``i`` to every postsynaptic neuron\
+        ``j`` with ``abs(i - j) <= n_neighbours``; the connection matrix is\
+        a band of ``2 * n_neighbours + 1`` diagonals.
+
+    Connections are ordered by source and then by target, which is the order\
+    in which a list of weights or delays is consumed.  With constant or\
+    supported random weights and delays, the synapse expander built in\
+    ``c_models/makefiles`` generates the matrix on the machine from the two\
+    connector parameters and the seeds of the weights and delays; unless it\
+    has been built and is the expander sPyNNaker will run, the matrix is\
+    generated on the host.
     """
+    __slots__ = ["__allow_self_connections", "__n_neighbours"]
 
-    def __init__(self, weights=0.0, delays=1, allow_self_connections=True
-                 # TODO: Add your parameters here
-                 ):
+    def __init__(self, n_neighbours=1, allow_self_connections=True,
+                 safe=True, callback=None, verbose=False):
         """ Creates a new MyConnector
 
-        :param weights: The weight of the connector.
-        :type weights: float or iterable(float)
-        :param delays: The inherent delay of the connector, in ms.
-        :type delays: float or iterable(float)
+        :param int n_neighbours:
+            The number of postsynaptic neurons on each side of ``i`` that\
+            presynaptic neuron ``i`` connects to
         :param bool allow_self_connections:
-            Whether this connector allows a vertex to connect to itself.
+            If the connector is used to connect a Population to itself,\
+            whether a neuron is allowed to connect to itself
+        :param bool safe:
+            If ``True``, check that weights and delays have valid values.
+        :param callable callback: Ignored
+        :param bool verbose:
+            Whether to output extra information about the connectivity
         """
-        super().__init__()
-        self._weights = weights
-        self._delays = delays
-        self._allow_self_connections = allow_self_connections
+        super().__init__(safe, callback, verbose)
+        if n_neighbours < 0:
+            raise ValueError("n_neighbours must not be negative")
+        self.__n_neighbours = int(n_neighbours)
+        self.__allow_self_connections = bool(allow_self_connections)
 
-        # TODO: Store any additional parameters
+    @property
+    def n_neighbours(self):
+        """ The number of neighbours on each side of the diagonal
 
-    def get_delay_maximum(self):
-        """ Get the maximum delay specified by the user in ms, or None if\
-            unbounded
+        :rtype: int
         """
-        # TODO: update accordingly
-        return 16
+        return self.__n_neighbours
 
-    def create_synaptic_block(
-            self, pre_slices, pre_slice_index, post_slices, post_slice_index,
-            pre_vertex_slice, post_vertex_slice, synapse_type):
-        """ Create a synaptic block from the data
+    @property
+    def allow_self_connections(self):
+        """ Whether a neuron may connect to itself
+
+        :rtype: bool
         """
-        # TODO: update accordingly
-        pass
+        return self.__allow_self_connections
 
-    def get_weight_variance(
-            self, pre_slices, pre_slice_index, post_slices, post_slice_index,
-            pre_vertex_slice, post_vertex_slice):
-        """ Get the variance of the weights
+    def _excludes_self(self, synapse_info):
+        """ Whether the diagonal of the band is left out
+
+        :param SynapseInformation synapse_info:
+        :rtype: bool
         """
-        # TODO: update accordingly
-        pass
+        return (not self.__allow_self_connections and
+                synapse_info.pre_population is synapse_info.post_population)
+
+    def _band(self, indices, lo_atom, hi_atom):
+        """ Get the first and last atom in ``[lo_atom, hi_atom]`` connected\
+            to each of the given atoms of the other side; the band is empty\
+            where the last is before the first
 
-    def generate_on_machine(self):
-        """ Determines if the connector generation is supported on the machine\
-            or if the connector must be generated on the host
+        :param ~numpy.ndarray indices: The atoms of the other side
+        :param int lo_atom: The first atom that may be connected
+        :param int hi_atom: The last atom that may be connected
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
         """
-        # TODO: update accordingly
-        pass
+        return (numpy.maximum(indices - self.__n_neighbours, lo_atom),
+                numpy.minimum(indices + self.__n_neighbours, hi_atom))
+
+    def _band_lengths(self, indices, lo_atom, hi_atom, exclude_self):
+        """ Get the number of atoms in ``[lo_atom, hi_atom]`` connected to\
+            each of the given atoms of the other side
 
-    def get_weight_maximum(
-            self, pre_slices, pre_slice_index, post_slices, post_slice_index,
-            pre_vertex_slice, post_vertex_slice):
-        """ Get the maximum of the weights for this connection
+        :param ~numpy.ndarray indices: The atoms of the other side
+        :param int lo_atom: The first atom that may be connected
+        :param int hi_atom: The last atom that may be connected
+        :param bool exclude_self: Whether the diagonal is left out
+        :rtype: ~numpy.ndarray
         """
-        # TODO: update accordingly
-        pass
-
-    def get_n_connections_to_post_vertex_maximum(
-            self, pre_slices, pre_slice_index, post_slices, post_slice_index,
-            pre_vertex_slice, post_vertex_slice):
-        """ Get the maximum number of connections between those from each of\
-            the neurons in the pre_vertex_slice to neurons in the\
-            post_vertex_slice, for connections with a delay between min_delay\
-            and max_delay (inclusive) if both specified\
-            (otherwise all connections)
+        first, last = self._band(indices, lo_atom, hi_atom)
+        lengths = numpy.maximum(last - first + 1, 0)
+        if exclude_self:
+            lengths -= (indices >= lo_atom) & (indices <= hi_atom)
+        return lengths
+
+    def _max_band_length(self, lo_atom, hi_atom, n_other, exclude_self):
+        """ Get the most atoms in ``[lo_atom, hi_atom]`` connected to any one\
+            atom of the other side, which has ``n_other`` atoms
+
+        The relation is symmetric, so this bounds both rows and columns.
+
+        :rtype: int
         """
-        # TODO: update accordingly
-        pass
+        indices = numpy.arange(
+            max(lo_atom - self.__n_neighbours, 0),
+            min(hi_atom + self.__n_neighbours, n_other - 1) + 1)
+        if not len(indices):
+            return 0
+        return int(numpy.max(self._band_lengths(
+            indices, lo_atom, hi_atom, exclude_self)))
+
+    def _n_connections(self, synapse_info):
+        """ Get the total number of connections of the projection
 
-    def get_weight_mean(
-            self, pre_slices, pre_slice_index, post_slices, post_slice_index,
-            pre_vertex_slice, post_vertex_slice):
-        """ Get the mean of the weights for this connection
+        :param SynapseInformation synapse_info:
+        :rtype: int
         """
-        # TODO: update accordingly
-        pass
+        return int(numpy.sum(self._band_lengths(
+            numpy.arange(synapse_info.n_pre_neurons), 0,
+            synapse_info.n_post_neurons - 1,
+            self._excludes_self(synapse_info))))
+
+    @overrides(AbstractConnector.get_delay_maximum)
+    def get_delay_maximum(self, synapse_info):
+        n_connections = self._n_connections(synapse_info)
+        if not n_connections:
+            # A list of delays is empty, so has no maximum
+            return 0
+        return self._get_delay_maximum(
+            synapse_info.delays, n_connections, synapse_info)
 
+    @overrides(AbstractConnector.get_delay_minimum)
+    def get_delay_minimum(self, synapse_info):
+        n_connections = self._n_connections(synapse_info)
+        if not n_connections:
+            return 0
+        return self._get_delay_minimum(
+            synapse_info.delays, n_connections, synapse_info)
+
+    @overrides(AbstractConnector.get_n_connections_from_pre_vertex_maximum)
     def get_n_connections_from_pre_vertex_maximum(
-            self, pre_slices, pre_slice_index, post_slices, post_slice_index,
-            pre_vertex_slice, post_vertex_slice, min_delay=None,
+            self, post_vertex_slice, synapse_info, min_delay=None,
             max_delay=None):
-        """ Get the maximum number of connections between those to each of the\
-            neurons in the post_vertex_slice from neurons in the\
-            pre_vertex_slice
+        # pylint: disable=too-many-arguments
+        n_connections = self._max_band_length(
+            post_vertex_slice.lo_atom, post_vertex_slice.hi_atom,
+            synapse_info.n_pre_neurons, self._excludes_self(synapse_info))
+        if min_delay is None or max_delay is None or not n_connections:
+            return n_connections
+        return self._get_n_connections_from_pre_vertex_with_delay_maximum(
+            synapse_info.delays, self._n_connections(synapse_info),
+            n_connections, min_delay, max_delay, synapse_info)
+
+    @overrides(AbstractConnector.get_n_connections_to_post_vertex_maximum)
+    def get_n_connections_to_post_vertex_maximum(self, synapse_info):
+        return self._max_band_length(
+            0, synapse_info.n_pre_neurons - 1, synapse_info.n_post_neurons,
+            self._excludes_self(synapse_info))
+
+    @overrides(AbstractConnector.get_weight_maximum)
+    def get_weight_maximum(self, synapse_info):
+        n_connections = self._n_connections(synapse_info)
+        if not n_connections:
+            return 0
+        return self._get_weight_maximum(
+            synapse_info.weights, n_connections, synapse_info)
+
+    @overrides(AbstractConnector.could_connect)
+    def could_connect(self, _synapse_info, _pre_slice, _post_slice):
+        if self.__n_neighbours == 0 and self._excludes_self(_synapse_info):
+            return False
+        return (
+            _post_slice.lo_atom <= _pre_slice.hi_atom + self.__n_neighbours
+            and
+            _post_slice.hi_atom >= _pre_slice.lo_atom - self.__n_neighbours)
+
+    def _connection_slices(self, sources, targets, synapse_info):
+        """ Get the runs of the indices of the given connections in the\
+            connections of the whole projection
+
+        :param ~numpy.ndarray sources: The sources, in order
+        :param ~numpy.ndarray targets: The targets, in order
+        :param SynapseInformation synapse_info:
+        :rtype: list(slice)
         """
-        # TODO: update accordingly
-        pass
+        exclude_self = self._excludes_self(synapse_info)
+        lengths = self._band_lengths(
+            numpy.arange(synapse_info.n_pre_neurons), 0,
+            synapse_info.n_post_neurons - 1, exclude_self)
+        row_starts = numpy.cumsum(lengths) - lengths
+        first, _ = self._band(sources, 0, synapse_info.n_post_neurons - 1)
+        ids = row_starts[sources] + (targets - first)
+        if exclude_self:
+            ids -= targets > sources
+        breaks = numpy.flatnonzero(numpy.diff(ids) != 1) + 1
+        starts = ids[numpy.concatenate(([0], breaks))]
+        stops = ids[numpy.concatenate((breaks - 1, [len(ids) - 1]))] + 1
+        return [slice(start, stop) for start, stop in zip(starts, stops)]
+
+    @overrides(AbstractConnector.create_synaptic_block)
+    def create_synaptic_block(
+            self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
+            synapse_type, synapse_info):
+        # pylint: disable=too-many-arguments
+        pre_atoms = numpy.arange(
+            pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1)
+        first, last = self._band(
+            pre_atoms, post_vertex_slice.lo_atom, post_vertex_slice.hi_atom)
+        lengths = numpy.maximum(last - first + 1, 0)
+        n_band = int(numpy.sum(lengths))
+
+        # Expand each row into its run of targets in one pass
+        sources = numpy.repeat(pre_atoms, lengths)
+        row_starts = numpy.repeat(numpy.cumsum(lengths) - lengths, lengths)
+        targets = (
+            numpy.repeat(first, lengths) + numpy.arange(n_band) - row_starts)
+        if self._excludes_self(synapse_info):
+            keep = sources != targets
+            sources = sources[keep]
+            targets = targets[keep]
+
+        n_connections = len(sources)
+        if not n_connections:
+            return numpy.zeros(0, dtype=self.NUMPY_SYNAPSES_DTYPE)
+        connection_slices = None
+        if _is_list(synapse_info.weights) or _is_list(synapse_info.delays):
+            connection_slices = self._connection_slices(
+                sources, targets, synapse_info)
+
+        block = numpy.zeros(n_connections, dtype=self.NUMPY_SYNAPSES_DTYPE)
+        block["source"] = sources
+        block["target"] = targets
+        block["weight"] = self._generate_weights(
+            block["source"], block["target"], n_connections,
+            connection_slices, pre_vertex_slice, post_vertex_slice,
+            synapse_info)
+        block["delay"] = self._generate_delays(
+            block["source"], block["target"], n_connections,
+            connection_slices, pre_vertex_slice, post_vertex_slice,
+            synapse_info)
+        block["synapse_type"] = synapse_type
+        return block
+
+    def __repr__(self):
+        return (
+            "MyConnector(n_neighbours={}, allow_self_connections={})".format(
+                self.__n_neighbours, self.__allow_self_connections))
+
+    @overrides(AbstractGenerateConnectorOnMachine.generate_on_machine)
+    def generate_on_machine(self, weights, delays):
+        return super().generate_on_machine(weights, delays) and \
+            _expanders_in_use()
+
+    @property
+    @overrides(AbstractGenerateConnectorOnMachine.gen_connector_id)
+    def gen_connector_id(self):
+        return MY_CONNECTOR_ID
+
+    @overrides(AbstractGenerateConnectorOnMachine.gen_connector_params)
+    def gen_connector_params(
+            self, pre_slices, post_slices, pre_vertex_slice, post_vertex_slice,
+            synapse_type, synapse_info):
+        return numpy.array(
+            [self.__n_neighbours, self._excludes_self(synapse_info)],
+            dtype="uint32")
+
+    @property
+    @overrides(
+        AbstractGenerateConnectorOnMachine.gen_connector_params_size_in_bytes)
+    def gen_connector_params_size_in_bytes(self):
+        return N_GEN_PARAMS * BYTES_PER_WORD
@@ -0,0 +1,175 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spynnaker8 import (
+    Population, Projection, FromListConnector, OneToOneConnector,
+    StaticSynapse)
+from python_models8.neuron.builds.my_if_curr_exp_sEMD import MyIFCurrExpSEMD
+
+#: The preferred directions of motion of a detector field, as the (x, y)
+#: step from the facilitating pixel to the triggering pixel, with y down
+DIRECTIONS = {
+    "right": (1, 0),
+    "left": (-1, 0),
+    "down": (0, 1),
+    "up": (0, -1)
+}
+
+
+def facilitation_pairs(width, height, dx, dy):
+    """ Get the (pre, post) index pairs that connect each pixel of a\
+        row-major grid to the detector a step of (dx, dy) away
+
+    Detectors whose facilitating pixel lies outside the grid get no pair.
+
+    :param int width: The number of pixels in each row
+    :param int height: The number of rows
+    :param int dx: The step in x from the facilitating pixel
+    :param int dy: The step in y from the facilitating pixel
+    :return: An array of shape (n_pairs, 2)
+    :rtype: ~numpy.ndarray
+    """
+    post_y, post_x = numpy.divmod(numpy.arange(width * height), width)
+    pre_x = post_x - dx
+    pre_y = post_y - dy
+    valid = (
+        (pre_x >= 0) & (pre_x < width) & (pre_y >= 0) & (pre_y < height))
+    return numpy.column_stack((
+        pre_y[valid] * width + pre_x[valid],
+        post_y[valid] * width + post_x[valid]))
+
+
+class SEMDField(object):
+    """ A field of spiking elementary motion detectors over a grid of input\
+        pixels, with one population of :py:class:`MyIFCurrExpSEMD` per\
+        preferred direction.
+
+    Detector ``y * width + x`` of each direction is triggered by input pixel\
+    ``y * width + x`` on its inhibitory receptor and facilitated by the\
+    pixel one spacing upstream on its excitatory receptor.
+    """
+    __slots__ = [
+        "__height", "__populations", "__projections", "__width"]
+
+    def __init__(
+            self, source, width, height, cell_params=None,
+            directions=None, spacing=1, weight=1.0,
+            facilitation_delay=None, trigger_delay=None, label="sEMD"):
+        """
+        :param source: The input population, one neuron per pixel in\
+            row-major order
+        :type source: ~spynnaker8.Population or ~spynnaker8.PopulationView
+        :param int width: The number of pixels in each row
+        :param int height: The number of rows
+        :param cell_params: The parameters of every detector
+        :type cell_params: dict(str, object) or None
+        :param directions: The preferred directions to build, by name;\
+            defaults to :py:data:`DIRECTIONS`
+        :type directions: dict(str, tuple(int, int)) or None
+        :param int spacing: The distance in pixels between the facilitating\
+            and triggering pixels
+        :param float weight: The weight of every connection
+        :param facilitation_delay: The delay of the facilitating\
+            connections, or None for the default
+        :type facilitation_delay: float or None
+        :param trigger_delay: The delay of the triggering connections, or\
+            None for the default
+        :type trigger_delay: float or None
+        :param str label: The prefix of the population labels
+        """
+        if source.size != width * height:
+            raise ValueError(
+                "The source has {} neurons but the grid has {} pixels".format(
+                    source.size, width * height))
+        if cell_params is None:
+            cell_params = dict()
+        if directions is None:
+            directions = DIRECTIONS
+        self.__width = width
+        self.__height = height
+        self.__populations = dict()
+        self.__projections = dict()
+
+        facilitation = StaticSynapse(weight=weight, delay=facilitation_delay)
+        trigger = StaticSynapse(weight=weight, delay=trigger_delay)
+        for name, (dx, dy) in directions.items():
+            population = Population(
+                width * height, MyIFCurrExpSEMD(**cell_params),
+                label="{}_{}".format(label, name))
+            pairs = facilitation_pairs(
+                width, height, dx * spacing, dy * spacing)
+            self.__populations[name] = population
+            self.__projections[name] = (
+                Projection(
+                    source, population, FromListConnector(pairs),
+                    receptor_type="excitatory", synapse_type=facilitation),
+                Projection(
+                    source, population, OneToOneConnector(),
+                    receptor_type="inhibitory", synapse_type=trigger))
+
+    @property
+    def width(self):
+        """ The number of pixels in each row
+
+        :rtype: int
+        """
+        return self.__width
+
+    @property
+    def height(self):
+        """ The number of rows
+
+        :rtype: int
+        """
+        return self.__height
+
+    @property
+    def populations(self):
+        """ The detector population of each direction
+
+        :rtype: dict(str, ~spynnaker8.Population)
+        """
+        return self.__populations
+
+    @property
+    def projections(self):
+        """ The facilitating and triggering projections of each direction
+
+        :rtype: dict(str, tuple(~spynnaker8.Projection,
+            ~spynnaker8.Projection))
+        """
+        return self.__projections
+
+    def record(self, variables):
+        """ Record variables of every detector
+
+        :param variables: The variables to record
+        :type variables: str or list(str)
+        """
+        for population in self.__populations.values():
+            population.record(variables)
+
+    def get_data(self, variables):
+        """ Get recorded data of every detector
+
+        :param variables: The variables to get
+        :type variables: str or list(str)
+        :return: The data of each direction
+        :rtype: dict(str, ~neo.core.Block)
+        """
+        return {
+            name: population.get_data(variables)
+            for name, population in self.__populations.items()}
@@ -0,0 +1,74 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.classproperty import classproperty
+from spynnaker.pyNN.models.defaults import get_dict_from_init
+from spynnaker.pyNN.models.neuron import (
+    AbstractPyNNNeuronModel, AbstractPyNNNeuronModelStandard)
+from python_models8.neuron.implementations.qif_neuron_impl import (
+    QIFNeuronImpl)
+
+#: The arguments of the QIF builds that configure the model as a whole, and
+#: so are held once per core, rather than being parameters of each neuron
+_NONE_PYNN_PARAMETERS = frozenset([
+    "n_substeps", "active_set", "expected_activity", "burst"])
+
+
+class AbstractPyNNQIFModelStandard(AbstractPyNNNeuronModelStandard):
+    """ A QIF neuron model that follows the sPyNNaker standard composed\
+        model pattern, using an implementation that can also record the\
+        fraction of the timestep at which each spike happened.
+    """
+
+    __slots__ = []
+
+    @classproperty
+    def default_parameters(cls):  # pylint: disable=no-self-argument
+        return {
+            name: value
+            for name, value in super().default_parameters.items()
+            if name not in _NONE_PYNN_PARAMETERS}
+
+    @classproperty
+    def none_pynn_default_parameters(cls):  # pylint: disable=no-self-argument
+        """ Get the default values of the arguments that configure how the\
+            model is built, rather than its neurons
+
+        :rtype: dict(str, Any)
+        """
+        return get_dict_from_init(
+            cls.__init__._method, include=_NONE_PYNN_PARAMETERS)
+
+    def __init__(
+            self, model_name, binary, neuron_model, input_type,
+            synapse_type, threshold_type, additional_input_type=None):
+        """
+        :param str model_name: Name of the model.
+        :param str binary: Name of the implementation executable.
+        :param AbstractNeuronModel neuron_model: The model of the neuron soma
+        :param AbstractInputType input_type: The model of synaptic input types
+        :param AbstractSynapseType synapse_type:
+            The model of the synapses' dynamics
+        :param AbstractThresholdType threshold_type:
+            The model of the firing threshold
+        :param additional_input_type:
+            The model (if any) of additional environmental inputs
+        :type additional_input_type: AbstractAdditionalInput or None
+        """
+        # pylint: disable=non-parent-init-called, super-init-not-called
+        # The standard model would build a NeuronImplStandard
+        AbstractPyNNNeuronModel.__init__(self, QIFNeuronImpl(
+            model_name, binary, neuron_model, input_type, synapse_type,
+            threshold_type, additional_input_type))
@@ -1,7 +1,10 @@
+from spinn_utilities.overrides import overrides
 from spynnaker.pyNN.models.neuron import AbstractPyNNNeuronModel
 from spynnaker.pyNN.models.defaults import default_parameters
 from python_models8.neuron.implementations.my_full_neuron_impl import (
     MyFullNeuronImpl)
+from python_models8.neuron.full_neuron_population_vertex import (
+    FullNeuronPopulationVertex)
 
 
 class MyFullNeuron(AbstractPyNNNeuronModel):
@@ -9,3 +12,17 @@ class MyFullNeuron(AbstractPyNNNeuronModel):
     @default_parameters({"threshold"})
     def __init__(self, threshold=10.0, v=0.0, exc_input=0.0, inh_input=0.0):
         super().__init__(MyFullNeuronImpl(threshold, v, exc_input, inh_input))
+
+    @overrides(AbstractPyNNNeuronModel.create_vertex)
+    def create_vertex(
+            self, n_neurons, label, constraints, spikes_per_second,
+            ring_buffer_sigma, incoming_spike_buffer_size, drop_late_spikes,
+            splitter):
+        # The state is read back from the machine only when asked for, and
+        # the neurons are spread over as few cores as they will fit on
+        max_atoms = self._model.get_max_atoms_per_core(
+            self.get_max_atoms_per_core())
+        return FullNeuronPopulationVertex(
+            n_neurons, label, constraints, max_atoms, spikes_per_second,
+            ring_buffer_sigma, incoming_spike_buffer_size, self._model,
+            self, drop_late_spikes, splitter)
@@ -1,12 +1,25 @@
-from spynnaker.pyNN.models.defaults import default_initial_values
+from spinn_utilities.classproperty import classproperty
+from spinn_utilities.overrides import overrides
+from spynnaker.pyNN.models.defaults import (
+    default_initial_values, get_dict_from_init)
 from spynnaker.pyNN.models.neuron.neuron_models import (
     NeuronModelLeakyIntegrateAndFire)
-from spynnaker.pyNN.models.neuron import AbstractPyNNNeuronModelStandard
+from spynnaker.pyNN.models.neuron import (
+    AbstractPyNNNeuronModel, AbstractPyNNNeuronModelStandard)
 from spynnaker.pyNN.models.neuron.synapse_types import SynapseTypeExponential
+from python_models8.neuron.implementations.my_neuron_impl_semd import (
+    MyNeuronImplSEMD)
 from python_models8.neuron.input_types.my_input_type_semd import (
     MyInputTypeCurrentSEMD)
+from python_models8.neuron.semd_population_vertex import SEMDPopulationVertex
 from spynnaker.pyNN.models.neuron.threshold_types import ThresholdTypeStatic
 
+#: The arguments that configure how the model is built, rather than PyNN
+#: parameters of its neurons
+_NONE_PYNN_PARAMETERS = frozenset([
+    "active_set", "expected_activity", "recording_interval",
+    "recording_aggregation"])
+
 
 class MyIFCurrExpSEMD(AbstractPyNNNeuronModelStandard):
     """ Leaky integrate and fire neuron with an exponentially decaying \
@@ -14,15 +27,56 @@ class MyIFCurrExpSEMD(AbstractPyNNNeuronModelStandard):
         input (see https://www.cit-ec.de/en/nbs/spiking-insect-vision)
         Note: this is an older version of the sEMD model in sPyNNaker that
         required a new implementation C file in order to make it work.
+
+    :param bool active_set:
+        Whether to skip the update of a neuron that has no input and has
+        settled at rest, until it receives input again; the voltage of a
+        skipped neuron is brought forward when it is next updated
+    :param float expected_activity:
+        The fraction of neuron updates expected not to be skipped in
+        active-set mode, used to estimate the processing cost
+    :param recording_interval:
+        The time in ms between recordings of v, gsyn_exc and gsyn_inh, which
+        become the default sampling interval of those variables; None
+        records them every time step
+    :type recording_interval: float or None
+    :param str recording_aggregation:
+        How each recording of v, gsyn_exc and gsyn_inh summarises the
+        interval ending with it: "sample" for the value at its end, or
+        "mean", "min" or "max" over it, worked out on the core
+
+    These four are set for the whole population when the model is created,\
+    and are not parameters of its neurons that can be read or set through\
+    PyNN.
     """
 
+    @classproperty
+    def default_parameters(cls):  # pylint: disable=no-self-argument
+        return {
+            name: value
+            for name, value in super().default_parameters.items()
+            if name not in _NONE_PYNN_PARAMETERS}
+
+    @classproperty
+    def none_pynn_default_parameters(cls):  # pylint: disable=no-self-argument
+        """ Get the default values of the arguments that configure how the\
+            model is built, rather than its neurons
+
+        :rtype: dict(str, Any)
+        """
+        return get_dict_from_init(
+            cls.__init__._method, include=_NONE_PYNN_PARAMETERS)
+
     @default_initial_values({"v", "isyn_exc", "isyn_inh",
                              "my_inh_input_previous"})
     def __init__(
             self, tau_m=20.0, cm=1.0, v_rest=-65.0, v_reset=-65.0,
             v_thresh=-50.0, tau_syn_E=5.0, tau_syn_I=5.0, tau_refrac=0.1,
             i_offset=0.0, v=-65.0, isyn_exc=0.0, isyn_inh=0.0,
-            my_multiplicator=0.0, my_inh_input_previous=0.0):
+            my_multiplicator=0.0, my_inh_input_previous=0.0,
+            active_set=False, expected_activity=1.0,
+            recording_interval=None, recording_aggregation="sample"):
+        # pylint: disable=too-many-arguments
 
         neuron_model = NeuronModelLeakyIntegrateAndFire(
             v, v_rest, tau_m, cm, i_offset, v_reset, tau_refrac)
@@ -32,8 +86,23 @@ class MyIFCurrExpSEMD(AbstractPyNNNeuronModelStandard):
             my_multiplicator, my_inh_input_previous)
         threshold_type = ThresholdTypeStatic(v_thresh)
 
-        super().__init__(
-            model_name="my_if_curr_exp_sEMD",
-            binary="my_if_curr_exp_sEMD.aplx",
-            neuron_model=neuron_model, input_type=input_type,
-            synapse_type=synapse_type, threshold_type=threshold_type)
+        # pylint: disable=non-parent-init-called, super-init-not-called
+        # The standard model would build a NeuronImplStandard
+        AbstractPyNNNeuronModel.__init__(self, MyNeuronImplSEMD(
+            "my_if_curr_exp_sEMD", "my_if_curr_exp_sEMD.aplx",
+            neuron_model, input_type, synapse_type, threshold_type,
+            active_set, expected_activity, recording_interval,
+            recording_aggregation))
+
+    @overrides(AbstractPyNNNeuronModelStandard.create_vertex)
+    def create_vertex(
+            self, n_neurons, label, constraints, spikes_per_second,
+            ring_buffer_sigma, incoming_spike_buffer_size,
+            n_steps_per_timestep, drop_late_spikes, splitter):
+        # pylint: disable=arguments-differ
+        self._model.n_steps_per_timestep = n_steps_per_timestep
+        max_atoms = self.get_max_atoms_per_core()
+        return SEMDPopulationVertex(
+            n_neurons, label, constraints, max_atoms, spikes_per_second,
+            ring_buffer_sigma, incoming_spike_buffer_size, self._model,
+            self, drop_late_spikes, splitter)
@@ -0,0 +1,77 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.overrides import overrides
+from spynnaker.pyNN.models.defaults import default_initial_values
+from spynnaker.pyNN.models.neuron import AbstractPyNNNeuronModel
+from python_models8.neuron.implementations.my_neuron_impl_semd_multi import (
+    MyNeuronImplSEMDMulti, N_DIRECTIONS)
+from python_models8.neuron.semd_site_splitter import SEMDSiteSplitter
+
+
+class MyIFCurrExpSEMDMulti(AbstractPyNNNeuronModel):
+    """ The sEMD neuron of\
+        :py:class:`~python_models8.neuron.builds.my_if_curr_exp_sEMD.\
+        MyIFCurrExpSEMD`, with the detectors of the four directions at each\
+        site of a motion field held together.
+
+    Neuron ``i`` of a population is the detector of direction\
+    ``i % 4`` at site ``i // 4``, so the population size must be a multiple\
+    of 4. Each detector has its own facilitating (excitatory) and\
+    triggering (inhibitory) receptors, key and recordings; the remaining\
+    parameters must be the same for every detector of a site.  Unless\
+    another splitter is given, the population is split with\
+    :py:class:`~python_models8.neuron.semd_site_splitter.SEMDSiteSplitter`\
+    so that each core holds whole sites.
+    """
+
+    @default_initial_values({"v", "isyn_exc", "isyn_inh",
+                             "my_inh_input_previous"})
+    def __init__(
+            self, tau_m=20.0, cm=1.0, v_rest=-65.0, v_reset=-65.0,
+            v_thresh=-50.0, tau_syn_E=5.0, tau_syn_I=5.0, tau_refrac=0.1,
+            i_offset=0.0, v=-65.0, isyn_exc=0.0, isyn_inh=0.0,
+            my_multiplicator=0.0, my_inh_input_previous=0.0):
+        # pylint: disable=too-many-arguments
+        super().__init__(MyNeuronImplSEMDMulti(
+            tau_m, cm, v_rest, v_reset, v_thresh, tau_syn_E, tau_syn_I,
+            tau_refrac, i_offset, v, isyn_exc, isyn_inh, my_multiplicator,
+            my_inh_input_previous))
+
+    @classmethod
+    @overrides(AbstractPyNNNeuronModel.get_max_atoms_per_core)
+    def get_max_atoms_per_core(cls):
+        # A core holds whole sites
+        max_atoms = super().get_max_atoms_per_core()
+        return max(max_atoms - max_atoms % N_DIRECTIONS, N_DIRECTIONS)
+
+    @overrides(AbstractPyNNNeuronModel.create_vertex)
+    def create_vertex(
+            self, n_neurons, label, constraints, spikes_per_second,
+            ring_buffer_sigma, incoming_spike_buffer_size, drop_late_spikes,
+            splitter):
+        # pylint: disable=arguments-differ
+        if n_neurons % N_DIRECTIONS:
+            raise ValueError(
+                "A multi-direction sEMD population must have a multiple of "
+                "{} neurons".format(N_DIRECTIONS))
+        # Each core must hold whole sites, even when it has room for fewer
+        # than the maximum number of atoms
+        if splitter is None:
+            splitter = SEMDSiteSplitter(N_DIRECTIONS)
+        return super().create_vertex(
+            n_neurons, label, constraints, spikes_per_second,
+            ring_buffer_sigma, incoming_spike_buffer_size, drop_late_spikes,
+            splitter)
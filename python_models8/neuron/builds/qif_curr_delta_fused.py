@@ -0,0 +1,43 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spynnaker.pyNN.models.neuron import AbstractPyNNNeuronModel
+from spynnaker.pyNN.models.defaults import default_initial_values
+from python_models8.neuron.implementations.qif_curr_delta_fused_impl import (
+    QIFCurrDeltaFusedImpl)
+
+_IZK_THRESHOLD = 100.0
+
+
+class QIFCurrDeltaFused(AbstractPyNNNeuronModel):
+    """ QIF neuron model with delta current inputs, built as a single fused\
+        implementation that uses fewer cycles and less DTCM per neuron than\
+        :py:class:`~python_models8.neuron.builds.qif_curr_delta.QIFCurrDelta`
+
+    It differs from that model in that it has no ``burst`` mode, so a neuron\
+    spikes at most once per timestep, and so does not record\
+    ``spike_count``; ``n_substeps``, ``active_set`` and\
+    ``expected_activity`` are per-neuron parameters that can be ``set``.
+    """
+
+    # noinspection PyPep8Naming
+    @default_initial_values({"v", "isyn_exc", "isyn_inh"})
+    def __init__(self, c=-100.0, i_offset=0.0, v=-100.0, tau_refrac=0.002,
+                 isyn_exc=0.0, isyn_inh=0.0, n_substeps=1, active_set=False,
+                 expected_activity=1.0):
+        # pylint: disable=too-many-arguments
+        super().__init__(QIFCurrDeltaFusedImpl(
+            c, i_offset, v, tau_refrac, _IZK_THRESHOLD, isyn_exc, isyn_inh,
+            n_substeps, active_set, expected_activity))
@@ -16,16 +16,17 @@
 from spynnaker.pyNN.models.neuron.synapse_types import SynapseTypeExponential
 from spynnaker.pyNN.models.neuron.input_types import InputTypeCurrent
 from spynnaker.pyNN.models.neuron.threshold_types import ThresholdTypeStatic
-from spynnaker.pyNN.models.neuron import AbstractPyNNNeuronModelStandard
 from spynnaker.pyNN.models.defaults import default_initial_values
 
+from python_models8.neuron.builds.abstract_pynn_qif_model_standard import (
+    AbstractPyNNQIFModelStandard)
 from python_models8.neuron.neuron_models.neuron_model_quadratic_integrate_and_fire import (
     NeuronModelQuadraticIntegrateAndFire)
 
 _IZK_THRESHOLD = 100.0
 
 
-class QIFCurrExp(AbstractPyNNNeuronModelStandard):
+class QIFCurrExp(AbstractPyNNQIFModelStandard):
     """ Izhikevich neuron model with current inputs.
 
     :param a: :math:`a`
@@ -61,14 +62,29 @@ class QIFCurrExp(AbstractPyNNNeuronModelStandard):
     :param isyn_inh: :math:`I^{syn}_i`
     :type isyn_inh: float, iterable(float), ~pyNN.random.RandomDistribution
         or (mapping) function
+    :param n_substeps: The number of RK2 substeps integrated per time step
+    :type n_substeps: int
+    :param active_set:
+        Whether to skip updating neurons that are at rest with no input
+    :type active_set: bool
+    :param expected_activity: The fraction of updates expected not to be
+        skipped in active-set mode
+    :type expected_activity: float
+    :param burst: Whether a neuron can spike several times in one time\
+        step, which needs several substeps and ``tau_refrac=0``
+    :type burst: bool
     """
 
     # noinspection PyPep8Naming
     @default_initial_values({"v", "isyn_exc", "isyn_inh"})
     def __init__(self, c=-100.0, i_offset=0.0, v=-100.0, tau_refrac=0.002,
-        tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0):
+        tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0,
+        n_substeps=1, active_set=False, expected_activity=1.0,
+        burst=False):
         # pylint: disable=too-many-arguments, too-many-locals
-        neuron_model = NeuronModelQuadraticIntegrateAndFire(c, v, i_offset, tau_refrac)
+        neuron_model = NeuronModelQuadraticIntegrateAndFire(
+            c, v, i_offset, tau_refrac, n_substeps, _IZK_THRESHOLD,
+            active_set, expected_activity, burst)
         synapse_type = SynapseTypeExponential(
             tau_syn_E, tau_syn_I, isyn_exc, isyn_inh)
         input_type = InputTypeCurrent()
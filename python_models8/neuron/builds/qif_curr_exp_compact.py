@@ -0,0 +1,103 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.classproperty import classproperty
+from spynnaker.pyNN.models.neuron.synapse_types import SynapseTypeExponential
+from spynnaker.pyNN.models.neuron.input_types import InputTypeCurrent
+from spynnaker.pyNN.models.neuron.threshold_types import ThresholdTypeStatic
+from spynnaker.pyNN.models.neuron import AbstractPyNNNeuronModelStandard
+from spynnaker.pyNN.models.defaults import (
+    default_initial_values, get_dict_from_init)
+
+from python_models8.neuron.neuron_models.neuron_model_quadratic_integrate_and_fire_compact import (  # noqa: E501
+    NeuronModelQuadraticIntegrateAndFireCompact)
+
+_IZK_THRESHOLD = 100.0
+
+#: The arguments that configure the model as a whole rather than its neurons
+_NONE_PYNN_PARAMETERS = frozenset(["n_substeps"])
+
+
+class QIFCurrExpCompact(AbstractPyNNNeuronModelStandard):
+    """ QIF neuron model with exponentially decaying current inputs and a\
+        compact state layout, fitting about twice as many neurons on a core\
+        as :py:class:`QIFCurrExp` for large, homogeneous populations.
+
+    The voltage and offset current are held to 1/128 of a mV or nA within\
+    :math:`\\pm 256`, and :math:`c` and :math:`\\tau_{refrac}` must be the\
+    same for every neuron, including when they are ``set``.  The voltage\
+    moves only by steps of at least 1/128 mV a time step, and each substep\
+    must be at least 1/256 ms long.
+
+    :param float c: :math:`c`, within :math:`\\pm 256` mV
+    :param i_offset: :math:`I_{offset}`
+    :type i_offset: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param v: :math:`v_{init} = V_{init}`
+    :type v: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param float tau_refrac: :math:`\\tau_{refrac}`
+    :param tau_syn_E: :math:`\\tau^{syn}_e`
+    :type tau_syn_E: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param tau_syn_I: :math:`\\tau^{syn}_i`
+    :type tau_syn_I: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param isyn_exc: :math:`I^{syn}_e`
+    :type isyn_exc: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param isyn_inh: :math:`I^{syn}_i`
+    :type isyn_inh: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param int n_substeps:
+        The number of RK2 substeps integrated per time step, held once per
+        core
+    """
+
+    @classproperty
+    def default_parameters(cls):  # pylint: disable=no-self-argument
+        return {
+            name: value
+            for name, value in super().default_parameters.items()
+            if name not in _NONE_PYNN_PARAMETERS}
+
+    @classproperty
+    def none_pynn_default_parameters(cls):  # pylint: disable=no-self-argument
+        """ Get the default values of the arguments that configure how the\
+            model is built, rather than its neurons
+
+        :rtype: dict(str, Any)
+        """
+        return get_dict_from_init(
+            cls.__init__._method, include=_NONE_PYNN_PARAMETERS)
+
+    # noinspection PyPep8Naming
+    @default_initial_values({"v", "isyn_exc", "isyn_inh"})
+    def __init__(self, c=-100.0, i_offset=0.0, v=-100.0, tau_refrac=0.002,
+                 tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0,
+                 n_substeps=1):
+        # pylint: disable=too-many-arguments, too-many-locals
+        neuron_model = NeuronModelQuadraticIntegrateAndFireCompact(
+            c, v, i_offset, tau_refrac, n_substeps, _IZK_THRESHOLD)
+        synapse_type = SynapseTypeExponential(
+            tau_syn_E, tau_syn_I, isyn_exc, isyn_inh)
+        input_type = InputTypeCurrent()
+        threshold_type = ThresholdTypeStatic(_IZK_THRESHOLD)
+
+        super().__init__(
+            model_name="QIFCurrExpCompact",
+            binary="QIF_curr_exp_compact.aplx",
+            neuron_model=neuron_model, input_type=input_type,
+            synapse_type=synapse_type, threshold_type=threshold_type)
@@ -0,0 +1,103 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spynnaker.pyNN.models.neuron.input_types import InputTypeCurrent
+from spynnaker.pyNN.models.neuron.threshold_types import ThresholdTypeStatic
+from spynnaker.pyNN.models.defaults import default_initial_values
+
+from python_models8.neuron.builds.abstract_pynn_qif_model_standard import (
+    AbstractPyNNQIFModelStandard)
+from python_models8.neuron.neuron_models.neuron_model_quadratic_integrate_and_fire import (  # noqa: E501
+    NeuronModelQuadraticIntegrateAndFire)
+from python_models8.neuron.synapse_types.synapse_type_exponential_depression import (  # noqa: E501
+    SynapseTypeExponentialDepression)
+
+_IZK_THRESHOLD = 100.0
+
+
+class QifSd(AbstractPyNNQIFModelStandard):
+    """ QIF neuron model with exponentially decaying current inputs that\
+        are subject to short-term synaptic depression, with one resource per\
+        neuron and receptor.
+
+    :param c: :math:`c`
+    :type c: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param i_offset: :math:`I_{offset}`
+    :type i_offset: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param v: :math:`v_{init} = V_{init}`
+    :type v: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param tau_refrac: :math:`\\tau_{refrac}`
+    :type tau_refrac: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param tau_syn_E: :math:`\\tau^{syn}_e`
+    :type tau_syn_E: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param tau_syn_I: :math:`\\tau^{syn}_i`
+    :type tau_syn_I: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param isyn_exc: :math:`I^{syn}_e`
+    :type isyn_exc: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param isyn_inh: :math:`I^{syn}_i`
+    :type isyn_inh: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param U: :math:`U`, the fraction of the resource used per unit of weight
+    :type U: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param tau_rec: :math:`\\tau_{rec}`
+    :type tau_rec: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param x_exc: :math:`x_e`, the available excitatory resource
+    :type x_exc: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param x_inh: :math:`x_i`, the available inhibitory resource
+    :type x_inh: float, iterable(float), ~pyNN.random.RandomDistribution
+        or (mapping) function
+    :param n_substeps: The number of RK2 substeps integrated per time step
+    :type n_substeps: int
+    :param active_set:
+        Whether to skip updating neurons that are at rest with no input
+    :type active_set: bool
+    :param expected_activity: The fraction of updates expected not to be
+        skipped in active-set mode
+    :type expected_activity: float
+    :param burst: Whether a neuron can spike several times in one time\
+        step, which needs several substeps and ``tau_refrac=0``
+    :type burst: bool
+    """
+
+    # noinspection PyPep8Naming
+    @default_initial_values({"v", "isyn_exc", "isyn_inh", "x_exc", "x_inh"})
+    def __init__(self, c=-100.0, i_offset=0.0, v=-100.0, tau_refrac=0.002,
+                 tau_syn_E=5.0, tau_syn_I=5.0, isyn_exc=0.0, isyn_inh=0.0,
+                 U=0.1, tau_rec=50.0, x_exc=1.0, x_inh=1.0, n_substeps=1,
+                 active_set=False, expected_activity=1.0, burst=False):
+        # pylint: disable=too-many-arguments, too-many-locals
+        neuron_model = NeuronModelQuadraticIntegrateAndFire(
+            c, v, i_offset, tau_refrac, n_substeps, _IZK_THRESHOLD,
+            active_set, expected_activity, burst)
+        synapse_type = SynapseTypeExponentialDepression(
+            tau_syn_E, tau_syn_I, isyn_exc, isyn_inh, U, tau_rec, x_exc,
+            x_inh)
+        input_type = InputTypeCurrent()
+        threshold_type = ThresholdTypeStatic(_IZK_THRESHOLD)
+
+        super().__init__(
+            model_name="QifSd", binary="QIF_sd.aplx",
+            neuron_model=neuron_model, input_type=input_type,
+            synapse_type=synapse_type, threshold_type=threshold_type)
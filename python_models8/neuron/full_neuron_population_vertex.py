@@ -0,0 +1,123 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from spinn_front_end_common.utilities import globals_variables
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+
+
+class FullNeuronPopulationVertex(AbstractPopulationVertex):
+    """ A population of neurons of a full neuron implementation whose state\
+        is only read back from the machine, and then only for the cores\
+        holding the neurons asked about, when a state variable is asked for\
+        (rather than all of it whenever anything is set).  The neuron\
+        implementation must provide has_read_data, read_state and\
+        discard_read_data (see MyFullNeuronImpl).
+    """
+
+    __slots__ = []
+
+    def __population(self, sim):
+        """ The population made of this vertex
+        """
+        # pylint: disable=protected-access
+        for population in sim._populations:
+            if population._vertex is self:
+                return population
+        return None
+
+    def __read_state(self, variable, selector=None):
+        """ Bring a state variable up to date with the machine for the\
+            neurons selected
+        """
+        sim = globals_variables.get_simulator()
+        impl = self.neuron_impl
+        if not sim.has_ran or sim.has_reset_last:
+            return
+        population = self.__population(sim)
+        if selector is None and population is not None:
+            # The whole state is read as the population would before a set,
+            # so that it knows not to read it again
+            # pylint: disable=protected-access
+            population._read_parameters_before_set()
+            impl.read_state(self._state_variables, variable)
+            return
+        ids = numpy.array(
+            self._state_variables[variable].selector_to_ids(selector))
+        vertex_slices = list()
+        for vertex in self.machine_vertices:
+            vertex_slice = vertex.vertex_slice
+            if not numpy.any(
+                    (ids >= vertex_slice.lo_atom) &
+                    (ids <= vertex_slice.hi_atom)):
+                continue
+            if (not sim.use_virtual_board and
+                    not impl.has_read_data(
+                        self._state_variables, vertex_slice)):
+                placement = sim.placements.get_placement_of_vertex(vertex)
+                vertex.read_parameters_from_machine(
+                    sim.transceiver, placement, vertex_slice)
+            vertex_slices.append(vertex_slice)
+        impl.read_state(self._state_variables, variable, vertex_slices)
+
+        # Once every core has been read, the population need not read them
+        # again before a set
+        if population is not None and all(
+                impl.has_read_data(self._state_variables, vertex.vertex_slice)
+                for vertex in self.machine_vertices):
+            # pylint: disable=protected-access
+            population._Population__has_read_neuron_parameters_this_run = \
+                True
+
+    @overrides(AbstractPopulationVertex.get_value)
+    def get_value(self, key):
+        # Allow the current value of state variables to be got too
+        if key in self._state_variables and key not in self._parameters:
+            self.__read_state(key)
+            return self._state_variables[key]
+        return super().get_value(key)
+
+    @overrides(AbstractPopulationVertex.get_initial_value)
+    def get_initial_value(self, variable, selector=None):
+        self.__read_state(self._get_parameter(variable), selector)
+        return super().get_initial_value(variable, selector)
+
+    @overrides(AbstractPopulationVertex.initialize)
+    def initialize(self, variable, value, selector=None):
+        # The population has read back the state before this, so decode it
+        # before it is partly overwritten
+        if variable in self._state_variables:
+            self.neuron_impl.read_state(self._state_variables, variable)
+        super().initialize(variable, value, selector)
+
+    @overrides(AbstractPopulationVertex.mark_no_changes)
+    def mark_no_changes(self):
+        # A run is starting, after which the state read back is out of date,
+        # so first decode whatever is about to be written back to the machine
+        impl = self.neuron_impl
+        rewrite_all = self.requires_mapping or self.requires_data_generation
+        for vertex in self.machine_vertices:
+            if rewrite_all or vertex.reload_required:
+                for variable in self._state_variables.keys():
+                    impl.read_state(
+                        self._state_variables, variable, [vertex.vertex_slice])
+        impl.discard_read_data(self._state_variables)
+        super().mark_no_changes()
+
+    @overrides(AbstractPopulationVertex.reset_to_first_timestep)
+    def reset_to_first_timestep(self):
+        self.neuron_impl.discard_read_data(self._state_variables)
+        super().reset_to_first_timestep()
@@ -1,8 +1,13 @@
 from data_specification.enums.data_type import DataType
 from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
-from spynnaker.pyNN.utilities.struct import Struct
 from spynnaker.pyNN.models.neuron.implementations import (
     AbstractNeuronImpl, RangedDictVertexSlice)
+from python_models8.utilities.core_resources import (
+    get_framework_n_cpu_cycles, get_max_neurons_per_core,
+    get_recording_dtcm_usage_in_bytes, get_ring_buffer_dtcm_usage_in_bytes)
+from python_models8.utilities.cycle_costs import estimate_cycles
+from python_models8.utilities.struct_schema import (
+    SchemaField, StructSchema, STATE_VARIABLE)
 
 # TODO: Add names for parameters and state variables
 THRESHOLD = "threshold"
@@ -10,13 +15,22 @@ V = "v"
 EXC_INPUT = "exc_input"
 INH_INPUT = "inh_input"
 
-# TODO: Update the units for the parameters and state variables
-UNITS = {
-    THRESHOLD: "mV",
-    V: "mV",
-    EXC_INPUT: "nA",
-    INH_INPUT: "nA"
-}
+# TODO: Declare the fields of neuron_impl_t in order, with their units;
+# the struct in my_full_neuron_impl_struct.h is generated from this (see
+# python_models8.utilities.struct_schema)
+SCHEMA = StructSchema("neuron_impl_t", [
+    SchemaField(EXC_INPUT, DataType.S1615, "nA", kind=STATE_VARIABLE,
+                c_name="inputs[0]"),
+    SchemaField(INH_INPUT, DataType.S1615, "nA", kind=STATE_VARIABLE,
+                c_name="inputs[1]"),
+    SchemaField(V, DataType.S1615, "mV", kind=STATE_VARIABLE),
+    SchemaField(THRESHOLD, DataType.S1615, "mV")
+])
+
+# The units and state variables (which are read back from the machine) come
+# from the schema, so no need to update
+UNITS = SCHEMA.units
+STATE_VARIABLES = tuple(SCHEMA.names_of(STATE_VARIABLE))
 
 
 class MyFullNeuronImpl(AbstractNeuronImpl):
@@ -32,13 +46,13 @@ class MyFullNeuronImpl(AbstractNeuronImpl):
         self._exc_input = exc_input
         self._inh_input = inh_input
 
-        # TODO: Store a struct to make other operations easier
-        self._struct = Struct([
-            DataType.S1615,  # inputs[0]
-            DataType.S1615,  # inputs[1]
-            DataType.S1615,  # v
-            DataType.S1615   # threshold
-        ])
+        # The packing of neuron_impl_t comes from the schema
+        self._struct = SCHEMA.struct_array
+
+        # The structs read back from the machine since the last run, by the
+        # state variables of the population and then by slice, with the
+        # names of the variables not yet decoded from them
+        self._read_back = dict()
 
     # TODO: Add getters and setters for the parameters
 
@@ -85,16 +99,50 @@ class MyFullNeuronImpl(AbstractNeuronImpl):
         return "my_full_neuron_impl.aplx"
 
     def get_n_cpu_cycles(self, n_neurons):
-        # TODO: Update (or guess) the number of CPU cycles
-        return 10 * n_neurons
+        # TODO: Update the row for the model in utilities/cycle_costs.json,
+        # then regenerate it from benchmark output
+        return estimate_cycles(
+            "MyFullNeuronImpl", n_neurons,
+            n_receptors=self.get_n_synapse_types())
 
     def get_dtcm_usage_in_bytes(self, n_neurons):
-        # This is extracted from the struct, so no need to update
-        return self._struct.get_size_in_whole_words(n_neurons) * BYTES_PER_WORD
+        # The structs are extracted from the struct, so no need to update;
+        # the synaptic input ring buffers hold the inputs of every synapse
+        # type of every neuron, so they are added too
+        # TODO: Add the size of any globals the implementation keeps
+        return (
+            self._struct.get_size_in_whole_words(n_neurons) * BYTES_PER_WORD +
+            get_ring_buffer_dtcm_usage_in_bytes(
+                n_neurons, self.get_n_synapse_types()))
 
     def get_sdram_usage_in_bytes(self, n_neurons):
-        # This is extracted from the struct, so no need to update
-        return self._struct.get_size_in_whole_words(n_neurons) * BYTES_PER_WORD
+        # This is the most data written by get_data, extracted from the
+        # struct, so no need to update; recording buffers are added by the
+        # recorder
+        # TODO: Add the size of any globals written before the structs
+        return self._struct.get_run_size_in_whole_words(n_neurons) * \
+            BYTES_PER_WORD
+
+    def get_max_atoms_per_core(self, max_atoms):
+        """ Get the most neurons that fit on a core, given the DTCM and time\
+            used by them, recording everything that can be recorded
+
+        :param int max_atoms: The most neurons to allow on a core
+        :rtype: int
+        """
+        # This is worked out from the other estimates, so no need to update
+        data_types = list(self.get_recordable_data_types().values())
+
+        # Spikes are recorded too
+        n_recorded = len(data_types) + 1
+        return get_max_neurons_per_core(
+            lambda n_neurons: (
+                self.get_dtcm_usage_in_bytes(n_neurons) +
+                get_recording_dtcm_usage_in_bytes(n_neurons, data_types)),
+            lambda n_neurons: (
+                self.get_n_cpu_cycles(n_neurons) +
+                get_framework_n_cpu_cycles(n_neurons, n_recorded)),
+            max_atoms)
 
     def get_global_weight_scale(self):
         # TODO: Update if a weight scale is required
@@ -156,29 +204,63 @@ class MyFullNeuronImpl(AbstractNeuronImpl):
         state_variables[INH_INPUT] = self._inh_input
 
     def get_data(self, parameters, state_variables, vertex_slice):
-        # TODO: get the data in the appropriate form to match the struct
-        values = [state_variables[EXC_INPUT],
-                  state_variables[INH_INPUT],
-                  state_variables[V],
-                  parameters[THRESHOLD]]
-        return self._struct.get_data(
-            values, vertex_slice.lo_atom, vertex_slice.n_atoms)
+        # The value of each field comes from the schema, so no need to update;
+        # neurons with the same values are written once (see struct_runs.h)
+        return self._struct.get_run_data(
+            SCHEMA.get_values(parameters, state_variables),
+            vertex_slice.lo_atom, vertex_slice.n_atoms)
 
     def read_data(
             self, data, offset, vertex_slice, parameters, state_variables):
-        # TODO: Extract items from the data to be updated
-        (exc_input, inh_input, v, _threshold) = self._struct.read_data(
+        # The structs are only decoded into the state variables as each is
+        # asked for (see read_state); the state on the machine doesn't change
+        # until the next run, so a slice read already is kept as it is
+        structs, new_offset = self._struct.read_run_data(
             data, offset, vertex_slice.n_atoms)
-        new_offset = offset + self._struct.get_size_in_whole_words(
-            vertex_slice.n_atoms)
-        variables = RangedDictVertexSlice(state_variables, vertex_slice)
-
-        variables[EXC_INPUT] = exc_input
-        variables[INH_INPUT] = inh_input
-        variables[V] = v
-
+        read_back = self._read_back.setdefault(state_variables, dict())
+        if vertex_slice not in read_back:
+            read_back[vertex_slice] = (structs, set(STATE_VARIABLES))
         return new_offset
 
+    def has_read_data(self, state_variables, vertex_slice):
+        """ Whether the state of a slice has been read back from the machine\
+            since the last run
+
+        :param state_variables: The state variables of the population
+        :param ~pacman.model.graphs.common.Slice vertex_slice: The slice
+        :rtype: bool
+        """
+        return vertex_slice in self._read_back.get(state_variables, ())
+
+    def read_state(self, state_variables, variable, vertex_slices=None):
+        """ Decode a variable into the state variables from the structs\
+            read back for the given slices, if it hasn't been already
+
+        :param state_variables: The state variables of the population
+        :param str variable: The name of the state variable
+        :param vertex_slices: The slices to decode, or None for all read back
+        :type vertex_slices: iterable(~pacman.model.graphs.common.Slice)
+            or None
+        """
+        read_back = self._read_back.get(state_variables, dict())
+        if vertex_slices is None:
+            vertex_slices = list(read_back)
+        for vertex_slice in vertex_slices:
+            structs, undecoded = read_back.get(vertex_slice, (None, ()))
+            if variable in undecoded:
+                undecoded.remove(variable)
+                variables = RangedDictVertexSlice(
+                    state_variables, vertex_slice)
+                variables[variable] = self._struct.decode(structs, variable)
+
+    def discard_read_data(self, state_variables):
+        """ Forget the structs read back, once they no longer hold the\
+            state on the machine
+
+        :param state_variables: The state variables of the population
+        """
+        self._read_back.pop(state_variables, None)
+
     def get_units(self, variable):
         # This uses the UNITS dict so shouldn't need to be updated
         return UNITS[variable]
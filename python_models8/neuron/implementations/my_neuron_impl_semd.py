@@ -0,0 +1,176 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.constants import (
+    BYTES_PER_WORD, MICRO_TO_MILLISECOND_CONVERSION)
+from spynnaker.pyNN.models.neuron.implementations import NeuronImplStandard
+from python_models8.utilities.cycle_costs import (
+    estimate_cycles, estimate_skipping_cycles)
+
+#: How the recorded voltage and inputs can summarise each recording
+#: interval, in the order of semd_recording_aggregation in
+#: my_neuron_impl_semd.h
+RECORDING_AGGREGATIONS = ("sample", "mean", "min", "max")
+
+# The active set flag, recording interval and aggregation after the
+# components
+_N_WORDS = 3
+
+
+class MyNeuronImplSEMD(NeuronImplStandard):
+    """ The standard componentised neuron implementation as specialised by\
+        my_neuron_impl_semd.h, which does the injected current, the\
+        recording and the set-up of the inhibitory scaling once per time\
+        step rather than once per step, which can skip idle neurons, and\
+        which can record the voltage and inputs at a longer interval,\
+        optionally aggregated over it
+    """
+
+    __slots__ = [
+        "__active_set", "__expected_activity", "__recording_interval",
+        "__recording_aggregation"]
+
+    def __init__(self, model_name, binary, neuron_model, input_type,
+                 synapse_type, threshold_type, active_set=False,
+                 expected_activity=1.0, recording_interval=None,
+                 recording_aggregation="sample"):
+        """
+        :param str model_name:
+        :param str binary:
+        :param AbstractNeuronModel neuron_model:
+        :param AbstractInputType input_type:
+        :param AbstractSynapseType synapse_type:
+        :param AbstractThresholdType threshold_type:
+        :param bool active_set:
+            Whether to skip the update of neurons that are idle until they
+            receive input again
+        :param float expected_activity:
+            The fraction of neuron updates expected not to be skipped in
+            active-set mode, used to estimate the processing cost
+        :param recording_interval:
+            The time between recordings of the voltage and inputs in ms, or
+            None to record every time step
+        :type recording_interval: float or None
+        :param str recording_aggregation:
+            How each recording summarises its interval: "sample" for the
+            value at its end, or "mean", "min" or "max" over it
+        """
+        # pylint: disable=too-many-arguments
+        super().__init__(
+            model_name, binary, neuron_model, input_type, synapse_type,
+            threshold_type)
+        self.__active_set = bool(active_set)
+        self.__expected_activity = expected_activity
+        if recording_aggregation not in RECORDING_AGGREGATIONS:
+            raise ValueError(
+                "recording_aggregation must be one of {}".format(
+                    RECORDING_AGGREGATIONS))
+        if recording_aggregation != "sample" and recording_interval is None:
+            raise ValueError(
+                "recording_aggregation needs a recording_interval")
+        self.__recording_interval = recording_interval
+        self.__recording_aggregation = recording_aggregation
+
+    @property
+    def active_set(self):
+        """ Whether idle neurons are skipped
+
+        :rtype: bool
+        """
+        return self.__active_set
+
+    @property
+    def recording_interval(self):
+        """ The time between recordings of the voltage and inputs in ms, or\
+            None for every time step
+
+        :rtype: float or None
+        """
+        return self.__recording_interval
+
+    @property
+    def recording_aggregation(self):
+        """ How each recording of the voltage and inputs summarises its\
+            interval
+
+        :rtype: str
+        """
+        return self.__recording_aggregation
+
+    @overrides(NeuronImplStandard.get_n_cpu_cycles)
+    def get_n_cpu_cycles(self, n_neurons):
+        # The components run on every step
+        n_steps = self.n_steps_per_timestep
+        components = super().get_n_cpu_cycles(n_neurons) * n_steps
+        if not self.__active_set:
+            return components + estimate_cycles(
+                "MyNeuronImplSEMD", n_neurons, n_steps=n_steps)
+        activity = min(max(float(self.__expected_activity), 0.0), 1.0)
+        return int(numpy.ceil(components * activity)) + \
+            estimate_skipping_cycles(
+                "MyNeuronImplSEMD", n_neurons, activity, n_steps=n_steps)
+
+    @overrides(NeuronImplStandard.get_dtcm_usage_in_bytes)
+    def get_dtcm_usage_in_bytes(self, n_neurons):
+        # The active set flag, bitfield and the step each neuron went idle,
+        # the recording settings and a 64-bit aggregate of each recorded
+        # variable of each neuron
+        total = (super().get_dtcm_usage_in_bytes(n_neurons) +
+                 (_N_WORDS + (n_neurons + 31) // 32 + n_neurons) *
+                 BYTES_PER_WORD)
+        if self.__recording_aggregation != "sample":
+            total += n_neurons * len(self.get_recordable_variables()) * 8
+        return total
+
+    @overrides(NeuronImplStandard.get_sdram_usage_in_bytes)
+    def get_sdram_usage_in_bytes(self, n_neurons):
+        return (super().get_sdram_usage_in_bytes(n_neurons) +
+                _N_WORDS * BYTES_PER_WORD)
+
+    def __recording_interval_steps(self):
+        """ The recording interval as a number of time steps
+
+        :rtype: int
+        :raises ValueError: If it is not a whole number of time steps
+        """
+        if self.__recording_interval is None:
+            return 1
+        ts = globals_variables.get_simulator().machine_time_step
+        ts_ms = float(ts) / MICRO_TO_MILLISECOND_CONVERSION
+        steps = int(round(self.__recording_interval / ts_ms))
+        if steps < 1 or abs(steps * ts_ms - self.__recording_interval) > \
+                1e-9 * ts_ms:
+            raise ValueError(
+                "recording_interval must be a whole number of time steps")
+        return steps
+
+    @overrides(NeuronImplStandard.get_data)
+    def get_data(self, parameters, state_variables, vertex_slice):
+        return numpy.concatenate([
+            super().get_data(parameters, state_variables, vertex_slice),
+            numpy.array([
+                self.__active_set, self.__recording_interval_steps(),
+                RECORDING_AGGREGATIONS.index(self.__recording_aggregation)],
+                dtype="uint32")])
+
+    @overrides(NeuronImplStandard.read_data)
+    def read_data(
+            self, data, offset, vertex_slice, parameters, state_variables):
+        offset = super().read_data(
+            data, offset, vertex_slice, parameters, state_variables)
+        return offset + _N_WORDS * BYTES_PER_WORD
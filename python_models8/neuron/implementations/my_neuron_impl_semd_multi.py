@@ -0,0 +1,331 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.constants import (
+    BYTES_PER_WORD, MICRO_TO_MILLISECOND_CONVERSION)
+from spynnaker.pyNN.utilities.struct import Struct
+from spynnaker.pyNN.models.neuron.implementations import (
+    AbstractNeuronImpl, RangedDictVertexSlice)
+from spynnaker.pyNN.models.neuron.neuron_models.neuron_model_leaky_integrate_and_fire import (  # noqa: E501
+    CM, COUNT_REFRAC, I_OFFSET, TAU_M, TAU_REFRAC, V, V_RESET, V_REST)
+from spynnaker.pyNN.models.neuron.synapse_types.synapse_type_exponential import (  # noqa: E501
+    ISYN_EXC, ISYN_INH, TAU_SYN_E, TAU_SYN_I)
+from spynnaker.pyNN.models.neuron.threshold_types.threshold_type_static import (  # noqa: E501
+    V_THRESH)
+from python_models8.neuron.input_types.my_input_type_semd import (
+    MY_MULTIPLICATOR, MY_INH_INPUT_PREVIOUS)
+from python_models8.utilities.cycle_costs import estimate_cycles
+from python_models8.utilities.ranged_arrays import ranged_list_to_array
+
+#: The number of directions detected at each site; matches
+#: SEMD_N_DIRECTIONS in my_neuron_impl_semd_multi.h
+N_DIRECTIONS = 4
+
+#: The parameters shared by the detectors of a site
+SITE_PARAMETERS = (
+    V_REST, TAU_M, CM, I_OFFSET, V_RESET, TAU_REFRAC, V_THRESH, TAU_SYN_E,
+    TAU_SYN_I)
+
+UNITS = {
+    V: "mV",
+    V_REST: "mV",
+    TAU_M: "ms",
+    CM: "nF",
+    I_OFFSET: "nA",
+    V_RESET: "mV",
+    TAU_REFRAC: "ms",
+    COUNT_REFRAC: "",
+    V_THRESH: "mV",
+    TAU_SYN_E: "ms",
+    TAU_SYN_I: "ms",
+    ISYN_EXC: "nA",
+    ISYN_INH: "nA",
+    MY_MULTIPLICATOR: "",
+    MY_INH_INPUT_PREVIOUS: ""
+}
+
+_SITE_TYPES = [
+    DataType.S1615,   # v_rest
+    DataType.S1615,   # r_membrane (= tau_m / cm)
+    DataType.S1615,   # exp_tc (= e^(-ts / tau_m))
+    DataType.S1615,   # i_offset
+    DataType.S1615,   # v_reset
+    DataType.INT32,   # tau_refrac
+    DataType.S1615,   # v_thresh
+    DataType.U032,    # decay_E
+    DataType.U032,    # init_E
+    DataType.U032,    # decay_I
+    DataType.U032]    # init_I
+
+_DIRECTION_TYPES = [
+    DataType.S1615,   # v
+    DataType.INT32,   # count_refrac
+    DataType.S1615,   # isyn_exc
+    DataType.S1615,   # isyn_inh
+    DataType.S1615,   # my_multiplicator
+    DataType.S1615]   # my_inh_input_previous
+
+
+class MyNeuronImplSEMDMulti(AbstractNeuronImpl):
+    """ sEMD neurons grouped into sites of one detector per direction, the\
+        detectors of a site sharing their parameters and being updated in\
+        a single pass; each detector is still a neuron of its own, with its\
+        own key and recordings, so neuron ``i`` is the detector of direction\
+        ``i % N_DIRECTIONS`` at site ``i // N_DIRECTIONS``
+    """
+
+    __slots__ = [
+        "__tau_m", "__cm", "__v_rest", "__v_reset", "__v_thresh",
+        "__tau_syn_E", "__tau_syn_I", "__tau_refrac", "__i_offset", "__v",
+        "__isyn_exc", "__isyn_inh", "__my_multiplicator",
+        "__my_inh_input_previous", "__struct"]
+
+    _RECORDABLES = ["v", "gsyn_exc", "gsyn_inh"]
+
+    _RECORDABLE_DATA_TYPES = {
+        "v": DataType.S1615,
+        "gsyn_exc": DataType.S1615,
+        "gsyn_inh": DataType.S1615
+    }
+
+    _RECORDABLE_UNITS = {
+        'v': 'mV',
+        'gsyn_exc': "uS",
+        'gsyn_inh': "uS"}
+
+    def __init__(self, tau_m, cm, v_rest, v_reset, v_thresh, tau_syn_E,
+                 tau_syn_I, tau_refrac, i_offset, v, isyn_exc, isyn_inh,
+                 my_multiplicator, my_inh_input_previous):
+        """
+        See :py:class:`~python_models8.neuron.builds.my_if_curr_exp_sEMD.\
+        MyIFCurrExpSEMD` for the parameters
+        """
+        # pylint: disable=too-many-arguments
+        self.__tau_m = tau_m
+        self.__cm = cm
+        self.__v_rest = v_rest
+        self.__v_reset = v_reset
+        self.__v_thresh = v_thresh
+        self.__tau_syn_E = tau_syn_E
+        self.__tau_syn_I = tau_syn_I
+        self.__tau_refrac = tau_refrac
+        self.__i_offset = i_offset
+        self.__v = v
+        self.__isyn_exc = isyn_exc
+        self.__isyn_inh = isyn_inh
+        self.__my_multiplicator = my_multiplicator
+        self.__my_inh_input_previous = my_inh_input_previous
+        self.__struct = Struct(
+            _SITE_TYPES + _DIRECTION_TYPES * N_DIRECTIONS)
+
+    @staticmethod
+    def _n_sites(vertex_slice):
+        """ Get the number of sites in a slice
+
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+        :rtype: int
+        :raises ValueError: If the slice does not hold whole sites
+        """
+        if (vertex_slice.lo_atom % N_DIRECTIONS or
+                vertex_slice.n_atoms % N_DIRECTIONS):
+            raise ValueError(
+                "A multi-direction sEMD core must hold whole sites of {} "
+                "neurons".format(N_DIRECTIONS))
+        return vertex_slice.n_atoms // N_DIRECTIONS
+
+    @staticmethod
+    def _by_direction(values, vertex_slice):
+        """ Get the values of the neurons of a slice as one row per site and\
+            one column per direction
+
+        :rtype: ~numpy.ndarray
+        """
+        return ranged_list_to_array(
+            values, vertex_slice.lo_atom, vertex_slice.n_atoms).reshape(
+                -1, N_DIRECTIONS)
+
+    @classmethod
+    def _by_site(cls, name, values, vertex_slice):
+        """ Get the values of a parameter shared by the detectors of each\
+            site of a slice
+
+        :param str name: The name of the parameter, for the error message
+        :rtype: ~numpy.ndarray
+        :raises ValueError:
+            If the detectors of a site do not have the same value
+        """
+        by_direction = cls._by_direction(values, vertex_slice)
+        if numpy.any(by_direction != by_direction[:, :1]):
+            raise ValueError(
+                "{} must be the same for every direction of a site of a "
+                "multi-direction sEMD".format(name))
+        return by_direction[:, 0]
+
+    @property
+    @overrides(AbstractNeuronImpl.model_name)
+    def model_name(self):
+        return "MyIFCurrExpSEMDMulti"
+
+    @property
+    @overrides(AbstractNeuronImpl.binary_name)
+    def binary_name(self):
+        return "my_if_curr_exp_sEMD_multi.aplx"
+
+    @overrides(AbstractNeuronImpl.get_n_cpu_cycles)
+    def get_n_cpu_cycles(self, n_neurons):
+        return estimate_cycles(
+            "MyNeuronImplSEMDMulti", n_neurons,
+            n_sites=1.0 / N_DIRECTIONS)
+
+    @overrides(AbstractNeuronImpl.get_dtcm_usage_in_bytes)
+    def get_dtcm_usage_in_bytes(self, n_neurons):
+        n_sites = -(-n_neurons // N_DIRECTIONS)
+        return self.__struct.get_size_in_whole_words(n_sites) * \
+            BYTES_PER_WORD
+
+    @overrides(AbstractNeuronImpl.get_sdram_usage_in_bytes)
+    def get_sdram_usage_in_bytes(self, n_neurons):
+        return self.get_dtcm_usage_in_bytes(n_neurons)
+
+    @overrides(AbstractNeuronImpl.get_global_weight_scale)
+    def get_global_weight_scale(self):
+        return 1.0
+
+    @overrides(AbstractNeuronImpl.get_n_synapse_types)
+    def get_n_synapse_types(self):
+        return 2
+
+    @overrides(AbstractNeuronImpl.get_synapse_id_by_target)
+    def get_synapse_id_by_target(self, target):
+        if target == "excitatory":
+            return 0
+        elif target == "inhibitory":
+            return 1
+        return None
+
+    @overrides(AbstractNeuronImpl.get_synapse_targets)
+    def get_synapse_targets(self):
+        return "excitatory", "inhibitory"
+
+    @overrides(AbstractNeuronImpl.get_recordable_variables)
+    def get_recordable_variables(self):
+        return self._RECORDABLES
+
+    @overrides(AbstractNeuronImpl.get_recordable_units)
+    def get_recordable_units(self, variable):
+        return self._RECORDABLE_UNITS[variable]
+
+    @overrides(AbstractNeuronImpl.get_recordable_data_types)
+    def get_recordable_data_types(self):
+        return self._RECORDABLE_DATA_TYPES
+
+    @overrides(AbstractNeuronImpl.is_recordable)
+    def is_recordable(self, variable):
+        return variable in self._RECORDABLES
+
+    @overrides(AbstractNeuronImpl.get_recordable_variable_index)
+    def get_recordable_variable_index(self, variable):
+        return self._RECORDABLES.index(variable)
+
+    @overrides(AbstractNeuronImpl.add_parameters)
+    def add_parameters(self, parameters):
+        parameters[TAU_M] = self.__tau_m
+        parameters[CM] = self.__cm
+        parameters[V_REST] = self.__v_rest
+        parameters[V_RESET] = self.__v_reset
+        parameters[V_THRESH] = self.__v_thresh
+        parameters[TAU_SYN_E] = self.__tau_syn_E
+        parameters[TAU_SYN_I] = self.__tau_syn_I
+        parameters[TAU_REFRAC] = self.__tau_refrac
+        parameters[I_OFFSET] = self.__i_offset
+        parameters[MY_MULTIPLICATOR] = self.__my_multiplicator
+
+    @overrides(AbstractNeuronImpl.add_state_variables)
+    def add_state_variables(self, state_variables):
+        state_variables[V] = self.__v
+        state_variables[COUNT_REFRAC] = 0
+        state_variables[ISYN_EXC] = self.__isyn_exc
+        state_variables[ISYN_INH] = self.__isyn_inh
+        state_variables[MY_INH_INPUT_PREVIOUS] = \
+            self.__my_inh_input_previous
+
+    @overrides(AbstractNeuronImpl.get_data)
+    def get_data(self, parameters, state_variables, vertex_slice):
+        self._n_sites(vertex_slice)
+        ts = globals_variables.get_simulator().machine_time_step
+        ts_ms = float(ts) / MICRO_TO_MILLISECOND_CONVERSION
+        site = {name: self._by_site(name, parameters[name], vertex_slice)
+                for name in SITE_PARAMETERS}
+        values = [
+            site[V_REST], site[TAU_M] / site[CM],
+            numpy.exp(-ts_ms / site[TAU_M]), site[I_OFFSET], site[V_RESET],
+            numpy.ceil(site[TAU_REFRAC] / ts_ms).astype("int64"),
+            site[V_THRESH],
+            numpy.exp(-ts_ms / site[TAU_SYN_E]),
+            (site[TAU_SYN_E] / ts_ms) *
+            (1.0 - numpy.exp(-ts_ms / site[TAU_SYN_E])),
+            numpy.exp(-ts_ms / site[TAU_SYN_I]),
+            (site[TAU_SYN_I] / ts_ms) *
+            (1.0 - numpy.exp(-ts_ms / site[TAU_SYN_I]))]
+        by_direction = [
+            self._by_direction(variables[name], vertex_slice)
+            for variables, name in (
+                (state_variables, V), (state_variables, COUNT_REFRAC),
+                (state_variables, ISYN_EXC), (state_variables, ISYN_INH),
+                (parameters, MY_MULTIPLICATOR),
+                (state_variables, MY_INH_INPUT_PREVIOUS))]
+        for direction in range(N_DIRECTIONS):
+            values.extend(
+                direction_values[:, direction]
+                for direction_values in by_direction)
+        return self.__struct.get_data(values, 0, len(values[0]))
+
+    @overrides(AbstractNeuronImpl.read_data)
+    def read_data(
+            self, data, offset, vertex_slice, parameters, state_variables):
+        n_sites = self._n_sites(vertex_slice)
+        fields = self.__struct.read_data(data, offset, n_sites)
+        new_offset = offset + BYTES_PER_WORD * \
+            self.__struct.get_size_in_whole_words(n_sites)
+
+        # One row per site and one column per direction of each state
+        by_direction = numpy.array(
+            fields[len(_SITE_TYPES):]).reshape(
+                N_DIRECTIONS, len(_DIRECTION_TYPES), n_sites)
+        (v, count_refrac, isyn_exc, isyn_inh, _my_multiplicator,
+         my_inh_input_previous) = (
+            by_direction[:, i, :].T.reshape(-1)
+            for i in range(len(_DIRECTION_TYPES)))
+
+        variables = RangedDictVertexSlice(state_variables, vertex_slice)
+        variables[V] = v
+        variables[COUNT_REFRAC] = count_refrac
+        variables[ISYN_EXC] = isyn_exc
+        variables[ISYN_INH] = isyn_inh
+        variables[MY_INH_INPUT_PREVIOUS] = my_inh_input_previous
+        return new_offset
+
+    @overrides(AbstractNeuronImpl.get_units)
+    def get_units(self, variable):
+        return UNITS[variable]
+
+    @property
+    @overrides(AbstractNeuronImpl.is_conductance_based)
+    def is_conductance_based(self):
+        return False
@@ -0,0 +1,275 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.constants import (
+    BYTES_PER_WORD, MICRO_TO_MILLISECOND_CONVERSION)
+from spynnaker.pyNN.models.neuron.implementations import (
+    AbstractNeuronImpl, RangedDictVertexSlice)
+from python_models8.neuron.neuron_models.neuron_model_quadratic_integrate_and_fire import (  # noqa: E501
+    C, V, I_OFFSET, TAU_REFRAC, COUNT_REFRAC, N_SUBSTEPS, ACTIVE_SET,
+    EXPECTED_ACTIVITY, refractory_steps)
+from python_models8.neuron.implementations.qif_neuron_impl import (
+    SPIKE_FRACTION)
+from python_models8.utilities.cycle_costs import (
+    estimate_cycles, estimate_skipping_cycles)
+from python_models8.utilities.parameter_table import ParameterTable
+from python_models8.utilities.struct_array import StructArray
+
+V_THRESH = "v_thresh"
+ISYN_EXC = "isyn_exc"
+ISYN_INH = "isyn_inh"
+
+# Fields of the structs that are worked out from the parameters
+_THIS_H = "this_h"
+_SUBSTEP_H = "substep_h"
+_QUIESCENT = "quiescent"
+_PARAMS = "params"
+
+UNITS = {
+    C: "mV",
+    V: "mV",
+    I_OFFSET: "nA",
+    TAU_REFRAC: "ms",
+    N_SUBSTEPS: "",
+    ACTIVE_SET: "",
+    EXPECTED_ACTIVITY: "",
+    V_THRESH: "mV",
+    ISYN_EXC: "",
+    ISYN_INH: ""
+}
+
+
+class QIFCurrDeltaFusedImpl(AbstractNeuronImpl):
+    """ The QIF model with delta current synapses and a static threshold,\
+        updated in a single pass over one compact struct per neuron rather\
+        than through the standard component chain
+
+    The parameters are not held by each neuron, but in a table of the\
+    distinct sets of them on the core (see\
+    :py:class:`~python_models8.utilities.parameter_table.ParameterTable`),\
+    which holds a single set when the population was given one value of\
+    each; where the parameters differ too much to share, each neuron has its\
+    own set, taking as much DTCM as holding them in the neuron would.
+    ``n_substeps`` must fit the 8 bits of its field, so is at most 255.
+    """
+
+    __slots__ = [
+        "__c", "__i_offset", "__v", "__tau_refrac", "__v_thresh",
+        "__isyn_exc", "__isyn_inh", "__n_substeps", "__active_set",
+        "__expected_activity", "__struct", "__table"]
+
+    _RECORDABLES = ["v", "gsyn_exc", "gsyn_inh", SPIKE_FRACTION]
+
+    _RECORDABLE_DATA_TYPES = {
+        "v": DataType.S1615,
+        "gsyn_exc": DataType.S1615,
+        "gsyn_inh": DataType.S1615,
+        SPIKE_FRACTION: DataType.U016
+    }
+
+    _RECORDABLE_UNITS = {
+        'v': 'mV',
+        'gsyn_exc': "uS",
+        'gsyn_inh': "uS",
+        SPIKE_FRACTION: ""}
+
+    def __init__(self, c, i_offset, v, tau_refrac, v_thresh, isyn_exc,
+                 isyn_inh, n_substeps, active_set, expected_activity):
+        """
+        See :py:class:`~python_models8.neuron.builds.qif_curr_delta.\
+        QIFCurrDelta` for the parameters
+
+        :param float v_thresh: The spike threshold
+        """
+        # pylint: disable=too-many-arguments
+        self.__c = c
+        self.__i_offset = i_offset
+        self.__v = v
+        self.__tau_refrac = tau_refrac
+        self.__v_thresh = v_thresh
+        self.__isyn_exc = isyn_exc
+        self.__isyn_inh = isyn_inh
+        self.__n_substeps = n_substeps
+        self.__active_set = active_set
+        self.__expected_activity = expected_activity
+        self.__struct = StructArray([
+            (ISYN_EXC, DataType.S1615),       # inputs[EXCITATORY]
+            (ISYN_INH, DataType.S1615),       # inputs[INHIBITORY]
+            (V, DataType.S1615),              # V
+            (_THIS_H, DataType.S1615),        # this_h
+            (COUNT_REFRAC, DataType.INT16),   # refract_timer
+            (_PARAMS, DataType.UINT8),        # params
+            (_QUIESCENT, DataType.UINT8)])    # quiescent
+        self.__table = ParameterTable([
+            (C, DataType.S1615),              # C
+            (I_OFFSET, DataType.S1615),       # I_offset
+            (V_THRESH, DataType.S1615),       # V_thresh
+            (_SUBSTEP_H, DataType.S1615),     # substep_h
+            (TAU_REFRAC, DataType.INT16),     # T_refract
+            (N_SUBSTEPS, DataType.UINT8),     # n_substeps
+            (ACTIVE_SET, DataType.UINT8)])    # active_set
+
+    @property
+    @overrides(AbstractNeuronImpl.model_name)
+    def model_name(self):
+        return "QIFCurrDeltaFused"
+
+    @property
+    @overrides(AbstractNeuronImpl.binary_name)
+    def binary_name(self):
+        return "QIF_curr_delta_fused.aplx"
+
+    @overrides(AbstractNeuronImpl.get_n_cpu_cycles)
+    def get_n_cpu_cycles(self, n_neurons):
+        # The substeps are paid for by the slowest neuron
+        n_substeps = int(numpy.max(self.__n_substeps))
+        if not numpy.any(self.__active_set):
+            return estimate_cycles(
+                "QIFCurrDeltaFusedImpl", n_neurons, n_substeps=n_substeps)
+        return estimate_skipping_cycles(
+            "QIFCurrDeltaFusedImpl", n_neurons,
+            numpy.mean(self.__expected_activity), n_substeps=n_substeps)
+
+    @overrides(AbstractNeuronImpl.get_dtcm_usage_in_bytes)
+    def get_dtcm_usage_in_bytes(self, n_neurons):
+        # The parameters can be set to differ for every neuron after this is
+        # asked, when the core grows its table to fit, so allow for a set
+        # each; the number of sets stays in SDRAM
+        return (self.__table.struct_array.get_size_in_whole_words(n_neurons) +
+                self.__struct.get_size_in_whole_words(n_neurons)) * \
+            BYTES_PER_WORD
+
+    @overrides(AbstractNeuronImpl.get_sdram_usage_in_bytes)
+    def get_sdram_usage_in_bytes(self, n_neurons):
+        # The parameters can be changed to be different for every neuron
+        return (self.__table.get_max_size_in_whole_words(n_neurons) +
+                self.__struct.get_run_size_in_whole_words(n_neurons)) * \
+            BYTES_PER_WORD
+
+    @overrides(AbstractNeuronImpl.get_global_weight_scale)
+    def get_global_weight_scale(self):
+        return 1.0
+
+    @overrides(AbstractNeuronImpl.get_n_synapse_types)
+    def get_n_synapse_types(self):
+        return 2
+
+    @overrides(AbstractNeuronImpl.get_synapse_id_by_target)
+    def get_synapse_id_by_target(self, target):
+        if target == "excitatory":
+            return 0
+        elif target == "inhibitory":
+            return 1
+        raise ValueError("Unknown target {}".format(target))
+
+    @overrides(AbstractNeuronImpl.get_synapse_targets)
+    def get_synapse_targets(self):
+        return "excitatory", "inhibitory"
+
+    @overrides(AbstractNeuronImpl.get_recordable_variables)
+    def get_recordable_variables(self):
+        return self._RECORDABLES
+
+    @overrides(AbstractNeuronImpl.get_recordable_units)
+    def get_recordable_units(self, variable):
+        return self._RECORDABLE_UNITS[variable]
+
+    @overrides(AbstractNeuronImpl.get_recordable_data_types)
+    def get_recordable_data_types(self):
+        return self._RECORDABLE_DATA_TYPES
+
+    @overrides(AbstractNeuronImpl.is_recordable)
+    def is_recordable(self, variable):
+        return variable in self._RECORDABLES
+
+    @overrides(AbstractNeuronImpl.get_recordable_variable_index)
+    def get_recordable_variable_index(self, variable):
+        return self._RECORDABLES.index(variable)
+
+    @overrides(AbstractNeuronImpl.add_parameters)
+    def add_parameters(self, parameters):
+        parameters[C] = self.__c
+        parameters[I_OFFSET] = self.__i_offset
+        parameters[TAU_REFRAC] = self.__tau_refrac
+        parameters[V_THRESH] = self.__v_thresh
+        parameters[N_SUBSTEPS] = self.__n_substeps
+        parameters[ACTIVE_SET] = self.__active_set
+        parameters[EXPECTED_ACTIVITY] = self.__expected_activity
+
+    @overrides(AbstractNeuronImpl.add_state_variables)
+    def add_state_variables(self, state_variables):
+        state_variables[V] = self.__v
+        state_variables[COUNT_REFRAC] = 0
+        state_variables[ISYN_EXC] = self.__isyn_exc
+        state_variables[ISYN_INH] = self.__isyn_inh
+
+    @overrides(AbstractNeuronImpl.get_data)
+    def get_data(self, parameters, state_variables, vertex_slice):
+        ts = globals_variables.get_simulator().machine_time_step
+        ts_ms = float(ts) / MICRO_TO_MILLISECOND_CONVERSION
+        substep_h = parameters[N_SUBSTEPS].apply_operation(
+            operation=lambda n: ts_ms / n)
+        table, indices = self.__table.get_data({
+            C: parameters[C],
+            I_OFFSET: parameters[I_OFFSET],
+            V_THRESH: parameters[V_THRESH],
+            _SUBSTEP_H: substep_h,
+            # refract_timer is an int16_t, so the period must fit one
+            TAU_REFRAC: parameters[TAU_REFRAC].apply_operation(
+                operation=lambda x: refractory_steps(
+                    x, ts_ms, DataType.INT16)),
+            N_SUBSTEPS: parameters[N_SUBSTEPS],
+            ACTIVE_SET: parameters[ACTIVE_SET]},
+            vertex_slice.lo_atom, vertex_slice.n_atoms)
+        # Neurons in the same state are written once (see struct_runs.h)
+        neurons = self.__struct.get_run_data({
+            ISYN_EXC: state_variables[ISYN_EXC],
+            ISYN_INH: state_variables[ISYN_INH],
+            V: state_variables[V],
+            _THIS_H: substep_h,
+            COUNT_REFRAC: state_variables[COUNT_REFRAC],
+            # The indices are of the slice, so start at its first atom
+            _PARAMS: numpy.concatenate(
+                (numpy.zeros(vertex_slice.lo_atom, "uint8"), indices)),
+            # The neuron must show it is quiescent again after a change
+            _QUIESCENT: 0},
+            vertex_slice.lo_atom, vertex_slice.n_atoms)
+        return numpy.concatenate((table, neurons))
+
+    @overrides(AbstractNeuronImpl.read_data)
+    def read_data(
+            self, data, offset, vertex_slice, parameters, state_variables):
+        # Only the neurons hold state; the table is skipped
+        offset += self.__table.get_n_bytes(data, offset, vertex_slice.n_atoms)
+        structs, new_offset = self.__struct.read_run_data(
+            data, offset, vertex_slice.n_atoms)
+
+        variables = RangedDictVertexSlice(state_variables, vertex_slice)
+        for name in (ISYN_EXC, ISYN_INH, V, COUNT_REFRAC):
+            variables[name] = self.__struct.decode(structs, name)
+        return new_offset
+
+    @overrides(AbstractNeuronImpl.get_units)
+    def get_units(self, variable):
+        return UNITS[variable]
+
+    @property
+    @overrides(AbstractNeuronImpl.is_conductance_based)
+    def is_conductance_based(self):
+        return False
@@ -0,0 +1,65 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from data_specification.enums import DataType
+from spynnaker.pyNN.models.neuron.implementations import NeuronImplStandard
+
+#: The recordable variable holding where in a timestep each spike happened
+SPIKE_FRACTION = "spike_fraction"
+
+#: The recordable variable holding how many spikes each timestep fired
+SPIKE_COUNT = "spike_count"
+
+
+class QIFNeuronImpl(NeuronImplStandard):
+    """ The standard componentised neuron implementation for QIF neuron\
+        models, which can also record the fraction of the timestep at which\
+        each neuron reached its peak voltage as an unsigned 16-bit fraction\
+        and how many times it spiked in each timestep
+    """
+
+    __slots__ = ["__neuron_model"]
+
+    _RECORDABLES = NeuronImplStandard._RECORDABLES + [
+        SPIKE_FRACTION, SPIKE_COUNT]
+
+    _RECORDABLE_DATA_TYPES = dict(
+        NeuronImplStandard._RECORDABLE_DATA_TYPES)
+    _RECORDABLE_DATA_TYPES[SPIKE_FRACTION] = DataType.U016
+    _RECORDABLE_DATA_TYPES[SPIKE_COUNT] = DataType.UINT8
+
+    _RECORDABLE_UNITS = dict(NeuronImplStandard._RECORDABLE_UNITS)
+    _RECORDABLE_UNITS[SPIKE_FRACTION] = ""
+    _RECORDABLE_UNITS[SPIKE_COUNT] = ""
+
+    def __init__(
+            self, model_name, binary, neuron_model, input_type,
+            synapse_type, threshold_type, additional_input_type=None):
+        """ See :py:class:`~spynnaker.pyNN.models.neuron.implementations.\
+            NeuronImplStandard`
+        """
+        # pylint: disable=too-many-arguments
+        super().__init__(
+            model_name, binary, neuron_model, input_type, synapse_type,
+            threshold_type, additional_input_type)
+        self.__neuron_model = neuron_model
+
+    @property
+    def neuron_model(self):
+        """ The model of the neuron soma
+
+        :rtype: AbstractNeuronModel
+        """
+        return self.__neuron_model
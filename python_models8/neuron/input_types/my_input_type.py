@@ -1,18 +1,27 @@
 from spynnaker.pyNN.models.neuron.input_types import AbstractInputType
 from data_specification.enums.data_type import DataType
+from python_models8.neuron.schema_neuron_component import (
+    SchemaNeuronComponent)
+from python_models8.utilities.cycle_costs import estimate_cycles
+from python_models8.utilities.struct_schema import (
+    SchemaField, StructSchema, STATE_VARIABLE)
 
 # TODO create constants to match the parameter names
 MY_MULTIPLICATOR = "my_multiplicator"
 MY_INPUT_PARAMETER = "my_input_parameter"
 
-# TODO create units for each parameter
-UNITS = {
-    MY_MULTIPLICATOR: "",
-    MY_INPUT_PARAMETER: "mA"
-}
+# TODO: Declare the fields of input_type_t in order, with their units;
+# the struct in my_input_type_struct.h is generated from this (see
+# python_models8.utilities.struct_schema)
+SCHEMA = StructSchema("input_type_t", [
+    SchemaField(MY_MULTIPLICATOR, DataType.S1615, kind=STATE_VARIABLE,
+                c_name="multiplicator"),
+    SchemaField(MY_INPUT_PARAMETER, DataType.S1615, "mA",
+                c_name="my_parameter")
+])
 
 
-class MyInputType(AbstractInputType):
+class MyInputType(SchemaNeuronComponent, AbstractInputType):
 
     def __init__(
             self,
@@ -21,11 +30,8 @@ class MyInputType(AbstractInputType):
             my_multiplicator,
             my_input_parameter):
 
-        # TODO: Update the data types
-        super().__init__([
-            DataType.S1615,  # my_multiplicator
-            DataType.S1615   # my_input_parameter
-        ])
+        # The data types and packing come from the schema
+        super().__init__(SCHEMA)
 
         # TODO: store the parameters
         self._my_multiplicator = my_multiplicator
@@ -53,37 +59,6 @@ class MyInputType(AbstractInputType):
         return 1.0
 
     def get_n_cpu_cycles(self, n_neurons):
-        # TODO: Calculate (or guess) the CPU cycles
-        return 10 * n_neurons
-
-    def add_parameters(self, parameters):
-        # TODO: Add initial values of the parameters that the user can change
-        parameters[MY_INPUT_PARAMETER] = self._my_input_parameter
-
-    def add_state_variables(self, state_variables):
-        # TODO: Add initial values of the state variables that the user can
-        # change
-        state_variables[MY_MULTIPLICATOR] = self._my_multiplicator
-
-    def get_values(self, parameters, state_variables, vertex_slice, ts):
-        # TODO: Return, in order of the struct, the values from the parameters,
-        # state variables, or other
-        return [state_variables[MY_MULTIPLICATOR],
-                parameters[MY_INPUT_PARAMETER]]
-
-    def update_values(self, values, parameters, state_variables):
-        # TODO: From the list of values given in order of the struct, update
-        # the parameters and state variables
-        (_my_input_parameter, my_multiplicator) = values
-
-        # NOTE: If you know that the value doesn't change, you don't have to
-        # assign it (hint: often only state variables are likely to change)!
-        state_variables[MY_MULTIPLICATOR] = my_multiplicator
-
-    def has_variable(self, variable):
-        # This works from the UNITS dict, so no changes are required
-        return variable in UNITS
-
-    def get_units(self, variable):
-        # This works from the UNITS dict, so no changes are required
-        return UNITS[variable]
+        # TODO: Add a row for the model to utilities/cycle_costs.json, then
+        # regenerate it from benchmark output
+        return estimate_cycles("MyInputType", n_neurons)
@@ -1,6 +1,7 @@
 from spinn_utilities.overrides import overrides
 from data_specification.enums import DataType
 from spynnaker.pyNN.models.neuron.input_types import AbstractInputType
+from python_models8.utilities.cycle_costs import estimate_cycles
 
 MY_MULTIPLICATOR = "my_multiplicator"
 MY_INH_INPUT_PREVIOUS = "my_inh_input_previous"
@@ -27,8 +28,7 @@ class MyInputTypeCurrentSEMD(AbstractInputType):
 
     @overrides(AbstractInputType.get_n_cpu_cycles)
     def get_n_cpu_cycles(self, n_neurons):
-        # A bit of a guess
-        return 10 * n_neurons
+        return estimate_cycles("MyInputTypeCurrentSEMD", n_neurons)
 
     @overrides(AbstractInputType.add_parameters)
     def add_parameters(self, parameters):
@@ -3,36 +3,41 @@ from data_specification.enums import DataType
 from spinn_front_end_common.utilities.constants import (
     MICRO_TO_MILLISECOND_CONVERSION)
 from spynnaker.pyNN.models.neuron.neuron_models import AbstractNeuronModel
+from python_models8.neuron.schema_neuron_component import (
+    SchemaNeuronModel)
+from python_models8.utilities.cycle_costs import estimate_cycles
+from python_models8.utilities.struct_schema import (
+    SchemaField, StructSchema, STATE_VARIABLE)
 
 # TODO: create constants to match the parameter names
 I_OFFSET = "i_offset"
 MY_NEURON_PARAMETER = "my_neuron_parameter"
 V = "v"
 
-# TODO: create units for each parameter
-UNITS = {
-    I_OFFSET: "nA",
-    MY_NEURON_PARAMETER: "mV",
-    V: "mV"
-}
+# TODO: Declare the fields of neuron_t in order, with their units; the
+# struct in my_neuron_model_struct.h is generated from this (see
+# python_models8.utilities.struct_schema)
+SCHEMA = StructSchema("neuron_t", [
+    SchemaField(V, DataType.S1615, "mV", kind=STATE_VARIABLE, c_name="V"),
+    SchemaField(I_OFFSET, DataType.S1615, "nA", c_name="I_offset"),
+    SchemaField(MY_NEURON_PARAMETER, DataType.S1615, "mV",
+                c_name="my_parameter")
+])
 
 
-class MyNeuronModel(AbstractNeuronModel):
+class MyNeuronModel(SchemaNeuronModel, AbstractNeuronModel):
     def __init__(
             self,
 
             # TODO: update the parameters and state variables
             i_offset, my_neuron_parameter, v):
 
-        # TODO: Update the data types - this must match the structs exactly
-        super().__init__(
-            data_types=[
-                DataType.S1615,   # v
-                DataType.S1615,   # i_offset
-                DataType.S1615],  # my_parameter
-            global_data_types=[
-                DataType.UINT32   # machine_time_step
-            ])
+        # The data types and packing come from the schema
+        # TODO: Update the global data types - this must match
+        # global_neuron_params_t exactly
+        super().__init__(SCHEMA, global_data_types=[
+            DataType.UINT32   # machine_time_step
+        ])
 
         # TODO: Store any parameters and state variables
         self._i_offset = i_offset
@@ -67,49 +72,10 @@ class MyNeuronModel(AbstractNeuronModel):
 
     @overrides(AbstractNeuronModel.get_n_cpu_cycles)
     def get_n_cpu_cycles(self, n_neurons):
-        # TODO: Calculate (or guess) the CPU cycles
-        return 10 * n_neurons
-
-    @overrides(AbstractNeuronModel.add_parameters)
-    def add_parameters(self, parameters):
-        # TODO: Add initial values of the parameters that the user can change
-        parameters[I_OFFSET] = self._i_offset
-        parameters[MY_NEURON_PARAMETER] = self._my_neuron_parameter
-
-    @overrides(AbstractNeuronModel.add_state_variables)
-    def add_state_variables(self, state_variables):
-        # TODO: Add initial values of the state variables that the user can
-        # change
-        state_variables[V] = self._v
-
-    @overrides(AbstractNeuronModel.get_values)
-    def get_values(self, parameters, state_variables, vertex_slice, ts):
-        # TODO: Return, in order of the struct, the values from the parameters,
-        # state variables, or other
-        return [state_variables[V],
-                parameters[I_OFFSET],
-                parameters[MY_NEURON_PARAMETER]]
+        # TODO: Add a row for the model to utilities/cycle_costs.json, then
+        # regenerate it from benchmark output
+        return estimate_cycles("MyNeuronModel", n_neurons)
 
     @overrides(AbstractNeuronModel.get_global_values)
     def get_global_values(self, ts):
         return [float(ts) / MICRO_TO_MILLISECOND_CONVERSION]
-
-    @overrides(AbstractNeuronModel.update_values)
-    def update_values(self, values, parameters, state_variables):
-        # TODO: From the list of values given in order of the struct, update
-        # the parameters and state variables
-        (v, _i_offset, _my_parameter) = values
-
-        # NOTE: If you know that the value doesn't change, you don't have to
-        # assign it (hint: often only state variables are likely to change)!
-        state_variables[V] = v
-
-    @overrides(AbstractNeuronModel.has_variable)
-    def has_variable(self, variable):
-        # This works from the UNITS dict, so no changes are required
-        return variable in UNITS
-
-    @overrides(AbstractNeuronModel.get_units)
-    def get_units(self, variable):
-        # This works from the UNITS dict, so no changes are required
-        return UNITS[variable]
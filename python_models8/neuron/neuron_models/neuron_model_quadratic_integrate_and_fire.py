@@ -12,6 +12,7 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import numbers
 import numpy
 from spinn_utilities.overrides import overrides
 from data_specification.enums import DataType
@@ -20,6 +21,12 @@ from spinn_front_end_common.utilities.constants import (
 from spynnaker.pyNN.models.neuron.neuron_models import AbstractNeuronModel
 from spynnaker.pyNN.models.neuron.implementations import (
     AbstractStandardNeuronComponent)
+from python_models8.neuron.schema_neuron_component import (
+    SchemaNeuronModel)
+from python_models8.utilities.cycle_costs import (
+    estimate_cycles, estimate_skipping_cycles)
+from python_models8.utilities.struct_schema import (
+    SchemaField, StructSchema, PARAMETER, STATE_VARIABLE, DERIVED)
 
 # TODO: replace 'C' with 'V_RESET'
 C = 'c'
@@ -27,23 +34,106 @@ V = 'v'
 I_OFFSET = 'i_offset'
 TAU_REFRAC = 'tau_refrac'
 COUNT_REFRAC = 'count_refrac'
+N_SUBSTEPS = 'n_substeps'
+V_PEAK = 'v_peak'
+ACTIVE_SET = 'active_set'
+EXPECTED_ACTIVITY = 'expected_activity'
+BURST = 'burst'
 
-UNITS = {
-    C: "mV",
-    V: "mV",
-    I_OFFSET: "nA",
-    TAU_REFRAC: "ms"
-}
+#: The fields of neuron_t in qif_impl.h, which includes the struct generated
+#: from this in qif_struct.h (see python_models8.utilities.struct_schema)
+SCHEMA = StructSchema("neuron_t", [
+    SchemaField(C, DataType.S1615, "mV", c_name="C"),
+    SchemaField(V, DataType.S1615, "mV", kind=STATE_VARIABLE, c_name="V"),
+    SchemaField(I_OFFSET, DataType.S1615, "nA", c_name="I_offset"),
+    SchemaField(COUNT_REFRAC, DataType.INT32, "timesteps",
+                kind=STATE_VARIABLE, c_name="refract_timer"),
+    SchemaField("t_refract", DataType.INT32, "timesteps", kind=DERIVED,
+                c_name="T_refract"),
+    SchemaField("this_h", DataType.S1615, "ms", kind=DERIVED),
+    SchemaField("quiescent", DataType.UINT32, kind=DERIVED)
+], extra_variables=[
+    SchemaField(TAU_REFRAC, DataType.S1615, "ms", kind=PARAMETER)
+])
 
+#: The bits of the flags of global_neuron_params_t in qif_impl.h
+FLAG_ACTIVE_SET = 1
+FLAG_BURST = 2
 
-class NeuronModelQuadraticIntegrateAndFire(AbstractNeuronModel):
+UNITS = SCHEMA.units
+
+
+def refractory_steps(tau_refrac, ts_ms, data_type=DataType.INT32):
+    """ Get the number of time steps of a refractory period, checking that\
+        it fits the refractory timer of the machine
+
+    :param float tau_refrac: The refractory period in ms
+    :param float ts_ms: The time step in ms
+    :param ~data_specification.enums.DataType data_type:
+        The type of the refractory timer
+    :rtype: int
+    :raises ValueError: If the period has too many time steps
+    """
+    steps = int(numpy.ceil(tau_refrac / ts_ms))
+    if steps > data_type.max:
+        raise ValueError(
+            "tau_refrac of {} ms is {} time steps of {} ms, but the "
+            "refractory timer holds at most {}".format(
+                tau_refrac, steps, ts_ms, data_type.max))
+    return steps
+
+
+def check_n_substeps(n_substeps):
+    """ Check that a number of substeps is a whole number of at least one
+
+    :param n_substeps: The number of substeps
+    :rtype: int
+    :raises ValueError: If the number cannot be used
+    """
+    if (isinstance(n_substeps, bool) or
+            not isinstance(n_substeps, numbers.Integral) or
+            not 1 <= n_substeps <= DataType.UINT32.max):
+        raise ValueError(
+            "n_substeps must be a whole number of at least 1, not {}".format(
+                n_substeps))
+    return int(n_substeps)
+
+
+def check_burst(burst, refract_steps):
+    """ Check that no neuron that can burst has a refractory period; the\
+        refractory countdown would stop it integrating for the time steps\
+        after a spike, so a burst could never happen
+
+    :param burst: Whether the neurons, or each neuron, can burst
+    :type burst: bool or ~numpy.ndarray
+    :param ~numpy.ndarray refract_steps:
+        The number of time steps of the refractory period of each neuron
+    :raises ValueError: If a neuron that can burst has a refractory period
+    """
+    n_bad = numpy.count_nonzero(
+        numpy.asarray(burst, dtype=bool) & (numpy.asarray(refract_steps) > 0))
+    if n_bad:
+        raise ValueError(
+            "burst needs tau_refrac=0, but {} neurons that can burst have a "
+            "refractory period".format(n_bad))
+
+
+class NeuronModelQuadraticIntegrateAndFire(
+        SchemaNeuronModel, AbstractNeuronModel):
     """ QIF model (simplified Izhikevich model)
+
+    The substeps, :math:`v_{peak}` and the active-set and burst modes are\
+    the same for every neuron of the population, so are held once per core\
+    and cannot be changed with ``set``.
     """
     __slots__ = [
-        "__c", "__v_init", "__i_offset", "__tau_refrac"
+        "__c", "__v_init", "__i_offset", "__tau_refrac", "__n_substeps",
+        "__v_peak", "__active_set", "__expected_activity", "__burst"
     ]
 
-    def __init__(self, c, v_init, i_offset, tau_refrac):
+    def __init__(self, c, v_init, i_offset, tau_refrac, n_substeps=1,
+                 v_peak=100.0, active_set=False, expected_activity=1.0,
+                 burst=False):
         """
         :param c: :math:`c`
         :type c: float, iterable(float), ~pyNN.random.RandomDistribution or
@@ -56,74 +146,91 @@ class NeuronModelQuadraticIntegrateAndFire(AbstractNeuronModel):
         :type i_offset:
             float, iterable(float), ~pyNN.random.RandomDistribution or
             (mapping) function
+        :param tau_refrac: :math:`\\tau_{refrac}`
+        :type tau_refrac:
+            float, iterable(float), ~pyNN.random.RandomDistribution or
+            (mapping) function
+        :param int n_substeps:
+            The number of RK2 substeps to integrate over each time step
+        :param float v_peak:
+            The voltage at which the remaining substeps of a time step are
+            skipped; should match the spike threshold
+        :param bool active_set:
+            Whether to skip the update of a neuron whose voltage has stopped
+            changing until it receives synaptic input again
+        :param float expected_activity:
+            The fraction of neuron updates expected not to be skipped in
+            active-set mode, used to estimate the processing cost
+        :param burst:
+            Whether a neuron that reaches :math:`v_{peak}` before its last
+            substep resets and carries on, so that it can spike several
+            times in one time step; needs :math:`\\tau_{refrac} = 0`, as the
+            refractory countdown would otherwise hold the neuron after its
+            first spike
+        :type burst: bool
+        :raises ValueError: If an option cannot be used
         """
-        super().__init__(
-            [DataType.S1615,   # c
-             DataType.S1615,   # v
-             DataType.S1615,   # i_offset
-             DataType.INT32,   # count_refrac
-             DataType.INT32,   # tau_refrac
-             DataType.S1615],  # this_h (= machine_time_step)
-            [DataType.S1615])  # machine_time_step
+        super().__init__(SCHEMA, [
+            DataType.S1615,   # machine_timestep_ms
+            DataType.S1615,   # substep_h
+            DataType.UINT32,  # n_substeps
+            DataType.S1615,   # V_peak
+            DataType.UINT32])  # flags
+        if not 0.0 <= expected_activity <= 1.0:
+            raise ValueError(
+                "expected_activity must be between 0 and 1, not {}".format(
+                    expected_activity))
         self.__c = c
         self.__i_offset = i_offset
         self.__v_init = v_init
         self.__tau_refrac = tau_refrac
+        self.__n_substeps = check_n_substeps(n_substeps)
+        self.__v_peak = float(v_peak)
+        self.__active_set = bool(active_set)
+        self.__expected_activity = float(expected_activity)
+        self.__burst = bool(burst)
+        if isinstance(tau_refrac, (int, float)):
+            check_burst(self.__burst, [tau_refrac])
 
     @overrides(AbstractStandardNeuronComponent.get_n_cpu_cycles)
     def get_n_cpu_cycles(self, n_neurons):
-        # A bit of a guess
-        return 200 * n_neurons
-
-    @overrides(AbstractStandardNeuronComponent.add_parameters)
-    def add_parameters(self, parameters):
-        parameters[C] = self.__c
-        parameters[I_OFFSET] = self.__i_offset
-        parameters[TAU_REFRAC] = self.__tau_refrac
+        if not self.__active_set:
+            return estimate_cycles(
+                "NeuronModelQuadraticIntegrateAndFire", n_neurons,
+                n_substeps=self.__n_substeps)
+        return estimate_skipping_cycles(
+            "NeuronModelQuadraticIntegrateAndFire", n_neurons,
+            self.__expected_activity, n_substeps=self.__n_substeps)
 
     @overrides(AbstractStandardNeuronComponent.add_state_variables)
     def add_state_variables(self, state_variables):
         state_variables[V] = self.__v_init
         state_variables[COUNT_REFRAC] = 0
 
-    @overrides(AbstractStandardNeuronComponent.get_units)
-    def get_units(self, variable):
-        return UNITS[variable]
-
-    @overrides(AbstractStandardNeuronComponent.has_variable)
-    def has_variable(self, variable):
-        return variable in UNITS
-
     @overrides(AbstractNeuronModel.get_global_values)
     def get_global_values(self, ts):
         # pylint: disable=arguments-differ
-        return [float(ts) / MICRO_TO_MILLISECOND_CONVERSION]
+        ts_ms = float(ts) / MICRO_TO_MILLISECOND_CONVERSION
+        flags = ((FLAG_ACTIVE_SET if self.__active_set else 0) |
+                 (FLAG_BURST if self.__burst else 0))
+        return [ts_ms, ts_ms / self.__n_substeps, self.__n_substeps,
+                self.__v_peak, flags]
 
-    @overrides(AbstractStandardNeuronComponent.get_values)
-    def get_values(self, parameters, state_variables, vertex_slice, ts):
+    def get_derived_values(self, parameters, state_variables, vertex_slice,
+                           ts):
         """
         :param ts: machine time step
         """
-        # pylint: disable=arguments-differ
-
-        # Add the rest of the data
-        return [
-            parameters[C],
-            state_variables[V], parameters[I_OFFSET],
-            state_variables[COUNT_REFRAC], parameters[TAU_REFRAC].apply_operation(
-                operation=lambda x: int(numpy.ceil(x / (ts / 1000.0)))),
-            float(ts) / MICRO_TO_MILLISECOND_CONVERSION
-        ]
-
-    @overrides(AbstractStandardNeuronComponent.update_values)
-    def update_values(self, values, parameters, state_variables):
-
-        # Decode the values
-        _c, v, _i_offset, count_refrac, _tau_refrac, _this_h = values
-
-        # Copy the changed data only
-        state_variables[V] = v
-        state_variables[COUNT_REFRAC] = count_refrac
+        ts_ms = float(ts) / MICRO_TO_MILLISECOND_CONVERSION
+        refract_steps = parameters[TAU_REFRAC].apply_operation(
+            operation=lambda x: refractory_steps(x, ts_ms))
+        check_burst(
+            self.__burst, refract_steps.get_values(vertex_slice.as_slice))
+        return {
+            "t_refract": refract_steps,
+            "this_h": ts_ms / self.__n_substeps,
+            # The neuron must show it is quiescent again after a change
+            "quiescent": 0}
 
     @property
     def c(self):
@@ -156,3 +263,43 @@ class NeuronModelQuadraticIntegrateAndFire(AbstractNeuronModel):
         :rtype: float
         """
         return self.__tau_refrac
+
+    @property
+    def n_substeps(self):
+        """ The number of RK2 substeps per time step
+
+        :rtype: int
+        """
+        return self.__n_substeps
+
+    @property
+    def v_peak(self):
+        """ The voltage at which the remaining substeps are skipped
+
+        :rtype: float
+        """
+        return self.__v_peak
+
+    @property
+    def active_set(self):
+        """ Whether quiescent neurons are skipped
+
+        :rtype: bool
+        """
+        return self.__active_set
+
+    @property
+    def expected_activity(self):
+        """ The fraction of updates expected not to be skipped
+
+        :rtype: float
+        """
+        return self.__expected_activity
+
+    @property
+    def burst(self):
+        """ Whether several spikes can be fired in one time step
+
+        :rtype: bool
+        """
+        return self.__burst
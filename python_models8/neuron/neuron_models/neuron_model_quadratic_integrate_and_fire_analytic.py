@@ -0,0 +1,244 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import math
+import numpy
+from spinn_utilities.overrides import overrides
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.constants import (
+    MICRO_TO_MILLISECOND_CONVERSION)
+from spynnaker.pyNN.models.neuron.neuron_models import AbstractNeuronModel
+from spynnaker.pyNN.models.neuron.implementations import (
+    AbstractStandardNeuronComponent)
+from python_models8.neuron.neuron_models.neuron_model_quadratic_integrate_and_fire import (  # noqa: E501
+    C, V, I_OFFSET, TAU_REFRAC, COUNT_REFRAC, V_PEAK)
+from python_models8.utilities.cycle_costs import estimate_cycles
+
+UNITS = {
+    C: "mV",
+    V: "mV",
+    I_OFFSET: "nA",
+    TAU_REFRAC: "ms",
+    V_PEAK: "mV"
+}
+
+#: The number of samples of each coefficient in the interpolation table;
+#: must match QIF_ANALYTIC_TABLE_SIZE in qif_analytic_impl.h
+TABLE_SIZE = 256
+
+#: The smallest :math:`z = I h^2` in the table; the input of more strongly
+#: inhibited neurons is clamped to :math:`Z_{min} / h^2`, so that the update
+#: uses the input and coefficients of the same :math:`z`
+Z_MIN = -64.0
+
+#: The largest :math:`z = I h^2` in the table.  Below it, the denominator of
+#: the update reaching zero is exactly the neuron passing through infinity
+#: within the step; at :math:`\sqrt{z} = \pi` it does so from any voltage,
+#: and the coefficients there (:math:`a = -1`, :math:`s = 0`) make it spike
+Z_MAX = math.pi ** 2
+
+
+def mobius_coefficients(z):
+    """ Get the coefficients of the exact update of\
+        :math:`\\dot{V} = V^2 + I` over a step :math:`h`, written as\
+        :math:`V' = (a V + I h s) / (a - h s V)` with :math:`z = I h^2`
+
+    For :math:`z < 0` both coefficients are divided by :math:`\\cosh\\sqrt{-z}`
+    so that they stay in range; the update is unchanged by the scaling.
+
+    :param float z: The drive scaled by the square of the step
+    :return: :math:`a` and :math:`s`
+    :rtype: tuple(float, float)
+    """
+    if z > 0:
+        root = math.sqrt(z)
+        return math.cos(root), math.sin(root) / root
+    if z < 0:
+        root = math.sqrt(-z)
+        return 1.0, math.tanh(root) / root
+    return 1.0, 1.0
+
+
+class NeuronModelQuadraticIntegrateAndFireAnalytic(AbstractNeuronModel):
+    """ QIF model updated with the closed-form solution of\
+        :math:`\\dot{V} = V^2 + I` for the input of each step, so the cost\
+        and stability of an update do not depend on the time step
+    """
+    __slots__ = [
+        "__c", "__v_init", "__i_offset", "__tau_refrac", "__v_peak"
+    ]
+
+    def __init__(self, c, v_init, i_offset, tau_refrac, v_peak=100.0):
+        """
+        :param c: :math:`c`
+        :type c: float, iterable(float), ~pyNN.random.RandomDistribution or
+            (mapping) function
+        :param v_init: :math:`v_{init}`
+        :type v_init:
+            float, iterable(float), ~pyNN.random.RandomDistribution or
+            (mapping) function
+        :param i_offset: :math:`I_{offset}`
+        :type i_offset:
+            float, iterable(float), ~pyNN.random.RandomDistribution or
+            (mapping) function
+        :param tau_refrac: :math:`\\tau_{refrac}`
+        :type tau_refrac:
+            float, iterable(float), ~pyNN.random.RandomDistribution or
+            (mapping) function
+        :param v_peak:
+            The voltage that a neuron passing through infinity within a step
+            is left at; should be at least the spike threshold
+        :type v_peak: float or iterable(float)
+        """
+        super().__init__(
+            [DataType.S1615,   # c
+             DataType.S1615,   # v
+             DataType.S1615,   # i_offset
+             DataType.INT32,   # count_refrac
+             DataType.INT32,   # tau_refrac
+             DataType.S1615,   # v_peak
+             DataType.S1615,   # a for i_offset alone
+             DataType.S1615],  # h * s for i_offset alone
+            [DataType.S1615,   # h
+             DataType.S1615,   # z_min
+             DataType.S1615,   # i_min
+             DataType.S1615,   # z_max
+             DataType.S1615] +  # 1 / table spacing
+            [DataType.S1615] * (2 * TABLE_SIZE))  # a table, s table
+        self.__c = c
+        self.__i_offset = i_offset
+        self.__v_init = v_init
+        self.__tau_refrac = tau_refrac
+        self.__v_peak = v_peak
+
+    @overrides(AbstractStandardNeuronComponent.get_n_cpu_cycles)
+    def get_n_cpu_cycles(self, n_neurons):
+        # One table lookup and one division per neuron, whatever the step
+        return estimate_cycles(
+            "NeuronModelQuadraticIntegrateAndFireAnalytic", n_neurons)
+
+    @overrides(AbstractStandardNeuronComponent.add_parameters)
+    def add_parameters(self, parameters):
+        parameters[C] = self.__c
+        parameters[I_OFFSET] = self.__i_offset
+        parameters[TAU_REFRAC] = self.__tau_refrac
+        parameters[V_PEAK] = self.__v_peak
+
+    @overrides(AbstractStandardNeuronComponent.add_state_variables)
+    def add_state_variables(self, state_variables):
+        state_variables[V] = self.__v_init
+        state_variables[COUNT_REFRAC] = 0
+
+    @overrides(AbstractStandardNeuronComponent.get_units)
+    def get_units(self, variable):
+        return UNITS[variable]
+
+    @overrides(AbstractStandardNeuronComponent.has_variable)
+    def has_variable(self, variable):
+        return variable in UNITS
+
+    @overrides(AbstractNeuronModel.get_global_values)
+    def get_global_values(self, ts):
+        # pylint: disable=arguments-differ
+        h = float(ts) / MICRO_TO_MILLISECOND_CONVERSION
+        z_table = numpy.linspace(Z_MIN, Z_MAX, TABLE_SIZE)
+        a_table, s_table = zip(*map(mobius_coefficients, z_table))
+        # At small steps no representable input reaches Z_MIN
+        i_min = max(Z_MIN / (h * h), float(DataType.S1615.min))
+        return ([h, Z_MIN, i_min, Z_MAX,
+                 (TABLE_SIZE - 1) / (Z_MAX - Z_MIN)] +
+                list(a_table) + list(s_table))
+
+    @overrides(AbstractStandardNeuronComponent.get_values)
+    def get_values(self, parameters, state_variables, vertex_slice, ts):
+        """
+        :param ts: machine time step
+        """
+        # pylint: disable=arguments-differ
+        h = float(ts) / MICRO_TO_MILLISECOND_CONVERSION
+
+        def offset_a(i_offset):
+            if i_offset * h * h >= Z_MAX:
+                # Always spikes, as at Z_MAX; makes the denominator negative
+                return -1.0
+            return mobius_coefficients(i_offset * h * h)[0]
+
+        def offset_hs(i_offset):
+            if i_offset * h * h >= Z_MAX:
+                return 0.0
+            return h * mobius_coefficients(i_offset * h * h)[1]
+
+        # Add the rest of the data
+        return [
+            parameters[C],
+            state_variables[V], parameters[I_OFFSET],
+            state_variables[COUNT_REFRAC],
+            parameters[TAU_REFRAC].apply_operation(
+                operation=lambda x: int(numpy.ceil(x / h))),
+            parameters[V_PEAK],
+            parameters[I_OFFSET].apply_operation(operation=offset_a),
+            parameters[I_OFFSET].apply_operation(operation=offset_hs)
+        ]
+
+    @overrides(AbstractStandardNeuronComponent.update_values)
+    def update_values(self, values, parameters, state_variables):
+
+        # Decode the values
+        (_c, v, _i_offset, count_refrac, _tau_refrac, _v_peak, _a,
+         _hs) = values
+
+        # Copy the changed data only
+        state_variables[V] = v
+        state_variables[COUNT_REFRAC] = count_refrac
+
+    @property
+    def c(self):
+        """ Settable model parameter: :math:`c`
+
+        :rtype: float
+        """
+        return self.__c
+
+    @property
+    def i_offset(self):
+        """ Settable model parameter: :math:`I_{offset}`
+
+        :rtype: float
+        """
+        return self.__i_offset
+
+    @property
+    def v_init(self):
+        """ Settable model parameter: :math:`v_{init}`
+
+        :rtype: float
+        """
+        return self.__v_init
+
+    @property
+    def tau_refrac(self):
+        r""" Settable model parameter: :math:`\tau_{refrac}`
+
+        :rtype: float
+        """
+        return self.__tau_refrac
+
+    @property
+    def v_peak(self):
+        """ Settable model parameter: :math:`v_{peak}`
+
+        :rtype: float
+        """
+        return self.__v_peak
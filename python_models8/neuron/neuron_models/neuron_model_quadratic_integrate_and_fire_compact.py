@@ -0,0 +1,274 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from spinn_utilities.ranged import RangedList
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.constants import (
+    MICRO_TO_MILLISECOND_CONVERSION)
+from spynnaker.pyNN.models.neuron.neuron_models import AbstractNeuronModel
+from spynnaker.pyNN.models.neuron.implementations import (
+    AbstractStandardNeuronComponent)
+from python_models8.neuron.neuron_models.neuron_model_quadratic_integrate_and_fire import (  # noqa: E501
+    C, V, I_OFFSET, TAU_REFRAC, COUNT_REFRAC, V_PEAK, check_n_substeps,
+    refractory_steps)
+from python_models8.utilities.cycle_costs import estimate_cycles
+
+UNITS = {
+    C: "mV",
+    V: "mV",
+    I_OFFSET: "nA",
+    TAU_REFRAC: "ms"
+}
+
+#: The shortest substep in ms; the s16.15 substep length keeps at least 7\
+#: significant bits
+MIN_SUBSTEP_H = 2 ** -8
+
+
+def _voltage(name, value):
+    """ Check that a voltage can be stored in the 16-bit voltage of a neuron
+
+    :param str name: The name of the parameter, for the error message
+    :param float value: The voltage
+    :rtype: float
+    :raises ValueError: If the voltage is outside the S8.7 range
+    """
+    if not DataType.S87.min <= value <= DataType.S87.max:
+        raise ValueError(
+            "{} must be within {} to {} mV to be stored in the voltage of a "
+            "compact QIF model, not {}".format(
+                name, DataType.S87.min, DataType.S87.max, value))
+    return value
+
+
+def _homogeneous(name, value):
+    """ Get the single value of a parameter shared by the whole population
+
+    :param str name: The name of the parameter, for the error message
+    :param value: The value(s) given for the parameter
+    :type value: float or iterable(float)
+    :rtype: float
+    :raises ValueError: If the neurons do not all have the same value
+    """
+    if isinstance(value, RangedList):
+        value = [range_value for _, _, range_value in value.iter_ranges()]
+    try:
+        values = numpy.unique(numpy.asarray(value, dtype="float64"))
+    except (TypeError, ValueError):
+        values = None
+    if values is None or len(values) != 1:
+        raise ValueError(
+            "{} must be the same for every neuron of a compact QIF model"
+            .format(name))
+    return float(values[0])
+
+
+class NeuronModelQuadraticIntegrateAndFireCompact(AbstractNeuronModel):
+    """ QIF model with a compact layout for large, homogeneous populations:\
+        the voltage, offset current and refractory counter of each neuron\
+        are held in 16-bit fields and the remaining parameters are shared\
+        by the whole population
+
+    The RK2 substeps run at s16.15, but the voltage is stored to 1/128 mV\
+    once per time step, so a time step that changes it by less than that,\
+    i.e. with :math:`|h (I + V^2)| < 2^{-7}`, leaves it where it was.  With\
+    a time step :math:`h` of 1 ms a neuron with no input then holds still\
+    within about 0.09 mV of :math:`V = 0`, and within about 0.28 mV with a\
+    time step of 0.1 ms; the substeps themselves must be at least\
+    :py:data:`MIN_SUBSTEP_H` ms long.
+
+    :math:`c` and :math:`\\tau_{refrac}` are held once per core, so can be\
+    ``set`` only to a value shared by all neurons; the reset voltage\
+    :math:`c` and :math:`v_{peak}`, at which a diverging voltage is stored,\
+    must be within the :math:`\\pm 256` mV of the stored voltage.
+    """
+    __slots__ = [
+        "__c", "__v_init", "__i_offset", "__tau_refrac", "__n_substeps",
+        "__v_peak"
+    ]
+
+    def __init__(self, c, v_init, i_offset, tau_refrac, n_substeps=1,
+                 v_peak=100.0):
+        """
+        :param float c:
+            :math:`c`, shared by all neurons, within :math:`\\pm 256` mV
+        :param v_init: :math:`v_{init}`, within :math:`\\pm 256` mV
+        :type v_init:
+            float, iterable(float), ~pyNN.random.RandomDistribution or
+            (mapping) function
+        :param i_offset: :math:`I_{offset}`, within :math:`\\pm 256` nA
+        :type i_offset:
+            float, iterable(float), ~pyNN.random.RandomDistribution or
+            (mapping) function
+        :param float tau_refrac: :math:`\\tau_{refrac}`, shared by all neurons
+        :param int n_substeps:
+            The number of RK2 substeps to integrate over each time step,
+            shared by all neurons
+        :param float v_peak:
+            The voltage at which the remaining substeps of a time step are
+            skipped, shared by all neurons and below 256 mV; should match the
+            spike threshold
+        :raises ValueError:
+            If a shared parameter is given different values for some neurons,
+            or a voltage cannot be stored
+        """
+        super().__init__(
+            [DataType.S87,     # v
+             DataType.S87,     # i_offset
+             DataType.INT16,   # count_refrac
+             DataType.UINT16],  # whether this step gets the threshold bump
+            [DataType.S1615,   # machine_time_step
+             DataType.S1615,   # c
+             DataType.S1615,   # v_peak
+             DataType.INT32,   # tau_refrac
+             DataType.INT32,   # n_substeps
+             DataType.S1615])  # substep_h
+        self.__c = _voltage(C, _homogeneous(C, c))
+        self.__i_offset = i_offset
+        self.__v_init = v_init
+        self.__tau_refrac = _homogeneous(TAU_REFRAC, tau_refrac)
+        self.__n_substeps = check_n_substeps(n_substeps)
+        self.__v_peak = _voltage(V_PEAK, float(v_peak))
+
+    @overrides(AbstractStandardNeuronComponent.get_n_cpu_cycles)
+    def get_n_cpu_cycles(self, n_neurons):
+        return estimate_cycles(
+            "NeuronModelQuadraticIntegrateAndFireCompact", n_neurons,
+            n_substeps=self.__n_substeps)
+
+    @overrides(AbstractStandardNeuronComponent.add_parameters)
+    def add_parameters(self, parameters):
+        parameters[C] = self.__c
+        parameters[I_OFFSET] = self.__i_offset
+        parameters[TAU_REFRAC] = self.__tau_refrac
+
+    @overrides(AbstractStandardNeuronComponent.add_state_variables)
+    def add_state_variables(self, state_variables):
+        state_variables[V] = self.__v_init
+        state_variables[COUNT_REFRAC] = 0
+
+    @overrides(AbstractStandardNeuronComponent.get_units)
+    def get_units(self, variable):
+        return UNITS[variable]
+
+    @overrides(AbstractStandardNeuronComponent.has_variable)
+    def has_variable(self, variable):
+        return variable in UNITS
+
+    @overrides(AbstractNeuronModel.get_data)
+    def get_data(self, parameters, state_variables, vertex_slice, ts):
+        # The shared parameters may have been set since the model was built
+        self.__c = _voltage(C, _homogeneous(C, parameters[C]))
+        self.__tau_refrac = _homogeneous(TAU_REFRAC, parameters[TAU_REFRAC])
+        return super().get_data(
+            parameters, state_variables, vertex_slice, ts)
+
+    @overrides(AbstractNeuronModel.get_global_values)
+    def get_global_values(self, ts):
+        # pylint: disable=arguments-differ
+        ts_ms = float(ts) / MICRO_TO_MILLISECOND_CONVERSION
+        substep_h = ts_ms / self.__n_substeps
+        if substep_h < MIN_SUBSTEP_H:
+            raise ValueError(
+                "{} substeps of a {} ms time step are shorter than the {} ms "
+                "that a compact QIF model can integrate".format(
+                    self.__n_substeps, ts_ms, MIN_SUBSTEP_H))
+        # The refractory counter of each neuron is 16 bits
+        return [
+            ts_ms, self.__c, self.__v_peak,
+            refractory_steps(self.__tau_refrac, ts_ms, DataType.INT16),
+            self.__n_substeps, substep_h]
+
+    @overrides(AbstractStandardNeuronComponent.get_values)
+    def get_values(self, parameters, state_variables, vertex_slice, ts):
+        """
+        :param ts: machine time step
+        """
+        # pylint: disable=arguments-differ
+        count_refrac = numpy.asarray(
+            state_variables[COUNT_REFRAC].get_values(vertex_slice.as_slice))
+        if numpy.any(count_refrac < DataType.INT16.min) or numpy.any(
+                count_refrac > DataType.INT16.max):
+            raise ValueError(
+                "count_refrac must be within {} to {} for a compact QIF "
+                "model".format(DataType.INT16.min, DataType.INT16.max))
+        return [
+            state_variables[V], parameters[I_OFFSET],
+            state_variables[COUNT_REFRAC],
+            # The first step has no threshold bump
+            0
+        ]
+
+    @overrides(AbstractStandardNeuronComponent.update_values)
+    def update_values(self, values, parameters, state_variables):
+
+        # Decode the values
+        v, _i_offset, count_refrac, _bumped = values
+
+        # Copy the changed data only
+        state_variables[V] = v
+        state_variables[COUNT_REFRAC] = count_refrac
+
+    @property
+    def c(self):
+        """ Settable model parameter shared by all neurons: :math:`c`
+
+        :rtype: float
+        """
+        return self.__c
+
+    @property
+    def i_offset(self):
+        """ Settable model parameter: :math:`I_{offset}`
+
+        :rtype: float
+        """
+        return self.__i_offset
+
+    @property
+    def v_init(self):
+        """ Settable model parameter: :math:`v_{init}`
+
+        :rtype: float
+        """
+        return self.__v_init
+
+    @property
+    def tau_refrac(self):
+        r""" Settable model parameter shared by all neurons:\
+            :math:`\tau_{refrac}`
+
+        :rtype: float
+        """
+        return self.__tau_refrac
+
+    @property
+    def n_substeps(self):
+        """ Model parameter shared by all neurons: the number of RK2\
+            substeps per time step
+
+        :rtype: int
+        """
+        return self.__n_substeps
+
+    @property
+    def v_peak(self):
+        """ Model parameter shared by all neurons: :math:`v_{peak}`
+
+        :rtype: float
+        """
+        return self.__v_peak
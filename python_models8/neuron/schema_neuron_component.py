@@ -0,0 +1,156 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from python_models8.utilities.struct_schema import (
+    PARAMETER, STATE_VARIABLE, DERIVED)
+
+
+class SchemaNeuronComponent(object):
+    """ Makes a standard neuron component out of a
+        :py:class:`~python_models8.utilities.struct_schema.StructSchema`;\
+        put it before the component type in the bases, e.g.::
+
+            class MyThresholdType(SchemaNeuronComponent,
+                                  AbstractThresholdType):
+
+    The initial value of each parameter and state variable is taken from\
+    the attribute of the component with the same name.  A component with\
+    derived fields overrides :py:meth:`get_derived_values`.
+    """
+
+    def __init__(self, schema, *args):
+        """
+        :param ~python_models8.utilities.struct_schema.StructSchema schema:
+            The struct of the component
+        :param args:
+            Any further arguments of the component type, after the data types
+        """
+        super().__init__(schema.data_types, *args)
+        self._schema = schema
+
+    @property
+    def schema(self):
+        return self._schema
+
+    def get_dtcm_usage_in_bytes(self, n_neurons):
+        return self._schema.get_size_in_whole_words(n_neurons) * BYTES_PER_WORD
+
+    def get_sdram_usage_in_bytes(self, n_neurons):
+        return self._schema.get_size_in_whole_words(n_neurons) * BYTES_PER_WORD
+
+    def add_parameters(self, parameters):
+        for name in self._schema.variable_names_of(PARAMETER):
+            parameters[name] = getattr(self, name)
+
+    def add_state_variables(self, state_variables):
+        for name in self._schema.variable_names_of(STATE_VARIABLE):
+            state_variables[name] = getattr(self, name)
+
+    def get_derived_values(self, parameters, state_variables, vertex_slice,
+                           ts):
+        """ Get the values of the derived fields of the struct
+
+        :param ~spinn_utilities.ranged.RangeDictionary parameters:
+            The holder of the parameters
+        :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+            The holder of the state variables
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The slice of variables being retrieved
+        :param float ts:
+            The time to be advanced in one call to the update of this component
+        :return: The value(s) of each derived field, by name
+        :rtype: dict(str, object)
+        """
+        # pylint: disable=unused-argument
+        return dict()
+
+    def get_values(self, parameters, state_variables, vertex_slice, ts):
+        derived = self.get_derived_values(
+            parameters, state_variables, vertex_slice, ts)
+        holders = {PARAMETER: parameters, STATE_VARIABLE: state_variables,
+                   DERIVED: derived}
+        return [holders[field.kind][field.name]
+                for field in self._schema.fields]
+
+    def get_data(self, parameters, state_variables, vertex_slice, ts):
+        return self._schema.get_data(
+            parameters, state_variables, vertex_slice,
+            self.get_derived_values(
+                parameters, state_variables, vertex_slice, ts))
+
+    def update_values(self, values, parameters, state_variables):
+        for field, value in zip(self._schema.fields, values):
+            if field.kind == STATE_VARIABLE:
+                state_variables[field.name] = value
+
+    def read_data(
+            self, data, offset, vertex_slice, parameters, state_variables):
+        return self._schema.read_data(
+            data, offset, vertex_slice, state_variables)
+
+    def has_variable(self, variable):
+        return variable in self._schema.units
+
+    def get_units(self, variable):
+        return self._schema.units[variable]
+
+
+class SchemaNeuronModel(SchemaNeuronComponent):
+    """ Makes a neuron model out of a
+        :py:class:`~python_models8.utilities.struct_schema.StructSchema`,\
+        writing the global parameters of the model before the structs; put\
+        it before the model type in the bases, e.g.::
+
+            class MyNeuronModel(SchemaNeuronModel, AbstractNeuronModel):
+
+    The global parameters are still those of\
+    :py:meth:`~spynnaker.pyNN.models.neuron.neuron_models.\
+    AbstractNeuronModel.get_global_values`.
+    """
+
+    def __init__(self, schema, global_data_types=None):
+        """
+        :param ~python_models8.utilities.struct_schema.StructSchema schema:
+            The struct of each neuron
+        :param global_data_types:
+            The data types of the global parameters of the model, in order
+        :type global_data_types:
+            list(~data_specification.enums.DataType) or None
+        """
+        super().__init__(schema, global_data_types)
+
+    @property
+    def __global_size(self):
+        return self.global_struct.get_size_in_whole_words() * BYTES_PER_WORD
+
+    def get_dtcm_usage_in_bytes(self, n_neurons):
+        return super().get_dtcm_usage_in_bytes(n_neurons) + self.__global_size
+
+    def get_sdram_usage_in_bytes(self, n_neurons):
+        return super().get_sdram_usage_in_bytes(n_neurons) + \
+            self.__global_size
+
+    def get_data(self, parameters, state_variables, vertex_slice, ts):
+        global_data = self.global_struct.get_data(self.get_global_values(ts))
+        return numpy.concatenate([global_data, super().get_data(
+            parameters, state_variables, vertex_slice, ts)])
+
+    def read_data(
+            self, data, offset, vertex_slice, parameters, state_variables):
+        return super().read_data(
+            data, offset + self.__global_size, vertex_slice, parameters,
+            state_variables)
@@ -0,0 +1,43 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.overrides import overrides
+from spinn_front_end_common.utilities.exceptions import ConfigurationException
+from spynnaker.pyNN.models.neuron import AbstractPopulationVertex
+
+#: The analogue variables whose recording interval is set by the population
+_ANALOGUE = ("v", "gsyn_exc", "gsyn_inh")
+
+
+class SEMDPopulationVertex(AbstractPopulationVertex):
+    """ A population of sEMD neurons whose voltage and inputs are recorded\
+        at the recording interval of the neuron implementation, if it has\
+        one, as that is when the core writes them
+    """
+
+    __slots__ = []
+
+    @overrides(AbstractPopulationVertex.set_recording)
+    def set_recording(self, variable, new_state=True, sampling_interval=None,
+                      indexes=None):
+        interval = self.neuron_impl.recording_interval
+        if new_state and variable in _ANALOGUE and interval is not None:
+            if sampling_interval is None:
+                sampling_interval = interval
+            elif sampling_interval != interval:
+                raise ConfigurationException(
+                    "{} is recorded every {} ms so must be recorded with "
+                    "that sampling interval".format(variable, interval))
+        super().set_recording(variable, new_state, sampling_interval, indexes)
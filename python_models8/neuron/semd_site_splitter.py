@@ -0,0 +1,58 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from spinn_utilities.overrides import overrides
+from pacman.exceptions import PacmanPartitionException
+from pacman.model.partitioner_splitters.abstract_splitters import (
+    AbstractSplitterSlice)
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    SplitterAbstractPopulationVertexSlice)
+
+
+class SEMDSiteSplitter(SplitterAbstractPopulationVertexSlice):
+    """ Splits a population of multi-direction sEMD neurons so that every\
+        core holds whole sites; where the resources of a core only fit part\
+        of a site, the slice is cut back to the last whole site
+    """
+
+    __slots__ = ["__site_size"]
+
+    def __init__(self, site_size):
+        """
+        :param int site_size: The number of neurons in a site
+        """
+        super().__init__()
+        self.__site_size = site_size
+
+    def __whole_sites(self, lo_atom, hi_atom):
+        """ Get the last atom of the whole sites from lo_atom to hi_atom
+
+        :rtype: int
+        """
+        n_atoms = hi_atom - lo_atom + 1
+        return lo_atom + n_atoms - n_atoms % self.__site_size - 1
+
+    @overrides(AbstractSplitterSlice._scale_down_resources)
+    def _scale_down_resources(self, lo_atom, hi_atom, resource_tracker):
+        # The resources reserved for the cut part of a site are left spare
+        used_placements, hi_atom = super()._scale_down_resources(
+            lo_atom, self.__whole_sites(lo_atom, hi_atom), resource_tracker)
+        site_hi_atom = self.__whole_sites(lo_atom, hi_atom)
+        if site_hi_atom < lo_atom:
+            raise PacmanPartitionException(
+                "Not enough resources available to place a whole site of {} "
+                "neurons of {}".format(
+                    self.__site_size, self._governed_app_vertex))
+        return used_placements, site_hi_atom
@@ -2,6 +2,11 @@ import numpy
 from spinn_utilities.overrides import overrides
 from data_specification.enums import DataType
 from spynnaker.pyNN.models.neuron.synapse_types import AbstractSynapseType
+from python_models8.neuron.schema_neuron_component import (
+    SchemaNeuronComponent)
+from python_models8.utilities.cycle_costs import estimate_cycles
+from python_models8.utilities.struct_schema import (
+    SchemaField, StructSchema, PARAMETER, STATE_VARIABLE, DERIVED)
 
 # TODO: create constants to match the parameter names
 EX_SYNAPSE = 'my_ex_synapse_parameter'
@@ -9,15 +14,30 @@ IN_SYNAPSE = 'my_in_synapse_parameter'
 EXC_INIT = 'my_exc_init'
 INH_INIT = 'my_inh_init'
 
-# TODO: create units for each parameter
-UNITS = {
-    EX_SYNAPSE: "mV",
-    IN_SYNAPSE: 'mV',
-    EXC_INIT: "uS",
-    INH_INIT: "uS"}
-
-
-class MySynapseType(AbstractSynapseType):
+# TODO: Declare the fields of synapse_param_t in order, with their units,
+# and the parameters from which the derived fields are worked out; the
+# struct in my_synapse_type_struct.h is generated from this (see
+# python_models8.utilities.struct_schema)
+SCHEMA = StructSchema("synapse_param_t", [
+    SchemaField("my_exc_decay", DataType.U032, kind=DERIVED,
+                c_type="decay_t"),
+    SchemaField("my_exc_scale", DataType.U032, kind=DERIVED,
+                c_name="my_exc_init", c_type="decay_t"),
+    SchemaField("my_inh_decay", DataType.U032, kind=DERIVED,
+                c_type="decay_t"),
+    SchemaField("my_inh_scale", DataType.U032, kind=DERIVED,
+                c_name="my_inh_init", c_type="decay_t"),
+    SchemaField(EXC_INIT, DataType.S1615, "uS", kind=STATE_VARIABLE,
+                c_name="my_input_buffer_excitatory_value", c_type="input_t"),
+    SchemaField(INH_INIT, DataType.S1615, "uS", kind=STATE_VARIABLE,
+                c_name="my_input_buffer_inhibitory_value", c_type="input_t")
+], extra_variables=[
+    SchemaField(EX_SYNAPSE, DataType.S1615, "mV", kind=PARAMETER),
+    SchemaField(IN_SYNAPSE, DataType.S1615, "mV", kind=PARAMETER)
+])
+
+
+class MySynapseType(SchemaNeuronComponent, AbstractSynapseType):
     def __init__(
             self,
 
@@ -27,15 +47,8 @@ class MySynapseType(AbstractSynapseType):
             my_exc_init,
             my_inh_init):
 
-        # TODO: Update the data types - this must match the struct exactly
-        super().__init__([
-            DataType.U032,  # my_exc_decay
-            DataType.U032,  # my_exc_init
-            DataType.U032,  # my_inh_decay
-            DataType.U032,  # my_inh_init
-            DataType.S1615,  # my_input_buffer_excitatory_value
-            DataType.S1615   # my_input_buffer_inhibitory_value;
-        ])
+        # The data types and packing come from the schema
+        super().__init__(SCHEMA)
 
         # TODO: Store the parameters
         self._my_ex_synapse_parameter = my_ex_synapse_parameter
@@ -97,46 +110,20 @@ class MySynapseType(AbstractSynapseType):
         return "excitatory", "inhibitory"
 
     def get_n_cpu_cycles(self, n_neurons):
-        # TODO: Calculate (or guess) the CPU cycles
-        return 10 * n_neurons
-
-    def add_parameters(self, parameters):
-        # TODO: Add initial values of the parameters that the user can change
-        parameters[EX_SYNAPSE] = self._my_ex_synapse_parameter
-        parameters[IN_SYNAPSE] = self._my_in_synapse_parameter
-
-    def add_state_variables(self, state_variables):
-        # TODO: Add initial values of the state variables that the user can
-        # change
-        state_variables[EXC_INIT] = self._my_exc_init
-        state_variables[INH_INIT] = self._my_inh_init
-
-    def get_values(self, parameters, state_variables, vertex_slice, ts):
-        # TODO: Return, in order of the struct, the values from the parameters,
-        # state variables, or other
+        # TODO: Add a row for the model to utilities/cycle_costs.json, then
+        # regenerate it from benchmark output
+        return estimate_cycles(
+            "MySynapseType", n_neurons,
+            n_receptors=self.get_n_synapse_types())
+
+    def get_derived_values(self, parameters, state_variables, vertex_slice,
+                           ts):
+        # TODO: Work out the value of each derived field of the struct
         tsfloat = float(ts) / 1000.0
         decay = lambda x: numpy.exp(-tsfloat / x)  # noqa E731
         init = lambda x: (x / tsfloat) * (1.0 - numpy.exp(-tsfloat / x))  # noqa E731
-        return [parameters[EX_SYNAPSE].apply_operation(decay),
-                parameters[EX_SYNAPSE].apply_operation(init),
-                parameters[IN_SYNAPSE].apply_operation(decay),
-                parameters[IN_SYNAPSE].apply_operation(init),
-                state_variables[EXC_INIT], state_variables[INH_INIT]]
-
-    def update_values(self, values, parameters, state_variables):
-        # TODO: From the list of values given in order of the struct, update
-        # the parameters and state variables
-        (_ex_decay, _ex_init, _in_decay, _in_init, exc_init, inh_init) = values
-
-        # NOTE: If you know that the value doesn't change, you don't have to
-        # assign it (hint: often only state variables are likely to change)!
-        state_variables[EXC_INIT] = exc_init
-        state_variables[INH_INIT] = inh_init
-
-    def has_variable(self, variable):
-        # This works from the UNITS dict, so no changes are required
-        return variable in UNITS
-
-    def get_units(self, variable):
-        # This works from the UNITS dict, so no changes are required
-        return UNITS[variable]
+        return {
+            "my_exc_decay": parameters[EX_SYNAPSE].apply_operation(decay),
+            "my_exc_scale": parameters[EX_SYNAPSE].apply_operation(init),
+            "my_inh_decay": parameters[IN_SYNAPSE].apply_operation(decay),
+            "my_inh_scale": parameters[IN_SYNAPSE].apply_operation(init)}
@@ -0,0 +1,228 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_utilities.overrides import overrides
+from data_specification.enums import DataType
+from spynnaker.pyNN.models.neuron.synapse_types import AbstractSynapseType
+from python_models8.utilities.cycle_costs import estimate_cycles
+
+TAU_SYN_E = 'tau_syn_E'
+TAU_SYN_I = 'tau_syn_I'
+ISYN_EXC = "isyn_exc"
+ISYN_INH = "isyn_inh"
+U = "U"
+TAU_REC = "tau_rec"
+X_EXC = "x_exc"
+X_INH = "x_inh"
+
+UNITS = {
+    TAU_SYN_E: "ms",
+    TAU_SYN_I: "ms",
+    ISYN_EXC: "",
+    ISYN_INH: "",
+    U: "",
+    TAU_REC: "ms",
+    X_EXC: "",
+    X_INH: ""
+}
+
+
+class SynapseTypeExponentialDepression(AbstractSynapseType):
+    """ Exponentially decaying current synapses whose input is scaled by a\
+        depressing resource per postsynaptic neuron and receptor.
+
+    Each tick, input :math:`w` arriving on a receptor with resource\
+    :math:`x` adds :math:`w x` to the synaptic current and uses\
+    :math:`\\min(U w, 1)` of the resource that is left; the resource then\
+    recovers towards 1 with time constant :math:`\\tau_{rec}`. As the\
+    resource is held with the synapse shaping state rather than in the\
+    synaptic rows, the rows are the same as for static synapses.
+    """
+    __slots__ = [
+        "__tau_syn_E",
+        "__tau_syn_I",
+        "__isyn_exc",
+        "__isyn_inh",
+        "__U",
+        "__tau_rec",
+        "__x_exc",
+        "__x_inh"]
+
+    def __init__(self, tau_syn_E, tau_syn_I, isyn_exc, isyn_inh, U, tau_rec,
+                 x_exc, x_inh):
+        r"""
+        :param tau_syn_E: :math:`\tau^{syn}_e`
+        :type tau_syn_E:
+            float, iterable(float), ~pyNN.random.RandomDistribution
+            or (mapping) function
+        :param tau_syn_I: :math:`\tau^{syn}_i`
+        :type tau_syn_I:
+            float, iterable(float), ~pyNN.random.RandomDistribution
+            or (mapping) function
+        :param isyn_exc: :math:`I^{syn}_e`
+        :type isyn_exc:
+            float, iterable(float), ~pyNN.random.RandomDistribution
+            or (mapping) function
+        :param isyn_inh: :math:`I^{syn}_i`
+        :type isyn_inh:
+            float, iterable(float), ~pyNN.random.RandomDistribution
+            or (mapping) function
+        :param U: :math:`U`, the fraction of the resource used per unit of
+            weight
+        :type U:
+            float, iterable(float), ~pyNN.random.RandomDistribution
+            or (mapping) function
+        :param tau_rec: :math:`\tau_{rec}`
+        :type tau_rec:
+            float, iterable(float), ~pyNN.random.RandomDistribution
+            or (mapping) function
+        :param x_exc: :math:`x_e`, the excitatory resource
+        :type x_exc:
+            float, iterable(float), ~pyNN.random.RandomDistribution
+            or (mapping) function
+        :param x_inh: :math:`x_i`, the inhibitory resource
+        :type x_inh:
+            float, iterable(float), ~pyNN.random.RandomDistribution
+            or (mapping) function
+        """
+        # pylint: disable=too-many-arguments
+        super().__init__([
+            DataType.U032,    # decay_E
+            DataType.U032,    # init_E
+            DataType.S1615,   # isyn_exc
+            DataType.S1615,   # x_exc
+            DataType.U032,    # decay_I
+            DataType.U032,    # init_I
+            DataType.S1615,   # isyn_inh
+            DataType.S1615,   # x_inh
+            DataType.S1615,   # U
+            DataType.U032])   # recovery decay
+        self.__tau_syn_E = tau_syn_E
+        self.__tau_syn_I = tau_syn_I
+        self.__isyn_exc = isyn_exc
+        self.__isyn_inh = isyn_inh
+        self.__U = U
+        self.__tau_rec = tau_rec
+        self.__x_exc = x_exc
+        self.__x_inh = x_inh
+
+    @overrides(AbstractSynapseType.get_n_cpu_cycles)
+    def get_n_cpu_cycles(self, n_neurons):
+        return estimate_cycles(
+            "SynapseTypeExponentialDepression", n_neurons,
+            n_receptors=self.get_n_synapse_types())
+
+    @overrides(AbstractSynapseType.add_parameters)
+    def add_parameters(self, parameters):
+        parameters[TAU_SYN_E] = self.__tau_syn_E
+        parameters[TAU_SYN_I] = self.__tau_syn_I
+        parameters[U] = self.__U
+        parameters[TAU_REC] = self.__tau_rec
+
+    @overrides(AbstractSynapseType.add_state_variables)
+    def add_state_variables(self, state_variables):
+        state_variables[ISYN_EXC] = self.__isyn_exc
+        state_variables[ISYN_INH] = self.__isyn_inh
+        state_variables[X_EXC] = self.__x_exc
+        state_variables[X_INH] = self.__x_inh
+
+    @overrides(AbstractSynapseType.get_units)
+    def get_units(self, variable):
+        return UNITS[variable]
+
+    @overrides(AbstractSynapseType.has_variable)
+    def has_variable(self, variable):
+        return variable in UNITS
+
+    @overrides(AbstractSynapseType.get_values)
+    def get_values(self, parameters, state_variables, vertex_slice, ts):
+        """
+        :param int ts: machine time step
+        """
+        # pylint: disable=arguments-differ
+
+        tsfloat = float(ts) / 1000.0
+        decay = lambda x: numpy.exp(-tsfloat / x)  # noqa E731
+        init = lambda x: (x / tsfloat) * (1.0 - numpy.exp(-tsfloat / x))  # noqa E731
+
+        # Add the rest of the data
+        return [parameters[TAU_SYN_E].apply_operation(decay),
+                parameters[TAU_SYN_E].apply_operation(init),
+                state_variables[ISYN_EXC], state_variables[X_EXC],
+                parameters[TAU_SYN_I].apply_operation(decay),
+                parameters[TAU_SYN_I].apply_operation(init),
+                state_variables[ISYN_INH], state_variables[X_INH],
+                parameters[U], parameters[TAU_REC].apply_operation(decay)]
+
+    @overrides(AbstractSynapseType.update_values)
+    def update_values(self, values, parameters, state_variables):
+
+        # Read the data
+        (_decay_E, _init_E, isyn_exc, x_exc, _decay_I, _init_I, isyn_inh,
+         x_inh, _U, _decay_rec) = values
+
+        state_variables[ISYN_EXC] = isyn_exc
+        state_variables[ISYN_INH] = isyn_inh
+        state_variables[X_EXC] = x_exc
+        state_variables[X_INH] = x_inh
+
+    @overrides(AbstractSynapseType.get_n_synapse_types)
+    def get_n_synapse_types(self):
+        return 2
+
+    @overrides(AbstractSynapseType.get_synapse_id_by_target)
+    def get_synapse_id_by_target(self, target):
+        if target == "excitatory":
+            return 0
+        elif target == "inhibitory":
+            return 1
+        raise ValueError("Unknown target {}".format(target))
+
+    @overrides(AbstractSynapseType.get_synapse_targets)
+    def get_synapse_targets(self):
+        return "excitatory", "inhibitory"
+
+    @property
+    def tau_syn_E(self):
+        return self.__tau_syn_E
+
+    @property
+    def tau_syn_I(self):
+        return self.__tau_syn_I
+
+    @property
+    def isyn_exc(self):
+        return self.__isyn_exc
+
+    @property
+    def isyn_inh(self):
+        return self.__isyn_inh
+
+    @property
+    def U(self):
+        return self.__U
+
+    @property
+    def tau_rec(self):
+        return self.__tau_rec
+
+    @property
+    def x_exc(self):
+        return self.__x_exc
+
+    @property
+    def x_inh(self):
+        return self.__x_inh
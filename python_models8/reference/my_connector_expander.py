@@ -0,0 +1,144 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import ctypes
+import os
+import shutil
+import subprocess
+import tempfile
+import numpy
+
+#: The connections of a row, as generated on the machine
+CONNECTIONS_DTYPE = [("source", "uint32"), ("target", "uint16")]
+
+#: The directory of the C code of the connection generators
+C_SOURCE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(
+        os.path.abspath(__file__)))),
+    "c_models", "src", "my_models", "connection_generators")
+
+#: The host build of my_connector_band.h
+HOST_SOURCE = os.path.join(C_SOURCE_DIR, "my_connector_band_host.c")
+
+_library = None
+
+
+def host_compiler():
+    """ Get the C compiler used to build the expansion on the host; this is\
+        ``$CC`` if set, or ``cc`` otherwise
+
+    :return: The path of the compiler, or ``None`` if there is none
+    :rtype: str or None
+    """
+    return shutil.which(os.environ.get("CC", "cc"))
+
+
+def load_band_library():
+    """ Build my_connector_band.h into a shared library for the host, once\
+        per process, and load it
+
+    :rtype: ~ctypes.CDLL
+    :raises OSError: If there is no compiler or the source cannot be found
+    :raises ~subprocess.CalledProcessError: If the source does not compile
+    """
+    global _library  # pylint: disable=global-statement
+    if _library is not None:
+        return _library
+    compiler = host_compiler()
+    if compiler is None:
+        raise OSError("No C compiler found to build the expansion")
+    if not os.path.isfile(HOST_SOURCE):
+        raise OSError("Cannot find {}".format(HOST_SOURCE))
+    build_dir = tempfile.mkdtemp(prefix="my_connector_band")
+    library_path = os.path.join(build_dir, "my_connector_band.so")
+    subprocess.check_call([
+        compiler, "-std=gnu99", "-Wall", "-Werror", "-O2", "-shared", "-fPIC",
+        "-I", C_SOURCE_DIR, "-o", library_path, HOST_SOURCE])
+    library = ctypes.CDLL(library_path)
+    library.my_connector_band_host.restype = ctypes.c_uint32
+    library.my_connector_band_host.argtypes = [ctypes.c_uint32] * 6 + [
+        numpy.ctypeslib.ndpointer(numpy.uint16, flags="C_CONTIGUOUS")]
+    _library = library
+    return library
+
+
+def expand_my_connector(
+        connector_params, pre_vertex_slice, post_vertex_slice,
+        max_row_length):
+    """ Expand the connections of a slice pair on the host with the C code\
+        that the synapse expander runs, my_connector_band.h
+
+    :param ~numpy.ndarray connector_params: The connector parameters, as\
+        written by\
+        :py:meth:`~python_models8.connectors.my_connector.MyConnector.gen_connector_params`
+    :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        The presynaptic slice, expanded one row per neuron
+    :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        The postsynaptic slice
+    :param int max_row_length: The most connections in each row
+    :return: The connections, in order of source and then target
+    :rtype: ~numpy.ndarray
+    :raises OSError: If the C code cannot be built on the host
+    """
+    band = load_band_library().my_connector_band_host
+    n_neighbours, exclude_self = (int(value) for value in connector_params)
+    post_start = post_vertex_slice.lo_atom
+    indices = numpy.zeros(max(max_row_length, 1), dtype=numpy.uint16)
+    rows = list()
+    for pre in range(pre_vertex_slice.lo_atom, pre_vertex_slice.hi_atom + 1):
+        n_conns = band(
+            n_neighbours, exclude_self, pre, post_start,
+            post_vertex_slice.n_atoms, max_row_length, indices)
+        # The machine writes targets relative to post_start; these are made
+        # absolute, like those of the host block
+        row = numpy.zeros(n_conns, dtype=CONNECTIONS_DTYPE)
+        row["source"] = pre
+        row["target"] = indices[:n_conns].astype("uint32") + post_start
+        rows.append(row)
+    return numpy.concatenate(rows)
+
+
+def matches_host_expansion(
+        connector, synapse_info, pre_vertex_slice, post_vertex_slice):
+    """ Check that the machine expansion of a slice pair gives the same\
+        connections as the host, bit for bit
+
+    Each row is limited to the maximum row length that the host allocates,\
+    so this also checks that the bound never cuts a row short.  Weights and\
+    delays are not compared, as those drawn from random distributions use\
+    the random number generator of the machine.
+
+    :param ~python_models8.connectors.my_connector.MyConnector connector:
+        The connector, with its projection information set
+    :param SynapseInformation synapse_info: The synapse information
+    :param ~pacman.model.graphs.common.Slice pre_vertex_slice:
+        The presynaptic slice
+    :param ~pacman.model.graphs.common.Slice post_vertex_slice:
+        The postsynaptic slice
+    :rtype: bool
+    """
+    params = connector.gen_connector_params(
+        None, None, pre_vertex_slice, post_vertex_slice,
+        synapse_info.synapse_type, synapse_info)
+    max_row_length = connector.get_n_connections_from_pre_vertex_maximum(
+        post_vertex_slice, synapse_info)
+    machine = expand_my_connector(
+        params, pre_vertex_slice, post_vertex_slice, max_row_length)
+    host = connector.create_synaptic_block(
+        None, None, pre_vertex_slice, post_vertex_slice,
+        synapse_info.synapse_type, synapse_info)
+    return (
+        numpy.array_equal(machine["source"], host["source"]) and
+        numpy.array_equal(machine["target"], host["target"]))
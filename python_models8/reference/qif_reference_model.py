@@ -0,0 +1,213 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
+from python_models8.neuron.neuron_models.neuron_model_quadratic_integrate_and_fire import (  # noqa: E501
+    C, V, I_OFFSET, TAU_REFRAC, COUNT_REFRAC, check_burst)
+from python_models8.reference.synapse_shaping import shaping_for
+from python_models8.utilities.ranged_arrays import ranged_list_to_array
+
+#: The threshold correction applied to the update after a spike; matches
+#: SIMPLE_TQ_OFFSET in qif_impl.h
+SIMPLE_TQ_OFFSET = 1.85
+
+_V_THRESH = "v_thresh"
+
+
+class QIFReferenceModel(object):
+    """ Host-side engine that steps a whole population of one of the QIF\
+        builds at once using numpy arrays.
+
+    The update follows qif_impl.h (the midpoint RK2 substeps, the threshold\
+    bump of the substep after a spike, bursts and the refractory countdown)\
+    and the\
+    ordering of neuron_impl_standard.h, but in double precision, so it can\
+    be used to check the board results and to explore parameters off-board.
+
+    Current sources injected into the population are not read from the\
+    model; the current they add to each neuron (the external bias and\
+    current offset of the update on the machine) has to be passed to\
+    :py:meth:`step` or :py:meth:`run` as ``bias``.
+    """
+    __slots__ = [
+        "__burst", "__c", "__h", "__i_offset", "__n_neurons", "__n_substeps",
+        "__refract_timer", "__shaping", "__spike_counts", "__substep_h",
+        "__t_refract", "__this_h", "__v", "__v_peak", "__v_thresh"]
+
+    def __init__(self, model, n_neurons, timestep=1.0):
+        """
+        :param model: The QIF build to mirror, e.g. a\
+            :py:class:`~python_models8.neuron.builds.qif_curr_exp.QIFCurrExp`
+        :type model:
+            ~spynnaker.pyNN.models.neuron.AbstractPyNNNeuronModelStandard
+        :param int n_neurons: The number of neurons to simulate
+        :param float timestep: The simulation time step in ms
+        """
+        # pylint: disable=protected-access
+        neuron_impl = model._model
+        neuron_model = neuron_impl.neuron_model
+        parameters = SpynnakerRangeDictionary(n_neurons)
+        state_variables = SpynnakerRangeDictionary(n_neurons)
+        neuron_impl.add_parameters(parameters)
+        neuron_impl.add_state_variables(state_variables)
+
+        self.__n_neurons = n_neurons
+        self.__h = float(timestep)
+        self.__c = self.__values(parameters, C)
+        self.__i_offset = self.__values(parameters, I_OFFSET)
+        self.__t_refract = numpy.ceil(
+            self.__values(parameters, TAU_REFRAC) / self.__h).astype("int32")
+        # These are the same for the whole population
+        self.__n_substeps = neuron_model.n_substeps
+        self.__substep_h = self.__h / self.__n_substeps
+        self.__v_peak = neuron_model.v_peak
+        self.__v_thresh = self.__values(parameters, _V_THRESH)
+        self.__burst = neuron_model.burst
+        check_burst(self.__burst, self.__t_refract)
+        self.__v = self.__values(state_variables, V)
+        self.__refract_timer = ranged_list_to_array(
+            state_variables[COUNT_REFRAC], 0, n_neurons, dtype="int32")
+        self.__this_h = numpy.full(n_neurons, self.__substep_h)
+        self.__spike_counts = numpy.zeros(n_neurons, dtype="int32")
+        self.__shaping = shaping_for(
+            parameters, state_variables, n_neurons, self.__h)
+
+    def __values(self, holder, key):
+        return ranged_list_to_array(holder[key], 0, self.__n_neurons)
+
+    @property
+    def n_neurons(self):
+        """ The number of neurons being simulated
+
+        :rtype: int
+        """
+        return self.__n_neurons
+
+    @property
+    def v(self):
+        """ The current membrane voltages
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__v
+
+    @property
+    def spike_counts(self):
+        """ The number of spikes each neuron fired in the last step
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__spike_counts
+
+    def __input_at(self, inputs, step):
+        if inputs is None:
+            return 0.0
+        inputs = numpy.asarray(inputs, dtype="float64")
+        if inputs.ndim < 2:
+            return inputs
+        return inputs[step]
+
+    def __rk2_midpoint(self, mask, h, i_total):
+        h = numpy.broadcast_to(h, mask.shape)[mask]
+        v = self.__v[mask]
+        i_total = i_total[mask]
+        eta = v + 0.5 * h * (i_total + v * v)
+        self.__v[mask] = v + h * (i_total + eta * eta)
+
+    def step(self, exc_input=0.0, inh_input=0.0, bias=0.0):
+        """ Advance every neuron by one time step
+
+        :param exc_input: The excitatory weight arriving at each neuron
+        :type exc_input: float or ~numpy.ndarray
+        :param inh_input: The inhibitory weight arriving at each neuron
+        :type inh_input: float or ~numpy.ndarray
+        :param bias: The current added to each neuron by current sources,\
+            in nA
+        :type bias: float or ~numpy.ndarray
+        :return: The voltage, excitatory and inhibitory inputs recorded at\
+            the start of the step and the mask of neurons that spiked
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
+            ~numpy.ndarray)
+        """
+        self.__shaping.add_input(exc_input, inh_input)
+        exc, inh = self.__shaping.get_input()
+        v_recorded = self.__v.copy()
+        exc_recorded = exc.copy()
+        inh_recorded = inh.copy()
+
+        # Neurons outside of the refractory period integrate
+        active = self.__refract_timer <= 0
+        i_total = exc - inh + bias + self.__i_offset
+        counts = numpy.zeros(self.__n_neurons, dtype="int32")
+        bursting = self.__burst & (self.__t_refract <= 0)
+        self.__rk2_midpoint(active, self.__this_h, i_total)
+        for _substep in range(1, self.__n_substeps):
+            # Bursting neurons reset and carry on within the step
+            crossed = active & bursting & (self.__v >= self.__v_peak)
+            counts[crossed] += 1
+            self.__v[crossed] = self.__c[crossed]
+            self.__rk2_midpoint(
+                active & (self.__v < self.__v_peak), self.__substep_h,
+                i_total)
+        self.__this_h[active] = self.__substep_h
+        self.__refract_timer[~active] -= 1
+        counts[active & (self.__v >= self.__v_peak)] += 1
+
+        # A neuron that reset within the step still reaches threshold
+        peaked = self.__v >= self.__v_peak
+        spiked = numpy.where(
+            (counts > 0) & ~peaked, self.__v_peak, self.__v) >= self.__v_thresh
+        reset = spiked & ((counts == 0) | peaked)
+        self.__v[reset] = self.__c[reset]
+        self.__this_h[spiked] = self.__substep_h * SIMPLE_TQ_OFFSET
+        self.__refract_timer[spiked] = self.__t_refract[spiked]
+        self.__spike_counts = numpy.where(spiked, numpy.maximum(counts, 1), 0)
+
+        self.__shaping.shape()
+        return v_recorded, exc_recorded, inh_recorded, spiked
+
+    def run(self, n_steps, exc_input=None, inh_input=None, bias=None):
+        """ Advance every neuron by a number of time steps
+
+        :param int n_steps: The number of time steps to run for
+        :param exc_input: The excitatory weight arriving at each neuron,\
+            either the same every step or one row per step
+        :type exc_input: None or float or ~numpy.ndarray
+        :param inh_input: The inhibitory weight arriving at each neuron,\
+            either the same every step or one row per step
+        :type inh_input: None or float or ~numpy.ndarray
+        :param bias: The current added to each neuron by current sources,\
+            either the same every step or one row per step
+        :type bias: None or float or ~numpy.ndarray
+        :return: Arrays of shape (n_steps, n_neurons) of the recorded\
+            "v", "gsyn_exc", "gsyn_inh", "spikes" and "spike_count"
+        :rtype: dict(str, ~numpy.ndarray)
+        """
+        results = {
+            "v": numpy.empty((n_steps, self.__n_neurons)),
+            "gsyn_exc": numpy.empty((n_steps, self.__n_neurons)),
+            "gsyn_inh": numpy.empty((n_steps, self.__n_neurons)),
+            "spikes": numpy.empty((n_steps, self.__n_neurons), dtype="bool"),
+            "spike_count": numpy.empty(
+                (n_steps, self.__n_neurons), dtype="int32")}
+        for step in range(n_steps):
+            (results["v"][step], results["gsyn_exc"][step],
+             results["gsyn_inh"][step], results["spikes"][step]) = self.step(
+                self.__input_at(exc_input, step),
+                self.__input_at(inh_input, step),
+                self.__input_at(bias, step))
+            results["spike_count"][step] = self.__spike_counts
+        return results
@@ -0,0 +1,271 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spynnaker.pyNN.utilities.ranged import SpynnakerRangeDictionary
+from python_models8.networks.semd_field import facilitation_pairs
+from python_models8.reference.synapse_shaping import ExponentialShaping
+from python_models8.utilities.ranged_arrays import ranged_list_to_array
+
+#: The factor turning latched inhibitory input into excitatory current;
+#: matches SCALING_FACTOR in my_neuron_impl_semd.h
+SCALING_FACTOR = 40.0
+
+#: The inhibitory input above which it is taken to have started; matches
+#: INPUT_ONSET in my_neuron_impl_semd.h
+INPUT_ONSET = 0.01
+
+#: How close to its equilibrium voltage an idle neuron must be in mV;
+#: matches IDLE_V_TOLERANCE in my_neuron_impl_semd.h
+IDLE_V_TOLERANCE = 0.001
+
+
+def detector_inputs(pixel_spikes, width, height, dx, dy, weight=1.0):
+    """ Get the input arriving at each detector of one direction of an\
+        :py:class:`~python_models8.networks.semd_field.SEMDField`, assuming\
+        the facilitating and triggering connections have the same delay
+
+    :param ~numpy.ndarray pixel_spikes: The number of spikes of each pixel\
+        in each time step, of shape (n_steps, width * height)
+    :param int width: The number of pixels in each row
+    :param int height: The number of rows
+    :param int dx: The step in x from the facilitating pixel
+    :param int dy: The step in y from the facilitating pixel
+    :param float weight: The weight of every connection
+    :return: The excitatory and inhibitory weights arriving at each\
+        detector in each time step
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    pixel_spikes = numpy.asarray(pixel_spikes, dtype="float64")
+    pairs = facilitation_pairs(width, height, dx, dy)
+    exc = numpy.zeros_like(pixel_spikes)
+    exc[:, pairs[:, 1]] = pixel_spikes[:, pairs[:, 0]] * weight
+    return exc, pixel_spikes * weight
+
+
+class SEMDReferenceModel(object):
+    """ Host-side engine that steps a whole population of\
+        :py:class:`~python_models8.neuron.builds.my_if_curr_exp_sEMD.MyIFCurrExpSEMD`\
+        at once using numpy arrays.
+
+    The update follows my_neuron_impl_semd.h: the multiplicator latched on\
+    the onset of the inhibitory input, the inhibitory input turned into\
+    excitatory current, the closed-form LIF update, the exponential\
+    synapses and the steps within a time step, but in double precision.
+
+    In active-set mode, a neuron that goes idle is skipped until weight\
+    arrives for it, and is then brought forward over the steps it missed,\
+    as on the machine; current sources are not modelled, so do not wake it.
+    """
+    __slots__ = [
+        "__active_set", "__awake", "__exp_tc", "__i_offset", "__idle_steps",
+        "__inh_previous", "__multiplicator", "__n_neurons", "__n_steps",
+        "__r_membrane", "__refract_timer", "__shaping", "__t_refract", "__v",
+        "__v_reset", "__v_rest", "__v_thresh"]
+
+    def __init__(self, model, n_neurons, timestep=1.0,
+                 n_steps_per_timestep=1):
+        """
+        :param MyIFCurrExpSEMD model: The sEMD build to mirror
+        :param int n_neurons: The number of neurons to simulate
+        :param float timestep: The simulation time step in ms
+        :param int n_steps_per_timestep:
+            The number of updates done in each time step
+        """
+        # pylint: disable=protected-access
+        neuron_impl = model._model
+        parameters = SpynnakerRangeDictionary(n_neurons)
+        state_variables = SpynnakerRangeDictionary(n_neurons)
+        neuron_impl.add_parameters(parameters)
+        neuron_impl.add_state_variables(state_variables)
+
+        self.__n_neurons = n_neurons
+        self.__n_steps = int(n_steps_per_timestep)
+        h = float(timestep) / self.__n_steps
+        tau_m = self.__values(parameters, "tau_m")
+        self.__v = self.__values(state_variables, "v")
+        self.__v_rest = self.__values(parameters, "v_rest")
+        self.__r_membrane = tau_m / self.__values(parameters, "cm")
+        self.__exp_tc = numpy.exp(-h / tau_m)
+        self.__i_offset = self.__values(parameters, "i_offset")
+        self.__v_reset = self.__values(parameters, "v_reset")
+        self.__t_refract = numpy.ceil(
+            self.__values(parameters, "tau_refrac") / h).astype("int32")
+        self.__refract_timer = ranged_list_to_array(
+            state_variables["count_refrac"], 0, n_neurons, dtype="int32")
+        self.__v_thresh = self.__values(parameters, "v_thresh")
+        self.__multiplicator = self.__values(parameters, "my_multiplicator")
+        self.__inh_previous = self.__values(
+            state_variables, "my_inh_input_previous")
+        self.__shaping = ExponentialShaping(
+            parameters, state_variables, n_neurons, h)
+        self.__active_set = neuron_impl.active_set
+        self.__awake = numpy.ones(n_neurons, dtype="bool")
+        self.__idle_steps = numpy.zeros(n_neurons, dtype="int64")
+
+    def __values(self, holder, key):
+        return ranged_list_to_array(holder[key], 0, self.__n_neurons)
+
+    @property
+    def n_neurons(self):
+        """ The number of neurons being simulated
+
+        :rtype: int
+        """
+        return self.__n_neurons
+
+    @property
+    def v(self):
+        """ The current membrane voltages
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__v
+
+    @property
+    def idle(self):
+        """ Which neurons are idle, and so are not being updated
+
+        :rtype: ~numpy.ndarray
+        """
+        return ~self.__awake
+
+    @property
+    def multiplicator(self):
+        """ The currently latched multiplicators
+
+        :rtype: ~numpy.ndarray
+        """
+        return self.__multiplicator
+
+    def __input_at(self, inputs, step):
+        if inputs is None:
+            return 0.0
+        inputs = numpy.asarray(inputs, dtype="float64")
+        if inputs.ndim < 2:
+            return inputs
+        return inputs[step]
+
+    def __equilibrium(self):
+        return self.__i_offset * self.__r_membrane + self.__v_rest
+
+    def __wake(self, woken):
+        """ Bring neurons that were idle forward over the steps they missed
+        """
+        woken = woken & ~self.__awake
+        decay = self.__exp_tc ** (self.__idle_steps * self.__n_steps)
+        alpha = self.__equilibrium()
+        self.__v[woken] = (alpha - decay * (alpha - self.__v))[woken]
+        self.__idle_steps[woken] = 0
+        self.__awake |= woken
+
+    def __go_idle(self, spiked):
+        """ Stop updating the neurons that would be all but unchanged
+        """
+        exc, inh = self.__shaping.get_input()
+        idle = (
+            ~spiked & (self.__refract_timer <= 0) &
+            (numpy.abs(self.__v - self.__equilibrium()) <= IDLE_V_TOLERANCE) &
+            (exc == 0.0) & (inh == 0.0) & (self.__multiplicator == 0.0) &
+            (self.__inh_previous == 0.0))
+        self.__awake &= ~idle
+
+    def __step(self):
+        exc, inh = self.__shaping.get_input()
+
+        # Latch the multiplicator on the onset of the inhibitory input and
+        # release it when the input has gone
+        onset = inh >= INPUT_ONSET
+        latch = (onset & (self.__multiplicator == 0.0) &
+                 (self.__inh_previous == 0.0))
+        self.__multiplicator[latch] = exc[latch]
+        self.__multiplicator[~onset] = 0.0
+        self.__inh_previous[:] = inh
+
+        # The inhibitory input becomes excitatory current
+        i_total = (
+            exc + inh * SCALING_FACTOR * self.__multiplicator +
+            self.__i_offset)
+
+        # Neurons outside of the refractory period integrate
+        active = self.__awake & (self.__refract_timer <= 0)
+        alpha = i_total * self.__r_membrane + self.__v_rest
+        self.__v[active] = (alpha - self.__exp_tc * (alpha - self.__v))[
+            active]
+        self.__refract_timer[self.__awake & ~active] -= 1
+
+        spiked = self.__awake & (self.__v >= self.__v_thresh)
+        self.__v[spiked] = self.__v_reset[spiked]
+        self.__refract_timer[spiked] = self.__t_refract[spiked]
+
+        self.__shaping.shape()
+        return spiked
+
+    def step(self, exc_input=0.0, inh_input=0.0):
+        """ Advance every neuron by one time step
+
+        :param exc_input: The excitatory weight arriving at each neuron
+        :type exc_input: float or ~numpy.ndarray
+        :param inh_input: The inhibitory weight arriving at each neuron
+        :type inh_input: float or ~numpy.ndarray
+        :return: The voltage, excitatory and inhibitory inputs recorded at\
+            the start of the step and the mask of neurons that spiked
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray, ~numpy.ndarray,
+            ~numpy.ndarray)
+        """
+        # Only weight that arrives wakes an idle neuron
+        self.__wake(
+            (numpy.broadcast_to(exc_input, self.__v.shape) != 0.0) |
+            (numpy.broadcast_to(inh_input, self.__v.shape) != 0.0))
+
+        self.__shaping.add_input(exc_input, inh_input)
+        exc, inh = self.__shaping.get_input()
+        v_recorded = self.__v.copy()
+        exc_recorded = exc.copy()
+        inh_recorded = inh.copy()
+
+        spiked = numpy.zeros(self.__n_neurons, dtype="bool")
+        for _ in range(self.__n_steps):
+            spiked |= self.__step()
+        self.__idle_steps[~self.__awake] += 1
+        if self.__active_set:
+            self.__go_idle(spiked)
+        return v_recorded, exc_recorded, inh_recorded, spiked
+
+    def run(self, n_steps, exc_input=None, inh_input=None):
+        """ Advance every neuron by a number of time steps
+
+        :param int n_steps: The number of time steps to run for
+        :param exc_input: The excitatory weight arriving at each neuron,\
+            either the same every step or one row per step
+        :type exc_input: None or float or ~numpy.ndarray
+        :param inh_input: The inhibitory weight arriving at each neuron,\
+            either the same every step or one row per step
+        :type inh_input: None or float or ~numpy.ndarray
+        :return: Arrays of shape (n_steps, n_neurons) of the recorded\
+            "v", "gsyn_exc", "gsyn_inh" and "spikes"
+        :rtype: dict(str, ~numpy.ndarray)
+        """
+        results = {
+            "v": numpy.empty((n_steps, self.__n_neurons)),
+            "gsyn_exc": numpy.empty((n_steps, self.__n_neurons)),
+            "gsyn_inh": numpy.empty((n_steps, self.__n_neurons)),
+            "spikes": numpy.empty((n_steps, self.__n_neurons), dtype="bool")}
+        for step in range(n_steps):
+            (results["v"][step], results["gsyn_exc"][step],
+             results["gsyn_inh"][step], results["spikes"][step]) = self.step(
+                self.__input_at(exc_input, step),
+                self.__input_at(inh_input, step))
+        return results
@@ -0,0 +1,241 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from python_models8.utilities.ranged_arrays import ranged_list_to_array
+
+
+def _values(holder, key, n_neurons):
+    return ranged_list_to_array(holder[key], 0, n_neurons)
+
+
+class DeltaShaping(object):
+    """ Host mirror of ``synapse_types_delta_impl.h``: each input is seen by\
+        a single update and then cleared
+    """
+    __slots__ = ["__exc", "__inh"]
+
+    def __init__(self, parameters, state_variables, n_neurons, timestep):
+        """
+        :param ~spinn_utilities.ranged.RangeDictionary parameters:
+        :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+        :param int n_neurons: The number of neurons to shape the input of
+        :param float timestep: The time advanced by one update, in ms
+        """
+        # pylint: disable=unused-argument
+        self.__exc = _values(state_variables, "isyn_exc", n_neurons)
+        self.__inh = _values(state_variables, "isyn_inh", n_neurons)
+
+    def add_input(self, exc, inh):
+        self.__exc += exc
+        self.__inh += inh
+
+    def get_input(self):
+        return self.__exc, self.__inh
+
+    def shape(self):
+        self.__exc[:] = 0.0
+        self.__inh[:] = 0.0
+
+
+class ExponentialShaping(object):
+    """ Host mirror of ``synapse_types_exponential_impl.h``
+    """
+    __slots__ = [
+        "__exc", "__exc_decay", "__exc_init",
+        "__inh", "__inh_decay", "__inh_init"]
+
+    def __init__(self, parameters, state_variables, n_neurons, timestep):
+        """
+        :param ~spinn_utilities.ranged.RangeDictionary parameters:
+        :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+        :param int n_neurons: The number of neurons to shape the input of
+        :param float timestep: The time advanced by one update, in ms
+        """
+        tau_e = _values(parameters, "tau_syn_E", n_neurons)
+        tau_i = _values(parameters, "tau_syn_I", n_neurons)
+        self.__exc_decay = numpy.exp(-timestep / tau_e)
+        self.__exc_init = (tau_e / timestep) * (1.0 - self.__exc_decay)
+        self.__inh_decay = numpy.exp(-timestep / tau_i)
+        self.__inh_init = (tau_i / timestep) * (1.0 - self.__inh_decay)
+        self.__exc = _values(state_variables, "isyn_exc", n_neurons)
+        self.__inh = _values(state_variables, "isyn_inh", n_neurons)
+
+    def add_input(self, exc, inh):
+        self.__exc += exc * self.__exc_init
+        self.__inh += inh * self.__inh_init
+
+    def get_input(self):
+        return self.__exc, self.__inh
+
+    def shape(self):
+        self.__exc *= self.__exc_decay
+        self.__inh *= self.__inh_decay
+
+
+class _DepressingBuffer(object):
+    """ One receptor of ``synapse_types_exponential_depression_impl.h``
+    """
+    __slots__ = ["__decay", "__init", "__input", "__resource"]
+
+    def __init__(self, value, resource, tau, timestep):
+        self.__input = value
+        self.__resource = resource
+        self.__decay = numpy.exp(-timestep / tau)
+        self.__init = (tau / timestep) * (1.0 - self.__decay)
+
+    @property
+    def resource(self):
+        return self.__resource
+
+    def add_input(self, weights, u):
+        self.__input += weights * self.__resource * self.__init
+        self.__resource -= self.__resource * numpy.minimum(u * weights, 1.0)
+
+    def get_input(self):
+        return self.__input
+
+    def shape(self, recovery_decay):
+        self.__input *= self.__decay
+        self.__resource[:] = 1.0 - (1.0 - self.__resource) * recovery_decay
+
+
+class DepressingExponentialShaping(object):
+    """ Host mirror of ``synapse_types_exponential_depression_impl.h``, used\
+        to validate the depression dynamics of the QifSd build
+    """
+    __slots__ = ["__exc", "__inh", "__recovery_decay", "__u"]
+
+    def __init__(self, parameters, state_variables, n_neurons, timestep):
+        """
+        :param ~spinn_utilities.ranged.RangeDictionary parameters:
+        :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+        :param int n_neurons: The number of neurons to shape the input of
+        :param float timestep: The time advanced by one update, in ms
+        """
+        self.__exc = _DepressingBuffer(
+            _values(state_variables, "isyn_exc", n_neurons),
+            _values(state_variables, "x_exc", n_neurons),
+            _values(parameters, "tau_syn_E", n_neurons), timestep)
+        self.__inh = _DepressingBuffer(
+            _values(state_variables, "isyn_inh", n_neurons),
+            _values(state_variables, "x_inh", n_neurons),
+            _values(parameters, "tau_syn_I", n_neurons), timestep)
+        self.__u = _values(parameters, "U", n_neurons)
+        self.__recovery_decay = numpy.exp(
+            -timestep / _values(parameters, "tau_rec", n_neurons))
+
+    @property
+    def resources(self):
+        """ The excitatory and inhibitory resources available to each neuron
+
+        :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+        """
+        return self.__exc.resource, self.__inh.resource
+
+    def add_input(self, exc, inh):
+        self.__exc.add_input(exc, self.__u)
+        self.__inh.add_input(inh, self.__u)
+
+    def get_input(self):
+        return self.__exc.get_input(), self.__inh.get_input()
+
+    def shape(self):
+        self.__exc.shape(self.__recovery_decay)
+        self.__inh.shape(self.__recovery_decay)
+
+
+class _AlphaBuffer(object):
+    """ One receptor of ``synapse_types_alpha_impl.h``
+    """
+    __slots__ = ["__lin", "__exp", "__dt_over_tau_sq", "__decay", "__q"]
+
+    def __init__(self, lin, exp, q, tau, timestep):
+        self.__lin = lin
+        self.__exp = exp
+        self.__q = q
+        self.__dt_over_tau_sq = timestep / (tau * tau)
+        self.__decay = numpy.exp(-timestep / tau)
+
+    def add_input(self, weights):
+        arrived = weights != 0
+        self.__q = numpy.where(arrived, weights, self.__q)
+        exp = self.__exp * self.__decay + 1.0
+        lin = (self.__lin + weights * self.__dt_over_tau_sq) * (
+            1.0 - 1.0 / exp)
+        self.__exp = numpy.where(arrived, exp, self.__exp)
+        self.__lin = numpy.where(arrived, lin, self.__lin)
+
+    def get_input(self):
+        return self.__lin * self.__exp
+
+    def shape(self):
+        self.__lin += self.__q * self.__dt_over_tau_sq
+        self.__exp *= self.__decay
+
+
+class AlphaShaping(object):
+    """ Host mirror of ``synapse_types_alpha_impl.h``
+    """
+    __slots__ = ["__exc", "__inh"]
+
+    def __init__(self, parameters, state_variables, n_neurons, timestep):
+        """
+        :param ~spinn_utilities.ranged.RangeDictionary parameters:
+        :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+        :param int n_neurons: The number of neurons to shape the input of
+        :param float timestep: The time advanced by one update, in ms
+        """
+        self.__exc = _AlphaBuffer(
+            _values(state_variables, "exc_response", n_neurons),
+            _values(state_variables, "exc_exp_response", n_neurons),
+            _values(state_variables, "q_exc", n_neurons),
+            _values(parameters, "tau_syn_E", n_neurons), timestep)
+        self.__inh = _AlphaBuffer(
+            _values(state_variables, "inh_response", n_neurons),
+            _values(state_variables, "inh_exp_response", n_neurons),
+            _values(state_variables, "q_inh", n_neurons),
+            _values(parameters, "tau_syn_I", n_neurons), timestep)
+
+    def add_input(self, exc, inh):
+        self.__exc.add_input(exc)
+        self.__inh.add_input(inh)
+
+    def get_input(self):
+        return self.__exc.get_input(), self.__inh.get_input()
+
+    def shape(self):
+        self.__exc.shape()
+        self.__inh.shape()
+
+
+def shaping_for(parameters, state_variables, n_neurons, timestep):
+    """ Select the shaping mirror that matches the synapse type whose\
+        parameters and state variables were added to the given holders
+
+    :param ~spinn_utilities.ranged.RangeDictionary parameters:
+    :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+    :param int n_neurons: The number of neurons to shape the input of
+    :param float timestep: The time advanced by one update, in ms
+    """
+    if parameters.has_key("tau_rec"):
+        shaping = DepressingExponentialShaping
+    elif state_variables.has_key("exc_response"):
+        shaping = AlphaShaping
+    elif parameters.has_key("tau_syn_E"):
+        shaping = ExponentialShaping
+    else:
+        shaping = DeltaShaping
+    return shaping(parameters, state_variables, n_neurons, timestep)
@@ -0,0 +1,193 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Estimates of the DTCM and CPU time used by a core of neurons, used to\
+    work out how many neurons can be put on each core
+
+The neuron implementation accounts for its own arrays and globals; this\
+adds what the rest of the neuron binary uses for each neuron:
+
+* the synaptic input ring buffers, one 16-bit entry per neuron, synapse\
+  type and delay slot, with the neurons and types rounded up to powers of 2
+* the recording buffers, assuming every recordable variable is recorded\
+  (as the number of neurons per core is fixed before recording is set)
+* the per-neuron time the framework spends on each neuron and on recording
+
+Where sPyNNaker has a constant for a cost, it is used; the DTCM kept back\
+and the share of each time step given to the neurons have none, so are\
+read from the ``core`` section of the cycle cost table (see\
+:py:mod:`python_models8.utilities.cycle_costs`).
+"""
+
+import math
+from spinn_machine import Processor
+from spinn_front_end_common.utilities import globals_variables
+from spinn_front_end_common.utilities.constants import (
+    BITS_PER_WORD, BYTES_PER_WORD)
+from spynnaker.pyNN.extra_algorithms.splitter_components import (
+    AbstractSpynnakerSplitterDelay, SplitterAbstractPopulationVertexSlice)
+from spynnaker.pyNN.models.common import NeuronRecorder
+from python_models8.utilities.cycle_costs import load_core_costs
+
+#: The number of bits of the synaptic ring buffer index used for the delay;\
+#: the ring buffers hold the delays a core supports without a delay\
+#: extension
+SYNAPSE_DELAY_BITS = (
+    AbstractSpynnakerSplitterDelay.MAX_SUPPORTED_DELAY_TICS - 1).bit_length()
+
+#: The size of a synaptic ring buffer entry in bytes, a 16-bit weight_t of\
+#: the synapse code of sPyNNaker
+RING_BUFFER_ENTRY_SIZE = 2
+
+#: The DTCM kept back for the stack, the framework and the synapse\
+#: processing buffers, which don't depend on the number of neurons
+DTCM_RESERVED = load_core_costs()["dtcm_reserved"]
+
+#: The fraction of each time step the neuron updates can use; the rest is\
+#: left for processing incoming spikes
+NEURON_CPU_FRACTION = load_core_costs()["neuron_cpu_fraction"]
+
+# The cycles the framework spends on each neuron, and on each neuron per
+# recorded variable, as sPyNNaker estimates them
+# pylint: disable=protected-access
+_FRAMEWORK_CYCLES_PER_NEURON = (
+    SplitterAbstractPopulationVertexSlice._NEURON_BASE_N_CPU_CYCLES_PER_NEURON)
+_RECORDING_CYCLES_PER_NEURON = NeuronRecorder._N_CPU_CYCLES_PER_NEURON
+# pylint: enable=protected-access
+
+# The words of the recording state of each variable; a rate, count,
+# increment and pointer, as in neuron_recording.h of sPyNNaker
+_RECORDING_WORDS_PER_VARIABLE = 4
+
+
+def _next_power_of_2(n):
+    return 1 << max(int(n) - 1, 0).bit_length()
+
+
+def get_ring_buffer_dtcm_usage_in_bytes(n_neurons, n_synapse_types):
+    """ Get the size of the synaptic input ring buffers
+
+    :param int n_neurons: The number of neurons on the core
+    :param int n_synapse_types: The number of synapse types
+    :rtype: int
+    """
+    return (_next_power_of_2(n_neurons) *
+            _next_power_of_2(n_synapse_types) *
+            (1 << SYNAPSE_DELAY_BITS) * RING_BUFFER_ENTRY_SIZE)
+
+
+def get_recording_dtcm_usage_in_bytes(
+        n_neurons, data_types, n_bitfield_variables=1):
+    """ Get the DTCM used to record every variable of a core of neurons
+
+    :param int n_neurons: The number of neurons on the core
+    :param data_types: The type recorded for each variable
+    :type data_types: iterable(~data_specification.enums.DataType)
+    :param int n_bitfield_variables:
+        The number of variables recorded as a bit per neuron (e.g. spikes)
+    :rtype: int
+    """
+    index_bytes = int(math.ceil(n_neurons / BYTES_PER_WORD)) * BYTES_PER_WORD
+    bitfield_bytes = int(math.ceil(n_neurons / BITS_PER_WORD)) * BYTES_PER_WORD
+    usage = 0
+    for data_type in data_types:
+        usage += (
+            _RECORDING_WORDS_PER_VARIABLE * BYTES_PER_WORD + index_bytes +
+            BYTES_PER_WORD + n_neurons * data_type.size)
+    usage += n_bitfield_variables * (
+        _RECORDING_WORDS_PER_VARIABLE * BYTES_PER_WORD + index_bytes +
+        BYTES_PER_WORD + bitfield_bytes)
+    return usage
+
+
+def get_framework_n_cpu_cycles(n_neurons, n_recorded_variables):
+    """ Get the cycles the framework spends on a core of neurons each time\
+        step, outside of the neuron implementation
+
+    :param int n_neurons: The number of neurons on the core
+    :param int n_recorded_variables: The number of variables recorded
+    :rtype: int
+    """
+    return n_neurons * (
+        _FRAMEWORK_CYCLES_PER_NEURON +
+        _RECORDING_CYCLES_PER_NEURON * n_recorded_variables)
+
+
+def get_dtcm_available_in_bytes():
+    """ Get the DTCM of a core left for the arrays of its neurons
+
+    :rtype: int
+    """
+    return Processor.DTCM_AVAILABLE - DTCM_RESERVED
+
+
+def get_n_cpu_cycles_available():
+    """ Get the cycles of each time step left for updating the neurons of a\
+        core, given the time step and time scale factor of the simulation
+
+    :rtype: int
+    """
+    sim = globals_variables.get_simulator()
+    time_scale_factor = sim.time_scale_factor or 1
+    return int(
+        Processor.CLOCK_SPEED * NEURON_CPU_FRACTION *
+        sim.machine_time_step * time_scale_factor / 1000000.0)
+
+
+def get_max_neurons_per_core(
+        dtcm_usage_in_bytes, n_cpu_cycles, max_neurons,
+        dtcm_available=None, n_cpu_cycles_available=None):
+    """ Work out the largest number of neurons that fit on a core, in both\
+        DTCM and time
+
+    :param callable(int) dtcm_usage_in_bytes:
+        The DTCM in bytes used by a number of neurons
+    :param callable(int) n_cpu_cycles:
+        The cycles used by a number of neurons each time step
+    :param int max_neurons: The most neurons to consider
+    :param dtcm_available:
+        The DTCM to fit into, or None for that of a core
+    :type dtcm_available: int or None
+    :param n_cpu_cycles_available:
+        The cycles to fit into, or None for those of a time step
+    :type n_cpu_cycles_available: int or None
+    :rtype: int
+    :raises ValueError: If not even one neuron fits
+    """
+    if dtcm_available is None:
+        dtcm_available = get_dtcm_available_in_bytes()
+    if n_cpu_cycles_available is None:
+        n_cpu_cycles_available = get_n_cpu_cycles_available()
+
+    def fits(n_neurons):
+        return (dtcm_usage_in_bytes(n_neurons) <= dtcm_available and
+                n_cpu_cycles(n_neurons) <= n_cpu_cycles_available)
+
+    if not fits(1):
+        raise ValueError(
+            "A single neuron needs {} bytes of DTCM and {} cycles, but only "
+            "{} bytes and {} cycles are available".format(
+                dtcm_usage_in_bytes(1), n_cpu_cycles(1), dtcm_available,
+                n_cpu_cycles_available))
+
+    # Both costs only grow with the number of neurons, so bisect
+    low, high = 1, int(max_neurons)
+    while low < high:
+        mid = (low + high + 1) // 2
+        if fits(mid):
+            low = mid
+        else:
+            high = mid - 1
+    return low
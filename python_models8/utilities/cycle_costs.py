@@ -0,0 +1,254 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Per-component CPU cycle costs, loaded from a table that can be\
+    regenerated from benchmark output
+
+Each component has a row of coefficients in ``cycle_costs.json``; the cost\
+of one time step of ``n_neurons`` neurons is::
+
+    n_neurons * (per_neuron + per_substep * n_substeps +
+                 per_receptor * n_receptors + ...)
+
+Components that skip part of the update of quiescent neurons list the terms\
+that are skipped in ``skipped``, e.g. ``["per_substep"]``; the other terms are\
+paid by every neuron.  Without ``skipped`` the whole update is skipped, and\
+``per_quiescent_neuron`` is paid by every neuron instead (see\
+:py:func:`estimate_skipping_cycles`).
+
+To regenerate the table, run the benchmarks to produce a CSV file with the\
+columns ``component``, ``n_neurons``, ``cycles`` and one column per count\
+(``n_substeps``, ``n_receptors``, ``n_steps``...), then::
+
+    python -m python_models8.utilities.cycle_costs benchmark.csv
+
+Benchmarks of skipping components may add an ``activity`` column, the\
+fraction of updates not skipped, to fit ``per_quiescent_neuron`` as well.\
+Fitted terms are merged into the existing rows, so terms that were not\
+measured keep their previous values.
+
+The ``core`` section of the table holds the budget of a core that the\
+neurons are fitted into (see :py:func:`load_core_costs`).
+"""
+
+import csv
+import json
+import os
+import sys
+import numpy
+
+#: The table shipped with the package
+DEFAULT_TABLE = os.path.join(os.path.dirname(__file__), "cycle_costs.json")
+
+_COUNT_PREFIX = "n_"
+_TERM_PREFIX = "per_"
+_PER_NEURON = "per_neuron"
+_PER_QUIESCENT_NEURON = "per_quiescent_neuron"
+_SKIPPED = "skipped"
+_ACTIVITY = "activity"
+
+_tables = dict()
+
+
+def _term(count):
+    """ The name of the coefficient of a count, e.g. ``per_substep`` for\
+        ``n_substeps``
+    """
+    name = count[len(_COUNT_PREFIX):]
+    if name.endswith("s"):
+        name = name[:-1]
+    return _TERM_PREFIX + name
+
+
+def _load_table(filename):
+    if filename not in _tables:
+        with open(filename, encoding="utf-8") as f:
+            _tables[filename] = json.load(f)
+    return _tables[filename]
+
+
+def load_cycle_costs(filename=DEFAULT_TABLE):
+    """ Load a table of cycle coefficients, reusing it if already loaded
+
+    :param str filename: The JSON file to read
+    :return: The coefficients of each component, by component name
+    :rtype: dict(str, dict(str, float))
+    """
+    return _load_table(filename)["components"]
+
+
+def load_core_costs(filename=DEFAULT_TABLE):
+    """ Load the budget of a core of neurons from a table
+
+    This has ``dtcm_reserved``, the bytes of DTCM kept back for the stack,\
+    the framework and the synapse processing buffers, and\
+    ``neuron_cpu_fraction``, the share of each time step given to updating\
+    the neurons rather than to processing incoming spikes.
+
+    :param str filename: The JSON file to read
+    :rtype: dict(str, float)
+    """
+    return _load_table(filename)["core"]
+
+
+def get_cycle_coefficients(component):
+    """ Get the coefficients of a component from the default table
+
+    :param str component: The name of the component class
+    :return: The coefficients by term name, e.g. ``per_neuron``
+    :rtype: dict(str, float)
+    :raises KeyError: If the component is not in the table
+    """
+    row = load_cycle_costs()[component]
+    return {term: value for term, value in row.items()
+            if term.startswith(_TERM_PREFIX)}
+
+
+def _term_cycles(component, counts):
+    coefficients = get_cycle_coefficients(component)
+    cycles = {_PER_NEURON: coefficients.get(_PER_NEURON, 0.0)}
+    for name, count in counts.items():
+        term = _term(name)
+        cycles[term] = coefficients.get(term, 0.0) * count
+    return cycles
+
+
+def _per_neuron_cycles(component, counts):
+    return sum(_term_cycles(component, counts).values())
+
+
+def estimate_cycles(component, n_neurons, **counts):
+    """ Estimate the cycles taken by a component to update its neurons once
+
+    :param str component: The name of the component class
+    :param int n_neurons: The number of neurons updated
+    :param counts:
+        The number of each thing per neuron, e.g. ``n_substeps=4``; terms
+        without a count in the table are ignored
+    :rtype: int
+    """
+    return int(numpy.ceil(
+        _per_neuron_cycles(component, counts) * n_neurons))
+
+
+def estimate_skipping_cycles(component, n_neurons, activity, **counts):
+    """ Estimate the cycles taken by a component that skips the update of\
+        quiescent neurons; only the terms listed in the ``skipped`` of the\
+        component are scaled by the activity, or if it has none, the whole\
+        update is, and each neuron costs ``per_quiescent_neuron`` instead
+
+    :param str component: The name of the component class
+    :param int n_neurons: The number of neurons updated
+    :param float activity: The fraction of updates that are not skipped
+    :param counts: The number of each thing per neuron, as for\
+        :py:func:`estimate_cycles`
+    :rtype: int
+    """
+    skipped = load_cycle_costs()[component].get(_SKIPPED)
+    per_neuron = get_cycle_coefficients(component).get(
+        _PER_QUIESCENT_NEURON, 0.0)
+    activity = min(max(float(activity), 0.0), 1.0)
+    for term, cycles in _term_cycles(component, counts).items():
+        if skipped is None or term in skipped:
+            cycles *= activity
+        per_neuron += cycles
+    return int(numpy.ceil(per_neuron * n_neurons))
+
+
+def fit_cycle_costs(rows, skipped=None):
+    """ Fit the coefficients of each component to benchmark measurements by\
+        least squares
+
+    Components measured with an ``activity`` are fitted to the model of\
+    :py:func:`estimate_skipping_cycles`, which adds ``per_quiescent_neuron``\
+    to those that skip their whole update.
+
+    :param rows: Measurements, each with ``component``, ``n_neurons``,\
+        ``cycles``, any ``n_*`` counts and optionally ``activity``, as read\
+        by :py:class:`csv.DictReader`
+    :type rows: iterable(dict(str, str))
+    :param skipped: The terms skipped by each component that skips only part\
+        of its update
+    :type skipped: dict(str, list(str)) or None
+    :return: The coefficients of each component, by component name
+    :rtype: dict(str, dict(str, float))
+    """
+    by_component = dict()
+    for row in rows:
+        by_component.setdefault(row["component"], list()).append(row)
+
+    components = dict()
+    for component, measurements in sorted(by_component.items()):
+        counts = sorted(
+            key for key in measurements[0]
+            if key.startswith(_COUNT_PREFIX) and key != "n_neurons" and
+            any(float(m[key] or 0) for m in measurements))
+        n_neurons = numpy.array([float(m["n_neurons"]) for m in measurements])
+        skipping = any(m.get(_ACTIVITY) for m in measurements)
+        skipped_terms = (skipped or dict()).get(component)
+        updated = n_neurons
+        if skipping:
+            updated = n_neurons * numpy.array(
+                [float(m.get(_ACTIVITY) or 1) for m in measurements])
+        terms = [_PER_NEURON] + [_term(key) for key in counts]
+        columns = list()
+        for term, key in zip(terms, [None] + counts):
+            # Terms that are not skipped are paid by every neuron
+            column = n_neurons
+            if skipped_terms is None or term in skipped_terms:
+                column = updated
+            if key is not None:
+                column = column * numpy.array(
+                    [float(m[key] or 0) for m in measurements])
+            columns.append(column)
+        if skipping and skipped_terms is None:
+            columns.insert(0, n_neurons)
+            terms.insert(0, _PER_QUIESCENT_NEURON)
+        cycles = numpy.array([float(m["cycles"]) for m in measurements])
+        fitted, _residuals, _rank, _sv = numpy.linalg.lstsq(
+            numpy.column_stack(columns), cycles, rcond=None)
+        components[component] = {
+            term: round(max(float(value), 0.0), 1)
+            for term, value in zip(terms, fitted)}
+        components[component]["source"] = "measured"
+        components[component]["n_measurements"] = len(measurements)
+    return components
+
+
+def regenerate_cycle_costs(benchmark_csv, filename=DEFAULT_TABLE):
+    """ Update a table with coefficients fitted to benchmark output;\
+        components that were not benchmarked keep their rows, and terms\
+        that were not fitted keep their values
+
+    :param str benchmark_csv: The CSV file of benchmark measurements
+    :param str filename: The JSON table to update
+    """
+    with open(filename, encoding="utf-8") as f:
+        table = json.load(f)
+    with open(benchmark_csv, newline="", encoding="utf-8") as f:
+        fitted = fit_cycle_costs(csv.DictReader(f), {
+            component: row[_SKIPPED]
+            for component, row in table["components"].items()
+            if _SKIPPED in row})
+    for component, row in fitted.items():
+        table["components"].setdefault(component, dict()).update(row)
+    with open(filename, "w", encoding="utf-8") as f:
+        json.dump(table, f, indent=4, sort_keys=True)
+        f.write("\n")
+    _tables.pop(filename, None)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    regenerate_cycle_costs(*sys.argv[1:])
@@ -0,0 +1,156 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Spike sources from event-camera recordings, read through a memory map\
+    and binned onto the simulation timestep a chunk at a time, so that a\
+    long recording is never held in memory as Python objects.
+
+A recording is a binary file of fixed-size events, each with the ``x`` and\
+``y`` of the pixel, its ``polarity`` and a ``timestamp``, laid out as\
+described by a numpy dtype::
+
+    spike_times = events_to_spike_times(
+        read_events("recording.bin"), width=128, height=128)
+    retina = Population(
+        128 * 128, SpikeSourceArray(spike_times=spike_times))
+"""
+
+import numpy
+
+#: The layout of an event when none is given: little-endian, unpadded, with
+#: the timestamp in microseconds
+EVENT_DTYPE = numpy.dtype([
+    ("x", "<u2"),
+    ("y", "<u2"),
+    ("polarity", "u1"),
+    ("timestamp", "<u4")])
+
+#: The number of events binned at once
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+
+def read_events(filename, dtype=EVENT_DTYPE, offset=0):
+    """ Map the events of a recording into memory without reading them
+
+    :param str filename: The file holding the events
+    :param dtype: The layout of an event, with ``x``, ``y``, ``polarity``\
+        and ``timestamp`` fields
+    :type dtype: ~numpy.dtype
+    :param int offset: The size in bytes of any header before the events
+    :return: A read-only array of the events, in timestamp order
+    :rtype: ~numpy.memmap
+    """
+    return numpy.memmap(filename, dtype=dtype, mode="r", offset=offset)
+
+
+def iter_binned_events(
+        events, width, height, timestep=1.0, time_scale=0.001,
+        t_start=None, duration=None, polarity=None,
+        chunk_size=DEFAULT_CHUNK_SIZE):
+    """ Bin events onto the simulation timestep a chunk at a time
+
+    Events outside the grid, before the start or after the duration, or of\
+    another polarity, are dropped.
+
+    :param events: The events, in timestamp order
+    :type events: ~numpy.ndarray
+    :param int width: The number of pixels in each row
+    :param int height: The number of rows
+    :param float timestep: The simulation time step in ms
+    :param float time_scale: The length of a timestamp unit in ms
+    :param t_start: The timestamp of the start of the simulation; defaults\
+        to that of the first event
+    :type t_start: int or None
+    :param duration: The time in ms after which events are dropped, or None\
+        to keep them all
+    :type duration: float or None
+    :param polarity: The polarity of the events to keep, or None for both
+    :type polarity: int or None
+    :param int chunk_size: The number of events binned at once
+    :return: The row-major pixel index and timestep of each kept event of\
+        each chunk
+    :rtype: iterable(tuple(~numpy.ndarray, ~numpy.ndarray))
+    """
+    if not len(events):
+        return
+    if t_start is None:
+        t_start = int(events[0]["timestamp"])
+    units_per_step = timestep / time_scale
+    for start in range(0, len(events), chunk_size):
+        chunk = events[start:start + chunk_size]
+        x = chunk["x"].astype("int64")
+        y = chunk["y"].astype("int64")
+        steps = numpy.floor(
+            (chunk["timestamp"].astype("int64") - t_start) /
+            units_per_step).astype("int64")
+        keep = (x < width) & (y < height) & (steps >= 0)
+        if duration is not None:
+            keep &= steps * timestep < duration
+        if polarity is not None:
+            keep &= chunk["polarity"] == polarity
+        yield y[keep] * width + x[keep], steps[keep]
+
+
+def _unique_events(pixels, steps):
+    """ Sort binned events by pixel then timestep, keeping one event per\
+        pixel per timestep
+
+    :param ~numpy.ndarray pixels: The pixel index of each event
+    :param ~numpy.ndarray steps: The timestep of each event
+    :rtype: tuple(~numpy.ndarray, ~numpy.ndarray)
+    """
+    order = numpy.lexsort((steps, pixels))
+    pixels = pixels[order]
+    steps = steps[order]
+    unique = numpy.ones(len(order), dtype="bool")
+    unique[1:] = (pixels[1:] != pixels[:-1]) | (steps[1:] != steps[:-1])
+    return pixels[unique], steps[unique]
+
+
+def events_to_spike_times(
+        events, width, height, timestep=1.0, time_scale=0.001,
+        t_start=None, duration=None, polarity=None,
+        chunk_size=DEFAULT_CHUNK_SIZE):
+    """ Get the spike times of each pixel of a recording, with at most one\
+        spike per pixel per timestep, ready for a ``SpikeSourceArray`` that\
+        feeds a :py:class:`~python_models8.networks.semd_field.SEMDField`
+
+    See :py:func:`iter_binned_events` for the parameters.
+
+    :return: The spike times in ms of each pixel, in row-major order
+    :rtype: list(~numpy.ndarray)
+    """
+    pixels = list()
+    steps = list()
+    for chunk_pixels, chunk_steps in iter_binned_events(
+            events, width, height, timestep, time_scale, t_start, duration,
+            polarity, chunk_size):
+        # Merge the events of a pixel in a timestep as they come
+        chunk_pixels, chunk_steps = _unique_events(chunk_pixels, chunk_steps)
+        pixels.append(chunk_pixels)
+        steps.append(chunk_steps)
+
+    n_pixels = width * height
+    if not pixels:
+        return [numpy.zeros(0) for _ in range(n_pixels)]
+
+    # A pixel can still appear in the same timestep at the end of one chunk
+    # and the start of the next
+    pixels, steps = _unique_events(
+        numpy.concatenate(pixels), numpy.concatenate(steps))
+    times = steps * timestep
+
+    bounds = numpy.searchsorted(pixels, numpy.arange(n_pixels + 1))
+    return [times[bounds[i]:bounds[i + 1]] for i in range(n_pixels)]
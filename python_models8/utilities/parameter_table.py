@@ -0,0 +1,115 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from python_models8.utilities.struct_array import StructArray
+
+
+class ParameterTable(object):
+    """ A table of the distinct sets of parameter values of the neurons on\
+        a core, so that neurons with the same parameters share one copy of\
+        them and each holds only the (8-bit) index of its set.
+
+    The table is written as a word holding the number of sets, followed by\
+    the sets as an array of C structs, padded to a whole number of words.
+    A slice whose neurons all have the same parameters thus needs a single\
+    set, whatever its size.  Where the neurons have more than\
+    :py:attr:`MAX_SETS` sets, or sharing them would save no space, the\
+    number of sets is written as 0 and one set follows per neuron instead,\
+    in the order of the neurons.
+    """
+
+    __slots__ = ["__struct"]
+
+    #: The most sets a table can hold, as indexed by a uint8_t
+    MAX_SETS = 256
+
+    def __init__(self, fields):
+        """
+        :param fields: The name and type of each field of a set, ordered as\
+            they appear in the struct
+        :type fields:
+            list(tuple(str, ~data_specification.enums.DataType))
+        """
+        self.__struct = StructArray(fields)
+
+    @property
+    def struct_array(self):
+        """ The struct of one set
+
+        :rtype: StructArray
+        """
+        return self.__struct
+
+    def get_size_in_whole_words(self, n_sets):
+        """ Get the size of a table in whole words
+
+        :param int n_sets: The number of sets in the table, or of neurons\
+            if there is one set per neuron
+        :rtype: int
+        """
+        return 1 + self.__struct.get_size_in_whole_words(n_sets)
+
+    def get_max_size_in_whole_words(self, n_neurons):
+        """ Get the size of the largest table a number of neurons can need,\
+            which is when each neuron has its own set
+
+        :param int n_neurons: The number of neurons
+        :rtype: int
+        """
+        return self.get_size_in_whole_words(n_neurons)
+
+    def get_data(self, values, lo_atom, n_atoms):
+        """ Find the distinct sets of values of a range of atoms, and pack\
+            them into a table, or one per atom if that is no larger
+
+        :param values: The value(s) of each field by name
+        :type values: dict(str, object)
+        :param int lo_atom: The index of the first atom
+        :param int n_atoms: The number of atoms
+        :return: The table, and the index of the set of each atom, which is\
+            0 for all of them when each has its own set
+        :rtype: tuple(~numpy.ndarray(dtype="uint32"),
+            ~numpy.ndarray(dtype="uint8"))
+        """
+        dtype = self.__struct.numpy_dtype
+        data = self.__struct.get_data(values, lo_atom, n_atoms)
+        sets = data.view("uint8")[:n_atoms * dtype.itemsize].view(dtype)
+        unique, indices = numpy.unique(sets, return_inverse=True)
+        if (len(unique) > self.MAX_SETS or
+                self.get_size_in_whole_words(len(unique)) >=
+                self.get_size_in_whole_words(n_atoms)):
+            return (numpy.concatenate(([0], data)).astype("uint32"),
+                    numpy.zeros(n_atoms, "uint8"))
+        data = numpy.zeros(self.get_size_in_whole_words(len(unique)), "uint32")
+        data[0] = len(unique)
+        data[1:].view("uint8")[:len(unique) * dtype.itemsize] = \
+            unique.view("uint8")
+        return data, indices.astype("uint8")
+
+    def get_n_bytes(self, data, offset, n_atoms):
+        """ Get the size of a table in data read back from the machine
+
+        :param data: The data read back
+        :type data: bytes or bytearray
+        :param int offset: The index of the byte where the table starts
+        :param int n_atoms: The number of atoms the table is for
+        :rtype: int
+        """
+        n_sets = int(numpy.frombuffer(data, "uint32", 1, offset)[0])
+        if n_sets == 0:
+            n_sets = n_atoms
+        return self.get_size_in_whole_words(n_sets) * BYTES_PER_WORD
@@ -0,0 +1,52 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from pyNN.random import RandomDistribution
+from spinn_utilities.helpful_functions import is_singleton
+from spinn_utilities.ranged import RangedList
+
+
+def ranged_list_to_array(values, lo_atom, n_atoms, dtype="float64"):
+    """ Expand a parameter or state variable into a numpy array, filling\
+        whole ranges at once rather than element by element
+
+    :param values: The values to expand
+    :type values: int or float or list(float) or
+        ~spinn_utilities.ranged.RangedList
+    :param int lo_atom: The index of the first atom to expand
+    :param int n_atoms: The number of atoms to expand
+    :param dtype: The numpy type of the resulting array
+    :rtype: ~numpy.ndarray
+    """
+    if is_singleton(values):
+        return numpy.full(n_atoms, values, dtype=dtype)
+    if isinstance(values, RandomDistribution):
+        return numpy.asarray(values.next(n_atoms), dtype=dtype)
+    if not hasattr(values, "iter_ranges_by_slice"):
+        return numpy.asarray(
+            values[lo_atom:lo_atom + n_atoms], dtype=dtype)
+    if isinstance(values, RangedList) and not values.range_based():
+        # The values are held one per atom, so copy them in one go
+        # pylint: disable=protected-access
+        return numpy.asarray(
+            values._ranges[lo_atom:lo_atom + n_atoms], dtype=dtype)
+    array = numpy.empty(n_atoms, dtype=dtype)
+    for start, stop, value in values.iter_ranges_by_slice(
+            lo_atom, lo_atom + n_atoms):
+        if isinstance(value, RandomDistribution):
+            value = value.next(stop - start)
+        array[start - lo_atom:stop - lo_atom] = value
+    return array
@@ -0,0 +1,115 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+import quantities
+from spynnaker.pyNN.utilities.neo_convertor import convert_spiketrains
+from python_models8.neuron.implementations.qif_neuron_impl import (
+    SPIKE_COUNT, SPIKE_FRACTION)
+
+
+def _map_spiketrains(segment, name, operation):
+    """ Replaces the times of each spike train in a segment using the values\
+        of a variable recorded in the timestep of each spike
+
+    :param ~neo.core.Segment segment: The segment holding the recordings
+    :param str name: The recorded variable to look up
+    :param callable operation: Given the spike times, the values and the\
+        sampling period, all in ms, gives the new spike times
+    :rtype: list(~neo.core.SpikeTrain)
+    :raises ValueError: If the variable was not recorded for a spike
+    """
+    signals = segment.filter(name=name)
+    if not signals:
+        raise ValueError("{} was not recorded".format(name))
+    signal = signals[0]
+    values = signal.magnitude
+    columns = {
+        index: column for column, index in enumerate(
+            signal.channel_index.index.astype(int))}
+    t_start = signal.t_start.rescale("ms").magnitude
+    period = signal.sampling_period.rescale("ms").magnitude
+
+    trains = list()
+    for train in segment.spiketrains:
+        index = train.annotations["source_index"]
+        times = train.rescale("ms").magnitude
+        if not len(times):
+            trains.append(train)
+            continue
+        if index not in columns:
+            raise ValueError("{} was not recorded for neuron {}".format(
+                name, index))
+        rows = numpy.rint((times - t_start) / period).astype(int)
+        if (numpy.any(rows >= len(values)) or
+                not numpy.allclose(t_start + rows * period, times)):
+            raise ValueError("{} must be sampled every timestep".format(name))
+        trains.append(train.duplicate_with_new_data(operation(
+            times, values[rows, columns[index]], period) * quantities.ms))
+    return trains
+
+
+def interpolate_spiketrains(segment):
+    """ Moves each spike in a segment to where in its timestep the neuron\
+        reached its peak voltage, using the recorded spike fractions.
+
+    Both "spikes" and "spike_fraction" must have been recorded for the same
+    neurons, with the spike fraction sampled every timestep.
+
+    :param ~neo.core.Segment segment: The segment holding the recordings
+    :return: New spike trains with sub-timestep spike times
+    :rtype: list(~neo.core.SpikeTrain)
+    :raises ValueError: If the spike fraction was not recorded for a spike
+    """
+    # The fraction is of the update starting at the spike's timestep
+    return _map_spiketrains(
+        segment, SPIKE_FRACTION,
+        lambda times, fractions, period: times + fractions * period)
+
+
+def expand_bursts(segment):
+    """ Repeats each spike in a segment as many times as the neuron fired in\
+        that timestep, using the recorded spike counts.
+
+    Both "spikes" and "spike_count" must have been recorded for the same
+    neurons, with the spike count sampled every timestep.
+
+    :param ~neo.core.Segment segment: The segment holding the recordings
+    :return: New spike trains with one entry per spike fired
+    :rtype: list(~neo.core.SpikeTrain)
+    :raises ValueError: If the spike count was not recorded for a spike
+    """
+    # A spike is recorded at most once per timestep, so count at least one
+    return _map_spiketrains(
+        segment, SPIKE_COUNT,
+        lambda times, counts, _period: numpy.repeat(
+            times, numpy.maximum(counts.astype(int), 1)))
+
+
+def interpolate_spikes(neo, run=0):
+    """ Extracts the spikes for a run from a Neo Object with sub-timestep\
+        spike times
+
+    :param ~neo.core.Block neo:
+        neo Object including spike and spike fraction data
+    :param int run: Zero based index of the run to extract data for
+    :return: Array of (neuron index, spike time in ms)
+    :rtype: ~numpy.ndarray
+    """
+    if len(neo.segments) <= run:
+        raise ValueError(
+            "Data only contains {} so unable to run {}. Note run is the "
+            "zero based index.".format(len(neo.segments), run))
+    return convert_spiketrains(interpolate_spiketrains(neo.segments[run]))
@@ -0,0 +1,198 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import numpy
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from python_models8.utilities.ranged_arrays import ranged_list_to_array
+
+
+class StructArray(object):
+    """ An array of C structs held as a numpy structured array, so that each\
+        field of every struct is packed or read with a single numpy\
+        operation rather than value by value.
+
+    The fields are named and laid out as in the C struct, with the usual C\
+    alignment; each field holds the encoded (integer) form of its\
+    :py:class:`~data_specification.enums.DataType`.
+    """
+
+    __slots__ = ["__data_types", "__numpy_dtype"]
+
+    def __init__(self, fields):
+        """
+        :param fields: The name and type of each field, ordered as they\
+            appear in the struct
+        :type fields:
+            list(tuple(str, ~data_specification.enums.DataType))
+        """
+        self.__data_types = dict(fields)
+        self.__numpy_dtype = numpy.dtype(
+            [(name, numpy.dtype(data_type.struct_encoding))
+             for name, data_type in fields],
+            align=True)
+
+    @property
+    def numpy_dtype(self):
+        """ The numpy type of one struct
+
+        :rtype: ~numpy.dtype
+        """
+        return self.__numpy_dtype
+
+    @property
+    def names(self):
+        """ The names of the fields, ordered as they appear in the struct
+
+        :rtype: tuple(str)
+        """
+        return self.__numpy_dtype.names
+
+    def get_size_in_whole_words(self, array_size=1):
+        """ Get the size of an array of structs in whole words
+
+        :param int array_size: The number of structs
+        :rtype: int
+        """
+        size_in_bytes = array_size * self.__numpy_dtype.itemsize
+        return (size_in_bytes + (BYTES_PER_WORD - 1)) // BYTES_PER_WORD
+
+    def encode(self, name, values):
+        """ Encode values of a field into its integer form
+
+        :param str name: The field
+        :param ~numpy.ndarray values: The values
+        :rtype: ~numpy.ndarray
+        :raises ValueError: If a value is out of the range of the field
+        """
+        data_type = self.__data_types[name]
+        values = numpy.asarray(values, dtype="float64")
+        out_of_range = ((values < float(data_type.min)) |
+                        (values > float(data_type.max)))
+        if numpy.any(out_of_range):
+            raise ValueError(
+                "value {} of {} cannot be converted to {}: out of range"
+                .format(values[out_of_range][0], name, data_type.__doc__))
+        return numpy.round(values * float(data_type.scale)).astype(
+            self.__numpy_dtype[name])
+
+    def decode(self, structs, name):
+        """ Decode a field of an array of structs
+
+        :param ~numpy.ndarray structs: The structs
+        :param str name: The field
+        :rtype: ~numpy.ndarray
+        """
+        return structs[name] / float(self.__data_types[name].scale)
+
+    def get_data(self, values, lo_atom, n_atoms):
+        """ Pack the values of a range of atoms into one contiguous buffer
+
+        :param values: The value(s) of each field by name
+        :type values: dict(str, object)
+        :param int lo_atom: The index of the first atom to pack
+        :param int n_atoms: The number of atoms to pack
+        :return: The structs padded to a whole number of words
+        :rtype: ~numpy.ndarray(dtype="uint32")
+        """
+        data = numpy.zeros(self.get_size_in_whole_words(n_atoms), "uint32")
+        structs = data.view("uint8")[
+            :n_atoms * self.__numpy_dtype.itemsize].view(self.__numpy_dtype)
+        for name in self.names:
+            structs[name] = self.encode(name, ranged_list_to_array(
+                values[name], lo_atom, n_atoms))
+        return data
+
+    def read_data(self, data, offset, n_atoms):
+        """ View an array of structs in data read back from the machine,\
+            without copying it
+
+        :param data: The data read back
+        :type data: bytes or bytearray
+        :param int offset: The index of the byte where the structs start
+        :param int n_atoms: The number of structs
+        :return: The structs, still in their encoded form; see\
+            :py:meth:`decode`
+        :rtype: ~numpy.ndarray
+        """
+        return numpy.frombuffer(
+            data, dtype=self.__numpy_dtype, count=n_atoms, offset=offset)
+
+    def get_run_data(self, values, lo_atom, n_atoms):
+        """ Pack the values of a range of atoms as runs of identical structs,\
+            each written once with the number of atoms in the run, if that\
+            is smaller than writing every struct; the core expands the runs\
+            as it loads them (see ``struct_runs.h``)
+
+        The data starts with the number of runs, which is 0 when the structs\
+        follow one per atom instead.
+
+        :param values: The value(s) of each field by name
+        :type values: dict(str, object)
+        :param int lo_atom: The index of the first atom to pack
+        :param int n_atoms: The number of atoms to pack
+        :rtype: ~numpy.ndarray(dtype="uint32")
+        """
+        data = self.get_data(values, lo_atom, n_atoms)
+        size = self.__numpy_dtype.itemsize
+        structs = data.view("uint8")[:n_atoms * size].reshape(n_atoms, size)
+        changes = numpy.any(structs[1:] != structs[:-1], axis=1)
+        starts = numpy.flatnonzero(numpy.concatenate(([True], changes)))
+        record_words = 1 + self.get_size_in_whole_words()
+        if len(starts) * record_words >= len(data):
+            return numpy.concatenate(([0], data)).astype("uint32")
+
+        runs = numpy.zeros((len(starts), record_words), "uint32")
+        runs[:, 0] = numpy.diff(numpy.append(starts, n_atoms))
+        runs[:, 1:].view("uint8")[:, :size] = structs[starts]
+        return numpy.concatenate(([len(starts)], runs.ravel())).astype(
+            "uint32")
+
+    def get_run_size_in_whole_words(self, array_size):
+        """ Get the most words that packing an array of structs as runs can\
+            take, which is when it doesn't use runs
+
+        :param int array_size: The number of structs
+        :rtype: int
+        """
+        return 1 + self.get_size_in_whole_words(array_size)
+
+    def read_run_data(self, data, offset, n_atoms):
+        """ Read an array of structs packed by :py:meth:`get_run_data`, or\
+            stored by the core, which writes them one per atom
+
+        :param data: The data read back
+        :type data: bytes or bytearray
+        :param int offset: The index of the byte where the data starts
+        :param int n_atoms: The number of structs
+        :return: The structs, still in their encoded form, and the offset\
+            after them
+        :rtype: tuple(~numpy.ndarray, int)
+        """
+        n_runs = int(numpy.frombuffer(data, "uint32", 1, offset)[0])
+        offset += BYTES_PER_WORD
+        if n_runs == 0:
+            return (self.read_data(data, offset, n_atoms),
+                    offset + self.get_size_in_whole_words(n_atoms) *
+                    BYTES_PER_WORD)
+        record_words = 1 + self.get_size_in_whole_words()
+        runs = numpy.frombuffer(
+            data, "uint32", n_runs * record_words, offset).reshape(
+                n_runs, record_words)
+        size = self.__numpy_dtype.itemsize
+        structs = numpy.ascontiguousarray(
+            runs[:, 1:]).view("uint8")[:, :size].copy().view(
+                self.__numpy_dtype)[:, 0]
+        return (numpy.repeat(structs, runs[:, 0]),
+                offset + n_runs * record_words * BYTES_PER_WORD)
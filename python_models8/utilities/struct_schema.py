@@ -0,0 +1,433 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+""" Declare the per-neuron struct of a component once, and get everything\
+    that has to match it from that declaration
+
+A :py:class:`StructSchema` lists the fields of a struct, in order, with\
+their types, units and whether each is a parameter, a state variable or a\
+value derived from them.  From it come the data types of the component, its\
+units, a vectorised packer and unpacker, and the C struct itself.  Write\
+the C struct to a header (included by the hand-written header of the\
+component) with::
+
+    python -m python_models8.utilities.struct_schema \\
+        python_models8.neuron.threshold_types.my_threshold_type:SCHEMA \\
+        c_models/src/my_models/threshold_types/my_threshold_type_struct.h
+
+and add ``--check`` to fail instead if the header is out of date.  Each\
+generated header names its schema, so::
+
+    python -m python_models8.utilities.struct_schema --check-all c_models/src
+
+checks every generated header under a directory; the unit tests run this.
+
+Fields whose C names are ``name[0]``, ``name[1]``, ... in turn make up the\
+C array ``name``.  Parameters and state variables that a component keeps\
+but does not write as they are (e.g. a time constant from which a decay\
+field is derived) are declared as extra variables of the schema.
+"""
+
+import importlib
+import os
+import re
+import sys
+from data_specification.enums import DataType
+from spinn_front_end_common.utilities.constants import BYTES_PER_WORD
+from spynnaker.pyNN.models.neuron.implementations import (
+    RangedDictVertexSlice)
+from python_models8.utilities.struct_array import StructArray
+
+#: A field set from the parameters of the population
+PARAMETER = "parameter"
+
+#: A field set from, and read back into, the state variables
+STATE_VARIABLE = "state variable"
+
+#: A field worked out by the component from other values (e.g. a decay\
+#: from a time constant)
+DERIVED = "derived"
+
+_KINDS = (PARAMETER, STATE_VARIABLE, DERIVED)
+
+#: The C type of a field of each data type, unless given
+C_TYPES = {
+    DataType.S1615: "REAL",
+    DataType.U032: "UFRACT",
+    DataType.S031: "FRACT",
+    DataType.UINT32: "uint32_t",
+    DataType.INT32: "int32_t",
+    DataType.UINT16: "uint16_t",
+    DataType.INT16: "int16_t",
+    DataType.UINT8: "uint8_t",
+    DataType.INT8: "int8_t"
+}
+
+_GENERATED = (
+    "// Generated from the schema {}\n"
+    "// by python_models8.utilities.struct_schema; update the schema and\n"
+    "// regenerate this rather than editing it\n")
+
+#: Finds the schema named in the first line of a generated header
+_GENERATED_FROM = re.compile(r"^// Generated from the schema (\S+:\S+)$")
+
+#: Splits the C name of an element of an array field
+_ARRAY_ELEMENT = re.compile(r"^(\w+)\[(\d+)\]$")
+
+
+class SchemaField(object):
+    """ A field of a struct
+    """
+
+    __slots__ = ["__c_name", "__c_type", "__data_type", "__kind", "__name",
+                 "__units"]
+
+    def __init__(self, name, data_type, units="", kind=PARAMETER,
+                 c_name=None, c_type=None):
+        """
+        :param str name: The name of the parameter or state variable
+        :param ~data_specification.enums.DataType data_type:
+            The type of the field on the machine
+        :param str units: The units of the value
+        :param str kind: PARAMETER, STATE_VARIABLE or DERIVED
+        :param c_name: The name in the C struct, if not the same
+        :type c_name: str or None
+        :param c_type: The C type, if not that of the data type
+        :type c_type: str or None
+        """
+        if kind not in _KINDS:
+            raise ValueError("Unknown kind of field {}".format(kind))
+        if c_type is None and data_type not in C_TYPES:
+            raise ValueError(
+                "No C type for {} of field {}".format(data_type, name))
+        self.__name = name
+        self.__data_type = data_type
+        self.__units = units
+        self.__kind = kind
+        self.__c_name = name if c_name is None else c_name
+        self.__c_type = C_TYPES[data_type] if c_type is None else c_type
+
+    @property
+    def name(self):
+        return self.__name
+
+    @property
+    def data_type(self):
+        return self.__data_type
+
+    @property
+    def units(self):
+        return self.__units
+
+    @property
+    def kind(self):
+        return self.__kind
+
+    @property
+    def c_name(self):
+        return self.__c_name
+
+    @property
+    def c_type(self):
+        return self.__c_type
+
+
+class StructSchema(object):
+    """ The fields of the per-neuron struct of a component, in order
+    """
+
+    __slots__ = ["__c_struct_name", "__extra_variables", "__fields",
+                 "__struct_array"]
+
+    def __init__(self, c_struct_name, fields, extra_variables=()):
+        """
+        :param str c_struct_name:
+            The name of the C struct type, e.g. ``threshold_type_t``
+        :param list(SchemaField) fields: The fields, in order
+        :param list(SchemaField) extra_variables:
+            The parameters and state variables of the component that are\
+            not fields of the struct; only their names, units and kinds are\
+            used
+        """
+        names = [field.name for field in fields] + [
+            variable.name for variable in extra_variables]
+        if len(set(names)) != len(names):
+            raise ValueError("The names of the fields must be unique")
+        if any(variable.kind == DERIVED for variable in extra_variables):
+            raise ValueError("An extra variable cannot be derived")
+        self.__c_struct_name = c_struct_name
+        self.__fields = tuple(fields)
+        self.__extra_variables = tuple(extra_variables)
+        self.__struct_array = StructArray(
+            [(field.name, field.data_type) for field in fields])
+
+    @property
+    def c_struct_name(self):
+        return self.__c_struct_name
+
+    @property
+    def fields(self):
+        """
+        :rtype: tuple(SchemaField)
+        """
+        return self.__fields
+
+    @property
+    def data_types(self):
+        """ The data types of the fields, in order
+
+        :rtype: list(~data_specification.enums.DataType)
+        """
+        return [field.data_type for field in self.__fields]
+
+    @property
+    def units(self):
+        """ The units of the parameters and state variables, by name,\
+            including the extra variables
+
+        :rtype: dict(str, str)
+        """
+        return {field.name: field.units
+                for field in self.__fields + self.__extra_variables
+                if field.kind != DERIVED}
+
+    def names_of(self, kind):
+        """ Get the names of the fields of a kind, in order
+
+        :param str kind: PARAMETER, STATE_VARIABLE or DERIVED
+        :rtype: list(str)
+        """
+        return [field.name for field in self.__fields if field.kind == kind]
+
+    def variable_names_of(self, kind):
+        """ Get the names of the parameters or state variables of the\
+            component, in the fields and then in the extra variables
+
+        :param str kind: PARAMETER or STATE_VARIABLE
+        :rtype: list(str)
+        """
+        return self.names_of(kind) + [
+            variable.name for variable in self.__extra_variables
+            if variable.kind == kind]
+
+    @property
+    def struct_array(self):
+        """ The packer and unpacker of arrays of the struct
+
+        :rtype: StructArray
+        """
+        return self.__struct_array
+
+    def get_size_in_whole_words(self, n_neurons):
+        """ Get the size of the structs of some neurons in whole words
+
+        :param int n_neurons: The number of neurons
+        :rtype: int
+        """
+        return self.__struct_array.get_size_in_whole_words(n_neurons)
+
+    def get_c_struct(self):
+        """ Get the C definition of the struct
+
+        :rtype: str
+        """
+        lines = ["typedef struct {} {{".format(self.__c_struct_name)]
+        for c_type, c_name, fields in self.__c_members():
+            comments = list()
+            for field in fields:
+                comment = field.name
+                if field.units:
+                    comment += " [{}]".format(field.units)
+                comments.append(comment)
+            lines.append("    //! {}".format(", ".join(comments)))
+            lines.append("    {} {};".format(c_type, c_name))
+        lines.append("}} {};".format(self.__c_struct_name))
+        return "\n".join(lines) + "\n"
+
+    def __c_members(self):
+        """ Group the fields into the members of the C struct, joining the\
+            elements of each array field
+
+        :return: The C type, C declarator and fields of each member
+        :rtype: list(tuple(str, str, list(SchemaField)))
+        """
+        members = list()
+        arrays = list()
+        for field in self.__fields:
+            match = _ARRAY_ELEMENT.match(field.c_name)
+            if match is None:
+                members.append((field.c_type, field.c_name, [field]))
+                continue
+            name, index = match.group(1), int(match.group(2))
+            if index == 0:
+                members.append((field.c_type, name, [field]))
+                arrays.append(len(members) - 1)
+                continue
+            c_type, last_name, fields = members[-1]
+            if (not arrays or arrays[-1] != len(members) - 1 or
+                    last_name != name or index != len(fields)):
+                raise ValueError(
+                    "{} is not the next element of an array".format(
+                        field.c_name))
+            if field.c_type != c_type:
+                raise ValueError(
+                    "The elements of {} must have the same C type".format(
+                        name))
+            fields.append(field)
+        for i in arrays:
+            c_type, name, fields = members[i]
+            members[i] = (c_type, "{}[{}]".format(name, len(fields)), fields)
+        return members
+
+    def get_c_header(self, guard, source):
+        """ Get a C header defining the struct
+
+        :param str guard: The name of the include guard macro
+        :param str source: Where the schema is declared, for the comment
+        :rtype: str
+        """
+        return (
+            _GENERATED.format(source) +
+            "#ifndef {0}\n#define {0}\n\n".format(guard) +
+            "#include <common/neuron-typedefs.h>\n\n" +
+            self.get_c_struct() +
+            "\n#endif // {}\n".format(guard))
+
+    def get_data(self, parameters, state_variables, vertex_slice,
+                 derived=None):
+        """ Pack the structs of a slice of neurons
+
+        :param ~spinn_utilities.ranged.RangeDictionary parameters:
+            The parameters of the population
+        :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+            The state variables of the population
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The neurons to pack
+        :param derived: The value(s) of each derived field, by name
+        :type derived: dict(str, object) or None
+        :rtype: ~numpy.ndarray(dtype="uint32")
+        """
+        return self.__struct_array.get_data(
+            self.get_values(parameters, state_variables, derived),
+            vertex_slice.lo_atom, vertex_slice.n_atoms)
+
+    def get_values(self, parameters, state_variables, derived=None):
+        """ Get the value(s) of each field of the struct, by name
+
+        :param ~spinn_utilities.ranged.RangeDictionary parameters:
+            The parameters of the population
+        :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+            The state variables of the population
+        :param derived: The value(s) of each derived field, by name
+        :type derived: dict(str, object) or None
+        :rtype: dict(str, object)
+        """
+        holders = {PARAMETER: parameters, STATE_VARIABLE: state_variables,
+                   DERIVED: derived}
+        return {field.name: holders[field.kind][field.name]
+                for field in self.__fields}
+
+    def read_data(self, data, offset, vertex_slice, state_variables):
+        """ Read the state variables of a slice of neurons back from data\
+            read from the machine
+
+        :param data: The data read back
+        :type data: bytes or bytearray
+        :param int offset: The index of the byte where the structs start
+        :param ~pacman.model.graphs.common.Slice vertex_slice:
+            The neurons to read
+        :param ~spinn_utilities.ranged.RangeDictionary state_variables:
+            The state variables of the population to update
+        :return: The offset after the structs
+        :rtype: int
+        """
+        structs = self.__struct_array.read_data(
+            data, offset, vertex_slice.n_atoms)
+        variables = RangedDictVertexSlice(state_variables, vertex_slice)
+        for name in self.names_of(STATE_VARIABLE):
+            variables[name] = self.__struct_array.decode(structs, name)
+        return offset + BYTES_PER_WORD * self.get_size_in_whole_words(
+            vertex_slice.n_atoms)
+
+
+def _header_guard(filename):
+    name = filename.replace("\\", "/").split("/")[-1]
+    return "_" + "".join(
+        c if c.isalnum() else "_" for c in name).upper() + "_"
+
+
+def find_generated_headers(directory):
+    """ Find the headers generated from schemas under a directory
+
+    :param str directory: The directory to search
+    :return: The schema, as ``module:attribute``, and the file name of each
+    :rtype: iterable(tuple(str, str))
+    """
+    for path, _dirs, files in sorted(os.walk(directory)):
+        for name in sorted(files):
+            if not name.endswith(".h"):
+                continue
+            filename = os.path.join(path, name)
+            with open(filename, encoding="utf-8") as f:
+                match = _GENERATED_FROM.match(f.readline().rstrip("\n"))
+            if match is not None:
+                yield match.group(1), filename
+
+
+def write_c_header(schema_name, filename, check=False):
+    """ Write the C header of a schema, or check that it is up to date
+
+    :param str schema_name: The schema, as ``module:attribute``
+    :param str filename: The header to write
+    :param bool check: Whether to only check the header
+    :return: Whether the header is (now) up to date
+    :rtype: bool
+    """
+    module_name, attribute = schema_name.split(":")
+    schema = getattr(importlib.import_module(module_name), attribute)
+    header = schema.get_c_header(_header_guard(filename), schema_name)
+    if check:
+        try:
+            with open(filename, encoding="utf-8") as f:
+                return f.read() == header
+        except FileNotFoundError:
+            return False
+    with open(filename, "w", encoding="utf-8") as f:
+        f.write(header)
+    return True
+
+
+def main(argv):
+    """ Write or check C headers; see the module documentation
+
+    :param list(str) argv: The command line arguments
+    :return: The error message, if a header is out of date
+    :rtype: str or None
+    """
+    if argv[:1] == ["--check-all"]:
+        headers = list(find_generated_headers(argv[1]))
+        check = True
+    else:
+        headers = [[arg for arg in argv if arg != "--check"]]
+        check = "--check" in argv
+    stale = [filename for schema_name, filename in headers
+             if not write_c_header(schema_name, filename, check)]
+    if stale:
+        return "{} out of date with their schemas".format(", ".join(stale))
+    return None
+
+
+if __name__ == "__main__":  # pragma: no cover
+    sys.exit(main(sys.argv[1:]))
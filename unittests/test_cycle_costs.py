@@ -0,0 +1,92 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import csv
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from python_models8.utilities import cycle_costs
+
+_COMPONENT = "NeuronModelQuadraticIntegrateAndFire"
+
+
+class TestCycleCosts(unittest.TestCase):
+
+    def setUp(self):
+        self.__dir = tempfile.mkdtemp()
+        self.__table = os.path.join(self.__dir, "cycle_costs.json")
+        self.__csv = os.path.join(self.__dir, "benchmark.csv")
+        shutil.copy(cycle_costs.DEFAULT_TABLE, self.__table)
+
+    def tearDown(self):
+        shutil.rmtree(self.__dir)
+
+    def __regenerate(self, rows):
+        with open(self.__csv, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+        cycle_costs.regenerate_cycle_costs(self.__csv, self.__table)
+        with open(self.__table, encoding="utf-8") as f:
+            return json.load(f)["components"][_COMPONENT]
+
+    def __estimate(self, *args, **counts):
+        # Estimate from the regenerated table instead of the shipped one
+        table = cycle_costs.load_cycle_costs(self.__table)
+        with mock.patch.object(
+                cycle_costs, "load_cycle_costs", return_value=table):
+            return cycle_costs.estimate_skipping_cycles(*args, **counts)
+
+    def test_unmeasured_terms_are_kept(self):
+        before = cycle_costs.load_cycle_costs(self.__table)[_COMPONENT]
+        row = self.__regenerate([
+            {"component": _COMPONENT, "n_neurons": n, "n_substeps": s,
+             "cycles": n * (100 + 50 * s)}
+            for n in (64, 256) for s in (1, 4)])
+        self.assertEqual(row["per_neuron"], 100)
+        self.assertEqual(row["per_substep"], 50)
+        self.assertEqual(row["skipped"], before["skipped"])
+        # Quiescent neurons still sum their input, skipping only the RK2
+        self.assertEqual(
+            self.__estimate(_COMPONENT, 10, 0.5, n_substeps=2),
+            10 * (100 + 0.5 * 100))
+
+    def test_skipping_terms_are_fitted(self):
+        row = self.__regenerate([
+            {"component": _COMPONENT, "n_neurons": n, "n_substeps": s,
+             "activity": a, "cycles": n * (100 + a * 50 * s)}
+            for n in (64, 256) for s in (1, 4) for a in (0.25, 1.0)])
+        self.assertNotIn("per_quiescent_neuron", row)
+        self.assertEqual(row["per_neuron"], 100)
+        self.assertEqual(row["per_substep"], 50)
+        self.assertEqual(
+            self.__estimate(_COMPONENT, 10, 0.5, n_substeps=2), 10 * 150)
+
+    def test_whole_update_skipping_terms_are_fitted(self):
+        fitted = cycle_costs.fit_cycle_costs([
+            {"component": "Skipping", "n_neurons": str(n),
+             "n_steps": str(s), "activity": str(a),
+             "cycles": str(n * (20 + a * (100 + 50 * s)))}
+            for n in (64, 256) for s in (1, 4) for a in (0.25, 1.0)])
+        self.assertEqual(fitted["Skipping"]["per_quiescent_neuron"], 20)
+        self.assertEqual(fitted["Skipping"]["per_neuron"], 100)
+        self.assertEqual(fitted["Skipping"]["per_step"], 50)
+
+
+if __name__ == "__main__":
+    unittest.main()
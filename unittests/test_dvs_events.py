@@ -0,0 +1,94 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import tempfile
+import unittest
+import numpy
+from python_models8.utilities.dvs_events import (
+    EVENT_DTYPE, events_to_spike_times, read_events)
+
+WIDTH = 3
+HEIGHT = 2
+
+# x, y, polarity and timestamp in microseconds
+EVENTS = [
+    (0, 0, 1, 1000),
+    (1, 0, 0, 1200),
+    # The same pixel in the same timestep, in the same chunk of three
+    (0, 0, 1, 1500),
+    # ... and in the next chunk
+    (0, 0, 0, 1900),
+    (2, 1, 1, 2500),
+    # Outside the grid
+    (5, 0, 1, 2600),
+    (1, 0, 1, 3000),
+    (0, 0, 1, 4100),
+    (2, 1, 0, 5000)]
+
+HEADER = b"DVS\0"
+
+
+class TestDVSEvents(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.__filename = tempfile.mkstemp(suffix=".bin")
+        with os.fdopen(handle, "wb") as f:
+            f.write(HEADER)
+            f.write(numpy.array(EVENTS, dtype=EVENT_DTYPE).tobytes())
+        self.__events = read_events(self.__filename, offset=len(HEADER))
+
+    def tearDown(self):
+        # The map must be closed before the file can be removed everywhere
+        del self.__events
+        os.remove(self.__filename)
+
+    def check_spike_times(self, expected, **kwargs):
+        # Every split into chunks must give the same spikes
+        for chunk_size in range(1, len(EVENTS) + 1):
+            spike_times = events_to_spike_times(
+                self.__events, WIDTH, HEIGHT, chunk_size=chunk_size,
+                **kwargs)
+            self.assertEqual(len(spike_times), WIDTH * HEIGHT)
+            for pixel, times in enumerate(spike_times):
+                numpy.testing.assert_array_equal(
+                    times, expected.get(pixel, []),
+                    "pixel {} in chunks of {}".format(pixel, chunk_size))
+
+    def test_read_events(self):
+        self.assertIsInstance(self.__events, numpy.memmap)
+        self.assertEqual(len(self.__events), len(EVENTS))
+        self.assertEqual(self.__events[-1]["timestamp"], 5000)
+
+    def test_one_spike_per_pixel_per_timestep(self):
+        self.check_spike_times({0: [0, 3], 1: [0, 2], 5: [1, 4]})
+
+    def test_timestep(self):
+        self.check_spike_times(
+            {0: [0, 2], 1: [0, 2], 5: [0, 4]}, timestep=2.0)
+
+    def test_polarity(self):
+        self.check_spike_times({0: [0, 3], 1: [2], 5: [1]}, polarity=1)
+        self.check_spike_times({0: [0], 1: [0], 5: [4]}, polarity=0)
+
+    def test_duration(self):
+        self.check_spike_times({0: [0], 1: [0, 2], 5: [1]}, duration=3.0)
+
+    def test_start(self):
+        self.check_spike_times({0: [2], 1: [1], 5: [0, 3]}, t_start=2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import spynnaker8 as sim
+from pacman.model.graphs.common import Slice
+from python_models8.connectors.my_connector import MyConnector
+from python_models8.reference.my_connector_expander import (
+    host_compiler, matches_host_expansion)
+
+N_NEURONS = 20
+
+# The number of neurons in each slice of the splits to check
+SLICE_SIZES = [1, 3, 7, N_NEURONS]
+
+
+def slices(n_neurons, slice_size):
+    return [Slice(lo_atom, min(lo_atom + slice_size, n_neurons) - 1)
+            for lo_atom in range(0, n_neurons, slice_size)]
+
+
+@unittest.skipIf(host_compiler() is None, "No C compiler on the host")
+class TestMyConnectorBand(unittest.TestCase):
+    """ Checks my_connector_band.h, built for the host, against the\
+        connections that MyConnector makes on the host
+    """
+
+    def setUp(self):
+        sim.setup(timestep=1.0)
+
+    def tearDown(self):
+        sim.end()
+
+    def check_projection(self, projection, n_pre, n_post):
+        # pylint: disable=protected-access
+        synapse_info = projection._synapse_information
+        connector = synapse_info.connector
+        for pre_size in SLICE_SIZES:
+            for post_size in SLICE_SIZES:
+                for pre_slice in slices(n_pre, pre_size):
+                    for post_slice in slices(n_post, post_size):
+                        if not connector.could_connect(
+                                synapse_info, pre_slice, post_slice):
+                            continue
+                        self.assertTrue(matches_host_expansion(
+                            connector, synapse_info, pre_slice, post_slice),
+                            "{} {} to {}".format(
+                                connector, pre_slice, post_slice))
+
+    def test_matches_host_expansion(self):
+        pop = sim.Population(N_NEURONS, sim.IF_curr_exp(), label="pop")
+        other = sim.Population(
+            N_NEURONS // 2, sim.IF_curr_exp(), label="other")
+        for n_neighbours in (0, 1, 3):
+            for allow_self_connections in (True, False):
+                self.check_projection(sim.Projection(
+                    pop, pop,
+                    MyConnector(n_neighbours, allow_self_connections),
+                    sim.StaticSynapse(weight=1.0, delay=1.0)),
+                    N_NEURONS, N_NEURONS)
+            self.check_projection(sim.Projection(
+                pop, other, MyConnector(n_neighbours),
+                sim.StaticSynapse(weight=1.0, delay=1.0)),
+                N_NEURONS, N_NEURONS // 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
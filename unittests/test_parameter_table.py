@@ -0,0 +1,61 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from data_specification.enums import DataType
+from python_models8.utilities.parameter_table import ParameterTable
+
+
+class TestParameterTable(unittest.TestCase):
+
+    def setUp(self):
+        self.__table = ParameterTable([
+            ("a", DataType.S1615), ("b", DataType.UINT8)])
+
+    def __get_data(self, a, n_atoms):
+        data, indices = self.__table.get_data(
+            {"a": a, "b": 1}, 0, n_atoms)
+        self.assertEqual(
+            self.__table.get_n_bytes(data.tobytes(), 0, n_atoms),
+            len(data) * 4)
+        return data, indices
+
+    def test_shared_sets(self):
+        data, indices = self.__get_data([1.0, 2.0] * 50, 100)
+        self.assertEqual(data[0], 2)
+        self.assertEqual(len(data), self.__table.get_size_in_whole_words(2))
+        numpy.testing.assert_array_equal(indices, [0, 1] * 50)
+
+    def test_one_set_per_neuron_when_too_many(self):
+        n_atoms = ParameterTable.MAX_SETS + 1
+        data, indices = self.__get_data(numpy.arange(n_atoms), n_atoms)
+        self.assertEqual(data[0], 0)
+        self.assertEqual(
+            len(data), self.__table.get_size_in_whole_words(n_atoms))
+        self.assertFalse(numpy.any(indices))
+
+    def test_one_set_per_neuron_when_no_smaller(self):
+        data, _indices = self.__get_data([3.0, 1.0, 2.0], 3)
+        self.assertEqual(data[0], 0)
+        sets = data[1:].view("uint8")[
+            :3 * self.__table.struct_array.numpy_dtype.itemsize].view(
+                self.__table.struct_array.numpy_dtype)
+        numpy.testing.assert_array_equal(
+            self.__table.struct_array.decode(sets, "a"), [3.0, 1.0, 2.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from python_models8.neuron.builds.qif_curr_delta import QIFCurrDelta
+from python_models8.reference.qif_reference_model import (
+    QIFReferenceModel, SIMPLE_TQ_OFFSET)
+
+
+def midpoint(v, h, i):
+    """ One step of rk2_kernel_midpoint in qif_impl.h
+    """
+    eta = v + 0.5 * h * (i + v * v)
+    return v + h * (i + eta * eta)
+
+
+class TestQIFReferenceModel(unittest.TestCase):
+
+    def test_rk2_step(self):
+        reference = QIFReferenceModel(
+            QIFCurrDelta(c=-0.5, v=[-1.0, 0.5], i_offset=[0.0, 0.25]), 2)
+        v, exc, _inh, spiked = reference.step(exc_input=0.5)
+        numpy.testing.assert_array_equal(v, [-1.0, 0.5])
+        numpy.testing.assert_array_equal(exc, [0.5, 0.5])
+        self.assertFalse(numpy.any(spiked))
+        # eta = -1 + 0.5 * (0.5 + 1) = -0.25 so V = -1 + (0.5 + 0.0625)
+        # eta = 0.5 + 0.5 * (0.75 + 0.25) = 1 so V = 0.5 + (0.75 + 1)
+        numpy.testing.assert_allclose(reference.v, [-0.4375, 2.25])
+
+    def test_substeps(self):
+        reference = QIFReferenceModel(
+            QIFCurrDelta(c=-0.5, v=-1.0, i_offset=0.5, n_substeps=4), 1)
+        reference.step()
+        v = -1.0
+        for _ in range(4):
+            v = midpoint(v, 0.25, 0.5)
+        numpy.testing.assert_allclose(reference.v, [v])
+
+    def test_bias_adds_to_offset(self):
+        biased = QIFReferenceModel(QIFCurrDelta(c=-0.5, v=-1.0), 1)
+        offset = QIFReferenceModel(
+            QIFCurrDelta(c=-0.5, v=-1.0, i_offset=0.3), 1)
+        results = biased.run(3, bias=0.3)
+        numpy.testing.assert_allclose(results["v"], offset.run(3)["v"])
+        numpy.testing.assert_allclose(biased.v, offset.v)
+
+    def test_spike_refractory_and_bump(self):
+        reference = QIFReferenceModel(
+            QIFCurrDelta(c=-0.5, v=9.5, tau_refrac=2.0), 1)
+        # eta = 9.5 + 0.5 * 90.25 = 54.625, so V passes V_peak
+        self.assertTrue(reference.step()[3][0])
+        numpy.testing.assert_array_equal(reference.v, [-0.5])
+        numpy.testing.assert_array_equal(reference.spike_counts, [1])
+
+        # Refractory for two steps, then the bumped update
+        for _ in range(2):
+            self.assertFalse(reference.step()[3][0])
+            numpy.testing.assert_array_equal(reference.v, [-0.5])
+        reference.step()
+        numpy.testing.assert_allclose(
+            reference.v, [midpoint(-0.5, SIMPLE_TQ_OFFSET, 0.0)])
+        reference.step()
+        numpy.testing.assert_allclose(
+            reference.v, [midpoint(midpoint(
+                -0.5, SIMPLE_TQ_OFFSET, 0.0), 1.0, 0.0)])
+
+    def test_burst_counts(self):
+        # With 2000 nA every substep from c = 0 passes V_peak, so each of
+        # the four substeps spikes; without input a neuron never does
+        reference = QIFReferenceModel(QIFCurrDelta(
+            c=0.0, v=0.0, i_offset=[2000.0, 0.0], tau_refrac=0.0,
+            n_substeps=4, burst=True), 2)
+        results = reference.run(2)
+        numpy.testing.assert_array_equal(
+            results["spike_count"], [[4, 0], [4, 0]])
+        numpy.testing.assert_array_equal(
+            results["spikes"], [[True, False], [True, False]])
+
+    def test_no_burst_counts_one(self):
+        reference = QIFReferenceModel(QIFCurrDelta(
+            c=0.0, v=0.0, i_offset=2000.0, tau_refrac=0.0, n_substeps=4), 1)
+        reference.step()
+        numpy.testing.assert_array_equal(reference.spike_counts, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
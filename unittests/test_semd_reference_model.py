@@ -0,0 +1,109 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import unittest
+import numpy
+from python_models8.neuron.builds.my_if_curr_exp_sEMD import MyIFCurrExpSEMD
+from python_models8.reference.semd_reference_model import (
+    IDLE_V_TOLERANCE, INPUT_ONSET, SEMDReferenceModel)
+
+N_NEURONS = 4
+
+
+class TestSEMDReferenceModel(unittest.TestCase):
+
+    def test_idle_neuron_stays_idle_without_input(self):
+        reference = SEMDReferenceModel(
+            MyIFCurrExpSEMD(active_set=True), N_NEURONS)
+        reference.step()
+        self.assertTrue(numpy.all(reference.idle))
+
+        # The machine adds the input of every neuron every timestep, most of
+        # it zero, which must not wake them
+        v = reference.v.copy()
+        for _ in range(10):
+            reference.step(numpy.zeros(N_NEURONS), numpy.zeros(N_NEURONS))
+        self.assertTrue(numpy.all(reference.idle))
+        numpy.testing.assert_array_equal(reference.v, v)
+
+        reference.step(numpy.array([0.0, 5.0, 0.0, 0.0]))
+        numpy.testing.assert_array_equal(
+            reference.idle, [True, False, True, True])
+
+    def test_multiplicator_latches_on_inhibitory_onset(self):
+        reference = SEMDReferenceModel(MyIFCurrExpSEMD(), 1)
+        reference.step(exc_input=2.0)
+        reference.step()
+        numpy.testing.assert_array_equal(reference.multiplicator, [0.0])
+
+        # The onset latches the excitatory input of that update
+        _v, exc, inh, _spiked = reference.step(inh_input=1.0)
+        self.assertGreaterEqual(inh[0], INPUT_ONSET)
+        numpy.testing.assert_array_equal(reference.multiplicator, exc)
+        latched = reference.multiplicator.copy()
+
+        # More excitatory input while the inhibitory input lasts does not
+        # change it
+        reference.step(exc_input=5.0)
+        numpy.testing.assert_array_equal(reference.multiplicator, latched)
+
+        # It is released once the inhibitory input has fallen below onset
+        for _ in range(1000):
+            _v, _exc, inh, _spiked = reference.step()
+            if inh[0] < INPUT_ONSET:
+                break
+            numpy.testing.assert_array_equal(
+                reference.multiplicator, latched)
+        self.assertLess(inh[0], INPUT_ONSET)
+        numpy.testing.assert_array_equal(reference.multiplicator, [0.0])
+
+    def test_no_latch_below_onset(self):
+        reference = SEMDReferenceModel(MyIFCurrExpSEMD(), 1)
+        reference.step(exc_input=2.0, inh_input=INPUT_ONSET / 10)
+        numpy.testing.assert_array_equal(reference.multiplicator, [0.0])
+
+    def test_latch_only_at_onset(self):
+        # With no excitatory input at the onset nothing is latched, and
+        # input arriving later in the same inhibition is not latched either
+        reference = SEMDReferenceModel(MyIFCurrExpSEMD(), 1)
+        reference.step(inh_input=1.0)
+        reference.step(exc_input=2.0)
+        numpy.testing.assert_array_equal(reference.multiplicator, [0.0])
+
+    def test_active_set_follows_every_update(self):
+        exc = numpy.zeros((200, N_NEURONS))
+        exc[5, 0] = 5.0
+        exc[30, 1] = 2.0
+        exc[150, 0] = 1.0
+        inh = numpy.zeros((200, N_NEURONS))
+        inh[10, 2] = 1.0
+        inh[160, 0] = 1.0
+        eager = SEMDReferenceModel(MyIFCurrExpSEMD(), N_NEURONS)
+        active = SEMDReferenceModel(
+            MyIFCurrExpSEMD(active_set=True), N_NEURONS)
+        n_skipped = 0
+        for step in range(len(exc)):
+            eager_v = eager.step(exc[step], inh[step])[0]
+            n_skipped += numpy.count_nonzero(active.idle)
+            active_v = active.step(exc[step], inh[step])[0]
+            numpy.testing.assert_allclose(
+                active_v, eager_v, atol=IDLE_V_TOLERANCE)
+        # In double precision the synaptic input of a neuron that has had
+        # some never decays to zero, so it is the others that are skipped
+        self.assertGreater(n_skipped, len(exc))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# Copyright (c) 2021 The University of Manchester
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+import os
+import unittest
+from data_specification.enums import DataType
+from python_models8.utilities import struct_schema
+from python_models8.utilities.struct_schema import (
+    SchemaField, StructSchema, STATE_VARIABLE)
+
+_C_SRC = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "c_models", "src")
+
+
+class TestStructSchema(unittest.TestCase):
+
+    def test_generated_headers_are_up_to_date(self):
+        # The C build includes these, so a schema changed without
+        # regenerating its header would break the layout on the machine
+        headers = list(struct_schema.find_generated_headers(_C_SRC))
+        self.assertTrue(headers)
+        self.assertIsNone(struct_schema.main(["--check-all", _C_SRC]))
+
+    def test_array_fields(self):
+        schema = StructSchema("test_t", [
+            SchemaField("a", DataType.S1615, "nA", STATE_VARIABLE,
+                        c_name="inputs[0]"),
+            SchemaField("b", DataType.S1615, "nA", STATE_VARIABLE,
+                        c_name="inputs[1]"),
+            SchemaField("c", DataType.UINT32)])
+        struct = schema.get_c_struct()
+        self.assertIn("    //! a [nA], b [nA]\n    REAL inputs[2];\n", struct)
+        self.assertIn("    uint32_t c;\n", struct)
+
+    def test_array_fields_must_be_in_order(self):
+        schema = StructSchema("test_t", [
+            SchemaField("a", DataType.S1615, c_name="inputs[0]"),
+            SchemaField("b", DataType.S1615, c_name="inputs[2]")])
+        with self.assertRaises(ValueError):
+            schema.get_c_struct()
+
+
+if __name__ == "__main__":
+    unittest.main()